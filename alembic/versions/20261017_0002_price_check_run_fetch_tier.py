@@ -0,0 +1,17 @@
+"""Record which fetch tier served each price check run."""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261017_0002"
+down_revision = "20260212_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("price_check_runs", sa.Column("fetch_tier", sa.String(length=16), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("price_check_runs", "fetch_tier")
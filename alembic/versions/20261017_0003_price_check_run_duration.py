@@ -0,0 +1,17 @@
+"""Record wall-clock fetch duration for each price check run."""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261017_0003"
+down_revision = "20261017_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("price_check_runs", sa.Column("duration_ms", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("price_check_runs", "duration_ms")
@@ -0,0 +1,33 @@
+"""Add page cache table for conditional product page fetches."""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261017_0004"
+down_revision = "20261017_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "page_cache_entries",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("url_hash", sa.String(length=64), nullable=False),
+        sa.Column("canonical_url", sa.Text(), nullable=False),
+        sa.Column("etag", sa.String(length=512), nullable=True),
+        sa.Column("last_modified", sa.String(length=64), nullable=True),
+        sa.Column("price_amount", sa.Float(), nullable=False),
+        sa.Column("price_currency", sa.String(length=4), nullable=False),
+        sa.Column("extractor", sa.String(length=32), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_page_cache_entries_id", "page_cache_entries", ["id"], unique=False)
+    op.create_index("ix_page_cache_entries_url_hash", "page_cache_entries", ["url_hash"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_page_cache_entries_url_hash", table_name="page_cache_entries")
+    op.drop_index("ix_page_cache_entries_id", table_name="page_cache_entries")
+    op.drop_table("page_cache_entries")
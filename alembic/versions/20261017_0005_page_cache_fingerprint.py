@@ -0,0 +1,17 @@
+"""Store an anchor-region content fingerprint alongside cached prices."""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261017_0005"
+down_revision = "20261017_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("page_cache_entries", sa.Column("content_fingerprint", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("page_cache_entries", "content_fingerprint")
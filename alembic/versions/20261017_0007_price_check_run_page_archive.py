@@ -0,0 +1,19 @@
+"""Link each price check run to its archived page HTML."""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261017_0007"
+down_revision = "20261017_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("price_check_runs", sa.Column("page_sha256", sa.String(length=64), nullable=True))
+    op.create_index("ix_price_check_runs_page_sha256", "price_check_runs", ["page_sha256"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_price_check_runs_page_sha256", table_name="price_check_runs")
+    op.drop_column("price_check_runs", "page_sha256")
@@ -0,0 +1,21 @@
+"""Add worker leases to watchlist items so several workers can share the checks."""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261017_0008"
+down_revision = "20261017_0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("watchlist_items", sa.Column("lease_owner", sa.String(length=64), nullable=True))
+    op.add_column("watchlist_items", sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index("ix_watchlist_items_lease_expires_at", "watchlist_items", ["lease_expires_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_watchlist_items_lease_expires_at", table_name="watchlist_items")
+    op.drop_column("watchlist_items", "lease_expires_at")
+    op.drop_column("watchlist_items", "lease_owner")
@@ -0,0 +1,26 @@
+"""Schedule watchlist item checks by due time with optional per-item intervals."""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261017_0009"
+down_revision = "20261017_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("watchlist_items", sa.Column("check_interval_seconds", sa.Integer(), nullable=True))
+    op.add_column("watchlist_items", sa.Column("next_check_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        "ix_watchlist_items_active_next_check_at",
+        "watchlist_items",
+        ["is_active", "next_check_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_watchlist_items_active_next_check_at", table_name="watchlist_items")
+    op.drop_column("watchlist_items", "next_check_at")
+    op.drop_column("watchlist_items", "check_interval_seconds")
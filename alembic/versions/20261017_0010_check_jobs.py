@@ -0,0 +1,40 @@
+"""Add check job queue for API-triggered checks."""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261017_0010"
+down_revision = "20261017_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "check_jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("watchlist_item_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("price_check_run_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["watchlist_item_id"], ["watchlist_items.id"]),
+        sa.ForeignKeyConstraint(["price_check_run_id"], ["price_check_runs.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_check_jobs_id", "check_jobs", ["id"], unique=False)
+    op.create_index("ix_check_jobs_watchlist_item_id", "check_jobs", ["watchlist_item_id"], unique=False)
+    op.create_index(
+        "ix_check_jobs_status_watchlist_item_id",
+        "check_jobs",
+        ["status", "watchlist_item_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_check_jobs_status_watchlist_item_id", table_name="check_jobs")
+    op.drop_index("ix_check_jobs_watchlist_item_id", table_name="check_jobs")
+    op.drop_index("ix_check_jobs_id", table_name="check_jobs")
+    op.drop_table("check_jobs")
@@ -0,0 +1,95 @@
+"""Compare the windowed price extractor with the legacy full-page implementation.
+
+Run from the repository root::
+
+    python benchmarks/bench_extract_closest_price.py --sizes-mb 1 4 16
+
+Each synthetic page contains filler markup with scattered prices and a purchase
+anchor at a chosen position. Both implementations must agree on every page.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from plugin_boutique_price_checker.models import PriceResult  # noqa: E402
+from plugin_boutique_price_checker.selenium_scraper import PluginBoutiqueSeleniumScraper  # noqa: E402
+
+
+def legacy_extract_closest_price(html: str) -> PriceResult:
+    """Original implementation: lower-case copy plus a list of every match."""
+    lower_html = html.lower()
+    anchor = lower_html.find("add to cart")
+    if anchor == -1:
+        anchor = lower_html.find("buy now")
+
+    matches = list(re.finditer(r"([£€$])\s?(\d[\d,]*(?:\.\d{2})?)", html))
+    if not matches:
+        raise RuntimeError("No currency-like prices found in page source")
+
+    best = min(matches, key=lambda m: abs(m.start() - anchor) if anchor != -1 else m.start())
+    return PriceResult(amount=float(best.group(2).replace(",", "")), currency=best.group(1))
+
+
+def build_page(size_bytes: int, anchor_fraction: float) -> str:
+    """Build a product-like page of roughly ``size_bytes`` with an anchor at ``anchor_fraction``."""
+    block = (
+        '<div class="card"><a href="/product/related">Related plugin</a>'
+        '<span class="price">$19.99</span><p>Lorem ipsum dolor sit amet, consectetur.</p></div>\n'
+    )
+    filler = block * max(1, size_bytes // len(block))
+    split = int(len(filler) * anchor_fraction)
+    product = '<span class="product-price">£129.00</span><button>Add to Cart</button>'
+    return filler[:split] + product + filler[split:]
+
+
+def measure(func: Callable[[str], PriceResult], html: str, repeats: int) -> tuple[float, int, PriceResult]:
+    """Return median seconds, peak traced bytes and the extracted price."""
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = func(html)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    func(html)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak, result
+
+
+def main() -> None:
+    """Run the comparison and print one row per page size and anchor position."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1.0, 4.0, 16.0])
+    parser.add_argument("--anchor-fractions", type=float, nargs="+", default=[0.05, 0.5, 0.95])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'size':>8} {'anchor':>7} {'legacy ms':>10} {'window ms':>10} {'speedup':>8} {'legacy peak':>12} {'window peak':>12}")
+    for size_mb in args.sizes_mb:
+        for fraction in args.anchor_fractions:
+            html = build_page(int(size_mb * 1024 * 1024), fraction)
+            legacy_s, legacy_peak, legacy_result = measure(legacy_extract_closest_price, html, args.repeats)
+            window_s, window_peak, window_result = measure(
+                PluginBoutiqueSeleniumScraper._extract_closest_price, html, args.repeats
+            )
+            if legacy_result != window_result:
+                raise SystemExit(f"Mismatch at {size_mb} MB / {fraction}: {legacy_result} != {window_result}")
+            print(
+                f"{size_mb:>6.1f}MB {fraction:>7.2f} {legacy_s * 1000:>10.2f} {window_s * 1000:>10.2f} "
+                f"{legacy_s / window_s:>7.1f}x {legacy_peak / 1024:>10.0f}KB {window_peak / 1024:>10.0f}KB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Benchmark price extractors for throughput, latency and accuracy on the offline corpus.
+
+Run from the repository root::
+
+    python benchmarks/bench_extraction.py
+    python benchmarks/bench_extraction.py --extractors chain --min-accuracy 1.0
+
+No network or browser is needed. Each extractor runs over every corpus case. The
+script reports MB/s, p50/p99 latency and whether the labelled price was found.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import statistics
+import sys
+import time
+from collections.abc import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from plugin_boutique_price_checker.models import PriceResult  # noqa: E402
+from plugin_boutique_price_checker.price_extractors import extract_structured_price  # noqa: E402
+from plugin_boutique_price_checker.selenium_scraper import PluginBoutiqueSeleniumScraper  # noqa: E402
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent / "corpus" / "v1"
+PAD_MARKER = "<!-- PAD -->"
+PAD_BLOCK = (
+    '<div class="card"><a href="/product/related">Related plugin</a>'
+    '<span class="price">$19.99</span><p>Lorem ipsum dolor sit amet, consectetur adipiscing.</p></div>\n'
+)
+
+# Register new extractors here so they are benchmarked against the same corpus.
+EXTRACTORS: dict[str, Callable[[str], PriceResult | None]] = {
+    "anchor_heuristic": PluginBoutiqueSeleniumScraper._extract_closest_price,
+    "structured": extract_structured_price,
+    "chain": PluginBoutiqueSeleniumScraper._extract_price,
+}
+
+
+@dataclass
+class CorpusCase:
+    """One labelled page from the corpus manifest."""
+
+    case_id: str
+    category: str
+    html: str
+    amount: float
+    currency: str
+
+
+@dataclass
+class CaseResult:
+    """Timing and accuracy for one extractor on one corpus case."""
+
+    extractor: str
+    case_id: str
+    category: str
+    size_bytes: int
+    p50_ms: float
+    p99_ms: float
+    mb_per_s: float
+    correct: bool
+
+
+def load_corpus(corpus_dir: Path) -> list[CorpusCase]:
+    """Load manifest cases, expanding padded large pages in memory."""
+    manifest = json.loads((corpus_dir / "manifest.json").read_text(encoding="utf-8"))
+    cases = []
+    for entry in manifest["cases"]:
+        html = (corpus_dir / entry["file"]).read_text(encoding="utf-8")
+        pad_to = entry.get("pad_to_bytes")
+        if pad_to:
+            missing = max(0, pad_to - len(html.encode("utf-8")))
+            html = html.replace(PAD_MARKER, PAD_BLOCK * (missing // len(PAD_BLOCK) + 1), 1)
+        cases.append(
+            CorpusCase(
+                case_id=entry["id"],
+                category=entry["category"],
+                html=html,
+                amount=float(entry["amount"]),
+                currency=entry["currency"],
+            )
+        )
+    return cases
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of ``samples``."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_case(name: str, extractor: Callable[[str], PriceResult | None], case: CorpusCase, repeats: int) -> CaseResult:
+    """Time one extractor on one case and check its answer against the label."""
+    timings = []
+    result: PriceResult | None = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        try:
+            result = extractor(case.html)
+        except RuntimeError:
+            result = None
+        timings.append(time.perf_counter() - started)
+
+    size_bytes = len(case.html.encode("utf-8"))
+    median_s = statistics.median(timings)
+    correct = result is not None and result == PriceResult(amount=case.amount, currency=case.currency)
+    return CaseResult(
+        extractor=name,
+        case_id=case.case_id,
+        category=case.category,
+        size_bytes=size_bytes,
+        p50_ms=median_s * 1000,
+        p99_ms=percentile(timings, 0.99) * 1000,
+        mb_per_s=(size_bytes / (1024 * 1024)) / median_s if median_s > 0 else float("inf"),
+        correct=correct,
+    )
+
+
+def main() -> None:
+    """Run the benchmark, print a table and optionally enforce an accuracy floor."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--extractors", nargs="+", choices=sorted(EXTRACTORS), default=sorted(EXTRACTORS))
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--json", type=Path, help="Also write raw results to this JSON file")
+    parser.add_argument(
+        "--min-accuracy",
+        type=float,
+        help="Exit non-zero if any selected extractor scores below this fraction (0-1)",
+    )
+    args = parser.parse_args()
+
+    cases = load_corpus(args.corpus)
+    results = [run_case(name, EXTRACTORS[name], case, args.repeats) for name in args.extractors for case in cases]
+
+    print(f"{'extractor':<17} {'case':<32} {'category':<15} {'size':>9} {'MB/s':>9} {'p50 ms':>8} {'p99 ms':>8}  ok")
+    for row in results:
+        print(
+            f"{row.extractor:<17} {row.case_id:<32} {row.category:<15} {row.size_bytes / 1024:>7.0f}KB "
+            f"{row.mb_per_s:>9.1f} {row.p50_ms:>8.3f} {row.p99_ms:>8.3f}  {'yes' if row.correct else 'NO'}"
+        )
+
+    failed = False
+    print()
+    for name in args.extractors:
+        rows = [row for row in results if row.extractor == name]
+        accuracy = sum(row.correct for row in rows) / len(rows)
+        total_mb = sum(row.size_bytes for row in rows) / (1024 * 1024)
+        total_s = sum(row.p50_ms for row in rows) / 1000
+        print(f"{name:<17} accuracy {accuracy:6.1%}  throughput {total_mb / total_s:8.1f} MB/s")
+        if args.min_accuracy is not None and accuracy < args.min_accuracy:
+            failed = True
+
+    if args.json:
+        args.json.write_text(json.dumps([row.__dict__ for row in results], indent=2), encoding="utf-8")
+    if failed:
+        raise SystemExit(f"Accuracy below required {args.min_accuracy:.1%}")
+
+
+if __name__ == "__main__":
+    main()
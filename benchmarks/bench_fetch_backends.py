@@ -0,0 +1,122 @@
+"""Compare page latency and browser memory of the Selenium and CDP fetch backends.
+
+Run from the repository root (needs Chrome/Chromium, and chromedriver for Selenium)::
+
+    python benchmarks/bench_fetch_backends.py
+    python benchmarks/bench_fetch_backends.py --backends cdp --rounds 10 --eager
+
+The corpus pages are served from a local static HTTP server, so the numbers measure
+browser overhead rather than network latency. Memory is the summed RSS of every
+process started by the benchmark (browser, renderers and chromedriver) after each
+page, read from ``/proc`` and therefore Linux-only.
+"""
+
+from __future__ import annotations
+
+import argparse
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+from pathlib import Path
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from plugin_boutique_price_checker.selenium_scraper import BROWSER_BACKENDS, PluginBoutiqueSeleniumScraper  # noqa: E402
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent / "corpus" / "v1"
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *_args: object) -> None:
+        return None
+
+
+def start_static_server(root: Path) -> tuple[ThreadingHTTPServer, str]:
+    """Serve ``root`` on an ephemeral localhost port in a background thread."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(_QuietHandler, directory=str(root)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def descendant_rss_bytes(pid: int) -> int:
+    """Return the summed resident memory of all descendants of ``pid``."""
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            children = (Path(f"/proc/{current}/task/{current}/children")).read_text().split()
+        except OSError:
+            continue
+        for child in map(int, children):
+            pending.append(child)
+            try:
+                for line in Path(f"/proc/{child}/status").read_text().splitlines():
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+            except OSError:
+                continue
+    return total
+
+
+def run_backend(backend: str, urls: list[str], rounds: int, eager: bool) -> dict[str, float]:
+    """Load every URL ``rounds`` times with one warm browser and summarize the results."""
+    timings: list[float] = []
+    rss_samples: list[int] = []
+    with PluginBoutiqueSeleniumScraper(browser_backend=backend, driver_pool_size=1, eager_page_load=eager) as scraper:
+        scraper.get_price(urls[0])  # Warm up: browser start-up is not a per-page cost.
+        for _ in range(rounds):
+            for url in urls:
+                started = time.perf_counter()
+                try:
+                    scraper.get_price(url)
+                except RuntimeError:
+                    pass  # Pages without a price still cost a full load.
+                timings.append(time.perf_counter() - started)
+                rss_samples.append(descendant_rss_bytes(os.getpid()))
+
+    ordered = sorted(timings)
+    return {
+        "pages": len(timings),
+        "p50_ms": statistics.median(timings) * 1000,
+        "p99_ms": ordered[min(len(ordered) - 1, round(0.99 * len(ordered)) - 1)] * 1000,
+        "mean_rss_mb": statistics.mean(rss_samples) / (1024 * 1024),
+        "peak_rss_mb": max(rss_samples) / (1024 * 1024),
+    }
+
+
+def main() -> None:
+    """Run the selected backends against the local corpus server and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--backends", nargs="+", choices=BROWSER_BACKENDS, default=list(BROWSER_BACKENDS))
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--eager", action="store_true", help="Use the eager page-load mode on both backends")
+    parser.add_argument("--json", type=Path, help="Also write raw results to this JSON file")
+    args = parser.parse_args()
+
+    manifest = json.loads((args.corpus / "manifest.json").read_text(encoding="utf-8"))
+    server, base_url = start_static_server(args.corpus)
+    urls = sorted({f"{base_url}/{case['file']}" for case in manifest["cases"]})
+    try:
+        results = {backend: run_backend(backend, urls, args.rounds, args.eager) for backend in args.backends}
+    finally:
+        server.shutdown()
+
+    print(f"{'backend':<10} {'pages':>6} {'p50 ms':>8} {'p99 ms':>8} {'mean RSS MB':>12} {'peak RSS MB':>12}")
+    for backend, row in results.items():
+        print(
+            f"{backend:<10} {row['pages']:>6} {row['p50_ms']:>8.1f} {row['p99_ms']:>8.1f} "
+            f"{row['mean_rss_mb']:>12.1f} {row['peak_rss_mb']:>12.1f}"
+        )
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
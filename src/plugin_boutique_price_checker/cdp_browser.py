@@ -0,0 +1,317 @@
+"""Headless Chromium driven directly over the Chrome DevTools Protocol websocket."""
+
+from collections.abc import Sequence
+import itertools
+import json
+import os
+from pathlib import Path
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from typing import Any
+
+import websocket
+
+from .resilience import TransientFetchError
+
+_CHROME_BINARY_NAMES = ("chromium", "chromium-browser", "google-chrome", "google-chrome-stable")
+
+
+def resolve_chrome_binary(explicit_path: str | None = None) -> str:
+    """Return the Chrome/Chromium executable used by the CDP backend.
+
+    Resolution order is the explicit path, the ``CHROME_BINARY`` environment
+    variable and then the usual Chrome/Chromium names on ``PATH``.
+
+    Args:
+        explicit_path: Optional browser path that overrides discovery.
+
+    Returns:
+        str: Path to a Chrome or Chromium executable.
+    """
+    configured = explicit_path or os.getenv("CHROME_BINARY")
+    if configured:
+        if not Path(configured).is_file():
+            raise RuntimeError(f"Chrome binary does not exist: {configured}")
+        return configured
+    for name in _CHROME_BINARY_NAMES:
+        found = shutil.which(name)
+        if found:
+            return found
+    raise RuntimeError("No Chrome or Chromium binary found; set CHROME_BINARY")
+
+
+class CdpBrowser:
+    """Load pages in one headless Chromium process without chromedriver.
+
+    The browser is started lazily with ``--remote-debugging-port=0`` and every page
+    load runs in a fresh target on the browser websocket. Calls are serialized, so
+    one instance can be shared by threads but loads one page at a time.
+
+    Args:
+        None.
+
+    Returns:
+        CdpBrowser: Browser handle that returns rendered page HTML.
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        chrome_binary: str | None = None,
+        blocked_url_patterns: Sequence[str] | None = None,
+        startup_timeout_seconds: float = 20,
+    ) -> None:
+        """Initialize browser launch options.
+
+        Args:
+            headless: Whether to run Chromium in headless mode.
+            chrome_binary: Optional explicit Chrome/Chromium executable path.
+            blocked_url_patterns: URL patterns blocked with ``Network.setBlockedURLs``.
+            startup_timeout_seconds: Maximum time to wait for the DevTools endpoint.
+
+        Returns:
+            None: This constructor initializes browser state.
+        """
+        self.headless = headless
+        self.chrome_binary = chrome_binary
+        self.blocked_url_patterns = list(blocked_url_patterns or [])
+        self.startup_timeout_seconds = startup_timeout_seconds
+        self._process: subprocess.Popen[bytes] | None = None
+        self._profile_dir: str | None = None
+        self._socket: websocket.WebSocket | None = None
+        self._ids = itertools.count(1)
+        self._events: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "CdpBrowser":
+        """Return the browser for use in a ``with`` block.
+
+        Args:
+            None.
+
+        Returns:
+            CdpBrowser: This browser instance.
+        """
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Close the browser when leaving a ``with`` block.
+
+        Args:
+            _exc_info: Exception details supplied by the context manager protocol.
+
+        Returns:
+            None: Stops the browser process.
+        """
+        self.close()
+
+    def fetch_html(self, url: str, timeout_seconds: float, ready_script: str | None = None) -> str:
+        """Navigate a fresh tab to ``url`` and return the rendered document HTML.
+
+        Args:
+            url: Page URL to load.
+            timeout_seconds: Maximum time for navigation and readiness.
+            ready_script: Optional function body returning true once the page is usable.
+                When given, waiting stops at DOMContentLoaded plus this check instead
+                of the full load event.
+
+        Returns:
+            str: ``document.documentElement.outerHTML`` of the loaded page.
+        """
+        deadline = time.monotonic() + timeout_seconds
+        with self._lock:
+            self._ensure_started()
+            target_id = self._call("Target.createTarget", {"url": "about:blank"}, deadline=deadline)["targetId"]
+            try:
+                session_id = self._call(
+                    "Target.attachToTarget",
+                    {"targetId": target_id, "flatten": True},
+                    deadline=deadline,
+                )["sessionId"]
+                self._call("Page.enable", session_id=session_id, deadline=deadline)
+                if self.blocked_url_patterns:
+                    self._call("Network.enable", session_id=session_id, deadline=deadline)
+                    self._call(
+                        "Network.setBlockedURLs",
+                        {"urls": self.blocked_url_patterns},
+                        session_id=session_id,
+                        deadline=deadline,
+                    )
+
+                navigation = self._call("Page.navigate", {"url": url}, session_id=session_id, deadline=deadline)
+                if navigation.get("errorText"):
+                    raise TransientFetchError(f"Navigation failed: {navigation['errorText']}")
+
+                if ready_script is None:
+                    self._wait_for_event("Page.loadEventFired", session_id, deadline)
+                else:
+                    self._wait_for_event("Page.domContentEventFired", session_id, deadline)
+                    self._wait_until_ready(ready_script, session_id, deadline)
+
+                result = self._call(
+                    "Runtime.evaluate",
+                    {"expression": "document.documentElement.outerHTML", "returnByValue": True},
+                    session_id=session_id,
+                    deadline=deadline,
+                )
+                return str(result["result"].get("value", ""))
+            finally:
+                self._events.clear()
+                try:
+                    self._call("Target.closeTarget", {"targetId": target_id}, deadline=time.monotonic() + 5)
+                except (RuntimeError, OSError, websocket.WebSocketException):
+                    pass
+
+    def close(self) -> None:
+        """Close the websocket, stop Chromium and remove its temporary profile.
+
+        Args:
+            None.
+
+        Returns:
+            None: Releases browser resources.
+        """
+        with self._lock:
+            self._stop_process()
+            if self._profile_dir is not None:
+                shutil.rmtree(self._profile_dir, ignore_errors=True)
+                self._profile_dir = None
+
+    @property
+    def pid(self) -> int | None:
+        """Return the Chromium process id, or ``None`` before the first page load."""
+        return self._process.pid if self._process is not None else None
+
+    def _stop_process(self) -> None:
+        """Close the websocket and terminate Chromium, waiting for it to exit; caller holds the lock."""
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except (OSError, websocket.WebSocketException):  # pragma: no cover - best-effort cleanup
+                pass
+            self._socket = None
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:  # pragma: no cover - stubborn browser
+                self._process.kill()
+                self._process.wait()
+            self._process = None
+
+    def _ensure_started(self) -> None:
+        """Launch Chromium and connect to its browser websocket if not running."""
+        if self._socket is not None and self._process is not None and self._process.poll() is None:
+            return
+        # A crashed or disconnected browser may still hold the profile directory.
+        self._stop_process()
+
+        self._profile_dir = self._profile_dir or tempfile.mkdtemp(prefix="pb-cdp-")
+        # Chromium writes the chosen port and browser websocket path once DevTools is listening.
+        port_file = Path(self._profile_dir) / "DevToolsActivePort"
+        port_file.unlink(missing_ok=True)
+        args = [
+            resolve_chrome_binary(self.chrome_binary),
+            "--remote-debugging-port=0",
+            f"--user-data-dir={self._profile_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+            "--disable-extensions",
+            "--disable-background-networking",
+            "--mute-audio",
+            "about:blank",
+        ]
+        if self.headless:
+            args.insert(1, "--headless=new")
+        self._process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        deadline = time.monotonic() + self.startup_timeout_seconds
+        while True:
+            lines = port_file.read_text().splitlines() if port_file.exists() else []
+            if len(lines) >= 2:
+                break
+            if self._process.poll() is not None:
+                raise TransientFetchError("Chromium exited before DevTools became available")
+            if time.monotonic() > deadline:
+                raise TransientFetchError("Timed out waiting for Chromium DevTools endpoint")
+            time.sleep(0.05)
+
+        self._socket = websocket.create_connection(
+            f"ws://127.0.0.1:{lines[0].strip()}{lines[1].strip()}",
+            timeout=self.startup_timeout_seconds,
+            suppress_origin=True,
+        )
+
+    def _wait_until_ready(self, ready_script: str, session_id: str, deadline: float) -> None:
+        """Poll ``ready_script`` in the page until it returns true or the load event fires."""
+        expression = f"(() => {{{ready_script}}})()"
+        while True:
+            result = self._call(
+                "Runtime.evaluate",
+                {"expression": expression, "returnByValue": True},
+                session_id=session_id,
+                deadline=deadline,
+            )
+            if result["result"].get("value") or self._pop_event("Page.loadEventFired", session_id):
+                return
+            if time.monotonic() > deadline:
+                raise TransientFetchError("Timed out waiting for page to load")
+            time.sleep(0.05)
+
+    def _call(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+        session_id: str | None = None,
+        deadline: float | None = None,
+    ) -> dict[str, Any]:
+        """Send one CDP command and return its result, buffering events seen meanwhile."""
+        message: dict[str, Any] = {"id": next(self._ids), "method": method, "params": params or {}}
+        if session_id is not None:
+            message["sessionId"] = session_id
+        assert self._socket is not None
+        self._socket.send(json.dumps(message))
+        while True:
+            reply = self._receive(deadline)
+            if reply.get("id") != message["id"]:
+                if "method" in reply:
+                    self._events.append(reply)
+                continue
+            if "error" in reply:
+                raise RuntimeError(f"CDP {method} failed: {reply['error'].get('message', reply['error'])}")
+            return reply.get("result", {})
+
+    def _wait_for_event(self, method: str, session_id: str, deadline: float) -> dict[str, Any]:
+        """Return the next buffered or incoming event named ``method`` for a session."""
+        while True:
+            event = self._pop_event(method, session_id)
+            if event is not None:
+                return event
+            reply = self._receive(deadline)
+            if "method" in reply:
+                self._events.append(reply)
+
+    def _pop_event(self, method: str, session_id: str) -> dict[str, Any] | None:
+        """Remove and return a buffered event, if one has arrived."""
+        for index, event in enumerate(self._events):
+            if event.get("method") == method and event.get("sessionId") == session_id:
+                return self._events.pop(index)
+        return None
+
+    def _receive(self, deadline: float | None) -> dict[str, Any]:
+        """Read one websocket message, failing once ``deadline`` passes."""
+        assert self._socket is not None
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TransientFetchError("Timed out waiting for page to load")
+            self._socket.settimeout(remaining)
+        try:
+            return json.loads(self._socket.recv())
+        except websocket.WebSocketTimeoutException as exc:
+            raise TransientFetchError("Timed out waiting for page to load") from exc
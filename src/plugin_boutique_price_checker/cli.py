@@ -118,19 +118,25 @@ def main() -> None:
     if not email_address or not app_password or not smtp_address:
         raise RuntimeError("Missing EMAIL_ADDRESS, EMAIL_PASSWORD, or SMTP_ADDRESS in environment")
 
-    scraper = PluginBoutiqueSeleniumScraper(headless=not args.no_headless)
     notifier = EmailNotifier(smtp_address=smtp_address, email_address=email_address, app_password=app_password)
-    service = PriceAlertService(scraper=scraper, notifier=notifier)
 
     default_recipient = args.to or email_address
     if args.watchlist_file:
         watchlist = load_watchlist(args.watchlist_file)
-        for item in watchlist:
-            recipient = item.get("to") or default_recipient
-            service.check_and_notify(
-                url=item["url"],
-                threshold=item["threshold"],
-                recipient_email=recipient,
-            )
+        # One warm browser serves the whole watchlist instead of a cold start per item.
+        scraper = PluginBoutiqueSeleniumScraper(headless=not args.no_headless, driver_pool_size=1)
+        service = PriceAlertService(scraper=scraper, notifier=notifier)
+        try:
+            for item in watchlist:
+                recipient = item.get("to") or default_recipient
+                service.check_and_notify(
+                    url=item["url"],
+                    threshold=item["threshold"],
+                    recipient_email=recipient,
+                )
+        finally:
+            scraper.close()
     else:
+        scraper = PluginBoutiqueSeleniumScraper(headless=not args.no_headless)
+        service = PriceAlertService(scraper=scraper, notifier=notifier)
         service.check_and_notify(url=args.url, threshold=args.threshold, recipient_email=default_recipient)
@@ -0,0 +1,309 @@
+"""Reusable pool of warm Chrome WebDriver sessions for repeated price checks."""
+
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+@dataclass
+class PooledDriver:
+    """Track one pooled WebDriver together with its usage counters.
+
+    Args:
+        driver: Live Selenium WebDriver instance.
+        pages_served: Number of page loads completed with this driver.
+        created_at: Monotonic timestamp of when the driver was started.
+
+    Returns:
+        PooledDriver: Dataclass instance describing a pooled driver.
+    """
+
+    driver: WebDriver
+    pages_served: int = 0
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class ChromeDriverPool:
+    """Lease warm WebDriver sessions and recycle them after use.
+
+    Drivers are started lazily up to ``size``. A leased driver is health-checked
+    before it is handed out, and it is replaced after it raises a WebDriver error
+    other than a timeout.
+
+    After each page the recycling policy is checked. A driver is retired once it
+    reaches ``max_pages_per_driver`` pages, ``max_driver_age_seconds`` of age, or
+    ``rss_headroom`` of ``max_rss_bytes`` across its Chrome process tree. Retired
+    drivers are quit and replaced on a background thread, so the next lease gets a
+    warm browser instead of waiting for a cold start.
+
+    Args:
+        None.
+
+    Returns:
+        ChromeDriverPool: Pool instance that hands out reusable drivers.
+    """
+
+    def __init__(
+        self,
+        driver_factory: Callable[[], WebDriver],
+        size: int = 1,
+        max_pages_per_driver: int = 50,
+        max_driver_age_seconds: float | None = None,
+        max_rss_bytes: int | None = None,
+        rss_headroom: float = 0.9,
+        rss_probe: Callable[[WebDriver], int | None] | None = None,
+    ) -> None:
+        """Initialize pool limits and the factory used to start drivers.
+
+        Args:
+            driver_factory: Callable that starts a new configured WebDriver.
+            size: Maximum number of concurrently live drivers.
+            max_pages_per_driver: Page loads after which a driver is replaced.
+            max_driver_age_seconds: Optional age after which a driver is replaced.
+            max_rss_bytes: Optional memory limit for one driver's process tree.
+            rss_headroom: Fraction of ``max_rss_bytes`` at which a driver is retired,
+                leaving room for the next page before the hard limit.
+            rss_probe: Returns a driver's process-tree RSS in bytes, or ``None`` when
+                unknown; defaults to reading ``/proc`` from the chromedriver process.
+
+        Returns:
+            None: This constructor initializes pool state.
+        """
+        if size < 1:
+            raise ValueError("Driver pool size must be at least 1")
+        if max_pages_per_driver < 1:
+            raise ValueError("max_pages_per_driver must be at least 1")
+
+        self._driver_factory = driver_factory
+        self.size = size
+        self.max_pages_per_driver = max_pages_per_driver
+        self.max_driver_age_seconds = max_driver_age_seconds
+        self.max_rss_bytes = max_rss_bytes
+        self.rss_headroom = rss_headroom
+        self._rss_probe = rss_probe or driver_rss_bytes
+        self.recycle_stats: Counter[str] = Counter()
+        self._idle: list[PooledDriver] = []
+        self._leased = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._replacements: set[threading.Thread] = set()
+
+    def __enter__(self) -> "ChromeDriverPool":
+        """Return the pool for use in a ``with`` block.
+
+        Args:
+            None.
+
+        Returns:
+            ChromeDriverPool: This pool instance.
+        """
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Close the pool when leaving a ``with`` block.
+
+        Args:
+            _exc_info: Exception details supplied by the context manager protocol.
+
+        Returns:
+            None: Quits all idle drivers.
+        """
+        self.close()
+
+    @contextmanager
+    def lease(self, pages: int = 1) -> Iterator[WebDriver]:
+        """Lease a healthy driver for the duration of a ``with`` block.
+
+        Args:
+            pages: Page loads the lease will perform, counted towards recycling.
+
+        Returns:
+            Iterator[WebDriver]: Context manager yielding a live driver.
+        """
+        pooled = self._acquire()
+        reusable = True
+        try:
+            yield pooled.driver
+        except WebDriverException as exc:
+            if not isinstance(exc, TimeoutException):
+                reusable = False
+            raise
+        finally:
+            pooled.pages_served += pages
+            self._release(pooled, reusable)
+
+    def close(self) -> None:
+        """Quit idle drivers and make leased drivers quit when returned.
+
+        Args:
+            None.
+
+        Returns:
+            None: Shuts the pool down.
+        """
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            replacements = list(self._replacements)
+            self._condition.notify_all()
+
+        for pooled in idle:
+            _quit_quietly(pooled.driver)
+        for thread in replacements:
+            thread.join()
+
+    def _acquire(self) -> PooledDriver:
+        """Return an idle healthy driver, or start one when below capacity."""
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Driver pool is closed")
+                    if self._idle:
+                        pooled: PooledDriver | None = self._idle.pop()
+                        break
+                    if self._leased < self.size:
+                        pooled = None
+                        break
+                    self._condition.wait()
+                self._leased += 1
+
+            if pooled is not None:
+                if _is_healthy(pooled.driver):
+                    return pooled
+                _quit_quietly(pooled.driver)
+
+            try:
+                return PooledDriver(driver=self._driver_factory())
+            except Exception:
+                with self._condition:
+                    self._leased -= 1
+                    self._condition.notify()
+                raise
+
+    def _release(self, pooled: PooledDriver, reusable: bool) -> None:
+        """Return a driver to the idle set, or retire it and start a replacement."""
+        reason = self._recycle_reason(pooled) if reusable else "crash"
+        with self._condition:
+            if reason is not None:
+                self.recycle_stats[reason] += 1
+            if reason is None and not self._closed:
+                self._leased -= 1
+                self._idle.append(pooled)
+                self._condition.notify()
+                return
+            if reason not in (None, "crash") and not self._closed:
+                # The slot stays leased until the replacement is warm, so the pool never
+                # runs more than ``size`` browsers at once.
+                thread = threading.Thread(target=self._replace, args=(pooled,), daemon=True)
+                self._replacements.add(thread)
+                thread.start()
+                return
+            self._leased -= 1
+            self._condition.notify()
+
+        _quit_quietly(pooled.driver)
+
+    def _recycle_reason(self, pooled: PooledDriver) -> str | None:
+        """Return why a healthy driver should be retired, or ``None`` to keep it."""
+        if pooled.pages_served >= self.max_pages_per_driver:
+            return "pages"
+        if self.max_driver_age_seconds is not None:
+            if time.monotonic() - pooled.created_at >= self.max_driver_age_seconds:
+                return "age"
+        if self.max_rss_bytes is not None:
+            rss = self._rss_probe(pooled.driver)
+            if rss is not None and rss >= self.max_rss_bytes * self.rss_headroom:
+                return "rss"
+        return None
+
+    def _replace(self, retired: PooledDriver) -> None:
+        """Quit a retired driver and start its replacement off the request path."""
+        _quit_quietly(retired.driver)
+        replacement: PooledDriver | None = None
+        try:
+            with self._condition:
+                closed = self._closed
+            if not closed:
+                replacement = PooledDriver(driver=self._driver_factory())
+        except Exception:
+            # The next lease starts a driver itself and surfaces the error to its caller.
+            replacement = None
+        finally:
+            with self._condition:
+                self._leased -= 1
+                keep = replacement is not None and not self._closed
+                if keep:
+                    self._idle.append(replacement)
+                self._replacements.discard(threading.current_thread())
+                self._condition.notify()
+            if replacement is not None and not keep:
+                _quit_quietly(replacement.driver)
+
+
+def driver_rss_bytes(driver: WebDriver) -> int | None:
+    """Return the resident memory of a driver's chromedriver and Chrome process tree.
+
+    Args:
+        driver: WebDriver started through a local chromedriver service.
+
+    Returns:
+        int | None: Summed RSS in bytes, or ``None`` when ``/proc`` is unavailable.
+    """
+    process = getattr(getattr(driver, "service", None), "process", None)
+    pid = getattr(process, "pid", None)
+    if pid is None or not Path("/proc").is_dir():
+        return None
+    return process_tree_rss_bytes(pid)
+
+
+def process_tree_rss_bytes(pid: int) -> int | None:
+    """Return the summed RSS of a process and all its descendants from ``/proc``.
+
+    Args:
+        pid: Root process id.
+
+    Returns:
+        int | None: RSS in bytes, or ``None`` when the root process is gone.
+    """
+    total = 0
+    pending = [pid]
+    seen_root = False
+    while pending:
+        current = pending.pop()
+        try:
+            status = Path(f"/proc/{current}/status").read_text()
+            children = Path(f"/proc/{current}/task/{current}/children").read_text().split()
+        except OSError:
+            continue
+        seen_root = seen_root or current == pid
+        for line in status.splitlines():
+            if line.startswith("VmRSS:"):
+                total += int(line.split()[1]) * 1024
+                break
+        pending.extend(int(child) for child in children)
+    return total if seen_root else None
+
+
+def _is_healthy(driver: WebDriver) -> bool:
+    """Probe a driver with a cheap WebDriver command."""
+    try:
+        _ = driver.current_url
+    except WebDriverException:
+        return False
+    return True
+
+
+def _quit_quietly(driver: WebDriver) -> None:
+    """Quit a driver while ignoring errors from already-dead sessions."""
+    try:
+        driver.quit()
+    except Exception:  # pragma: no cover - best-effort cleanup
+        pass
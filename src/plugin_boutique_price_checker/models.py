@@ -1,6 +1,6 @@
 """Data models used by the price tracking workflow."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -10,6 +10,11 @@ class PriceResult:
     Args:
         amount: Numeric price amount without currency formatting.
         currency: Currency symbol associated with the amount.
+        fetch_tier: Fetch path that served the page, such as ``http`` or ``selenium``.
+        extractor: Extractor that produced the price, such as ``json_ld`` or ``anchor_heuristic``.
+        unchanged: Whether the page was unchanged since the cached result was stored.
+        extraction_hint: Where the price was found, so the next check can try that spot first.
+        page_sha256: Digest of the archived page HTML the price was extracted from.
 
     Returns:
         PriceResult: Dataclass instance containing parsed price details.
@@ -17,6 +22,11 @@ class PriceResult:
 
     amount: float
     currency: str
+    fetch_tier: str | None = field(default=None, compare=False)
+    extractor: str | None = field(default=None, compare=False)
+    unchanged: bool = field(default=False, compare=False)
+    extraction_hint: str | None = field(default=None, compare=False)
+    page_sha256: str | None = field(default=None, compare=False)
 
     @property
     def formatted(self) -> str:
@@ -0,0 +1,128 @@
+"""Compressed, content-addressed archive of fetched product page HTML."""
+
+from collections.abc import Iterator
+import gzip
+import hashlib
+import os
+from pathlib import Path
+import tempfile
+
+_SUFFIX = ".html.gz"
+
+
+class PageArchive:
+    """Store page HTML gzip-compressed under its SHA-256 digest.
+
+    Identical pages share one file, so re-checking an unchanged product costs a
+    hash and an ``exists`` call. Files are laid out as ``<root>/<ab>/<digest>.html.gz``
+    to keep directories small.
+
+    Args:
+        None.
+
+    Returns:
+        PageArchive: Archive rooted at a filesystem directory.
+    """
+
+    def __init__(self, root: str | Path, compress_level: int = 6) -> None:
+        """Initialize the archive root and gzip level.
+
+        Args:
+            root: Directory that holds archived pages; created on first write.
+            compress_level: gzip compression level from 1 (fastest) to 9 (smallest).
+
+        Returns:
+            None: This constructor initializes archive settings.
+        """
+        self.root = Path(root).expanduser()
+        self.compress_level = compress_level
+
+    def put(self, html: str) -> str:
+        """Archive page HTML and return its digest.
+
+        Args:
+            html: Page HTML to store.
+
+        Returns:
+            str: SHA-256 hex digest identifying the stored page.
+        """
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path_for(digest)
+        if path.exists():
+            return digest
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a partial page.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw:
+                with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=self.compress_level, mtime=0) as f:
+                    f.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return digest
+
+    def get(self, digest: str) -> str:
+        """Return archived page HTML by digest.
+
+        Args:
+            digest: SHA-256 hex digest returned by :meth:`put`.
+
+        Returns:
+            str: Decompressed page HTML.
+        """
+        return read_archived_page(self.path_for(digest))
+
+    def path_for(self, digest: str) -> Path:
+        """Return the file path used for a digest.
+
+        Args:
+            digest: SHA-256 hex digest of the page HTML.
+
+        Returns:
+            Path: Location of the compressed page inside the archive.
+        """
+        return self.root / digest[:2] / f"{digest}{_SUFFIX}"
+
+    def iter_paths(self) -> Iterator[Path]:
+        """Yield the path of every archived page without loading any content.
+
+        Args:
+            None.
+
+        Returns:
+            Iterator[Path]: Compressed page files in the archive.
+        """
+        if not self.root.is_dir():
+            return
+        for shard in sorted(self.root.iterdir()):
+            if shard.is_dir():
+                yield from sorted(shard.glob(f"*{_SUFFIX}"))
+
+
+def digest_from_path(path: Path) -> str:
+    """Return the page digest encoded in an archive file name.
+
+    Args:
+        path: Archive file path produced by :meth:`PageArchive.path_for`.
+
+    Returns:
+        str: SHA-256 hex digest of the stored page.
+    """
+    return path.name.removesuffix(_SUFFIX)
+
+
+def read_archived_page(path: Path) -> str:
+    """Decompress one archived page file.
+
+    Args:
+        path: Archive file path.
+
+    Returns:
+        str: Page HTML.
+    """
+    with gzip.open(path, "rb") as f:
+        return f.read().decode("utf-8")
@@ -0,0 +1,73 @@
+"""Cache contract for conditional HTTP fetches of product pages."""
+
+from dataclasses import dataclass
+import hashlib
+from typing import Protocol
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .models import PriceResult
+
+_TRACKING_PARAM_PREFIXES = ("utm_", "mc_")
+_TRACKING_PARAMS = {"gclid", "fbclid", "ref"}
+
+
+@dataclass
+class CachedPage:
+    """Validators and last extracted price stored for one product URL.
+
+    Args:
+        etag: ``ETag`` response header from the last full fetch.
+        last_modified: ``Last-Modified`` response header from the last full fetch.
+        price: Price extracted from the last full fetch.
+        fingerprint: Hash of the page region around the purchase anchor.
+
+    Returns:
+        CachedPage: Dataclass instance describing a cached product page.
+    """
+
+    etag: str | None
+    last_modified: str | None
+    price: PriceResult
+    fingerprint: str | None = None
+
+
+class PageCache(Protocol):
+    """Storage backend used by the scraper to look up and save ``CachedPage`` entries."""
+
+    def get(self, url: str) -> CachedPage | None:
+        """Return the cached entry for a canonical product URL, if any."""
+
+    def put(self, url: str, page: CachedPage) -> None:
+        """Store or replace the cached entry for a canonical product URL."""
+
+
+def canonical_product_url(url: str) -> str:
+    """Normalize a product URL so equivalent links share one cache entry.
+
+    Args:
+        url: Product page URL as entered by a user.
+
+    Returns:
+        str: URL with lower-cased scheme/host, no fragment, no tracking parameters,
+        sorted query parameters and no trailing slash.
+    """
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith(_TRACKING_PARAM_PREFIXES)
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+def url_cache_key(url: str) -> str:
+    """Return a fixed-length key for a canonical product URL.
+
+    Args:
+        url: Product page URL; it is canonicalized before hashing.
+
+    Returns:
+        str: SHA-256 hex digest of the canonical URL.
+    """
+    return hashlib.sha256(canonical_product_url(url).encode("utf-8")).hexdigest()
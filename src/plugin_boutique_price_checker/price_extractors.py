@@ -0,0 +1,228 @@
+"""Structured-data price extractors tried before the anchor-distance heuristic."""
+
+from collections.abc import Callable, Iterator
+from itertools import islice
+import json
+import re
+from typing import Any
+
+from .models import PriceResult
+
+CURRENCY_SYMBOLS = {"GBP": "£", "EUR": "€", "USD": "$"}
+_SYMBOLS = set(CURRENCY_SYMBOLS.values())
+
+_MAX_JSON_LD_BLOCKS = 20
+_MAX_JSON_LD_CHARS = 512_000
+_MAX_TAG_MATCHES = 50
+
+_JSON_LD_RE = re.compile(
+    r"<script[^>]*type\s*=\s*[\"']application/ld\+json[\"'][^>]*>(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_ITEMPROP_PRICE_RE = re.compile(r"<[a-z][^>]*\bitemprop\s*=\s*[\"']price[\"'][^>]*>([^<]*)", re.IGNORECASE)
+_ITEMPROP_CURRENCY_RE = re.compile(r"<[a-z][^>]*\bitemprop\s*=\s*[\"']priceCurrency[\"'][^>]*>", re.IGNORECASE)
+_META_RE = re.compile(r"<meta\b[^>]*>", re.IGNORECASE)
+_ATTR_RE = re.compile(r"([a-zA-Z_:][-\w:.]*)\s*=\s*(?:\"([^\"]*)\"|'([^']*)')")
+_AMOUNT_RE = re.compile(r"([£€$])?\s?(\d[\d,]*(?:\.\d+)?)")
+
+
+def _parse_attrs(tag: str) -> dict[str, str]:
+    """Return lower-cased attribute names mapped to their values for one tag."""
+    return {m.group(1).lower(): m.group(2) if m.group(2) is not None else m.group(3) for m in _ATTR_RE.finditer(tag)}
+
+
+def _to_symbol(currency: str | None) -> str | None:
+    """Normalize an ISO currency code or symbol to the symbol used by ``PriceResult``."""
+    if not currency:
+        return None
+    currency = currency.strip()
+    if currency in _SYMBOLS:
+        return currency
+    return CURRENCY_SYMBOLS.get(currency.upper())
+
+
+def _to_amount(value: Any) -> tuple[float, str | None] | None:
+    """Parse a numeric amount, returning any currency symbol embedded in the text."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value), None
+    if not isinstance(value, str):
+        return None
+    match = _AMOUNT_RE.search(value)
+    if match is None:
+        return None
+    return float(match.group(2).replace(",", "")), match.group(1)
+
+
+def _iter_json_ld_nodes(data: Any) -> Iterator[dict[str, Any]]:
+    """Yield JSON-LD objects, flattening top-level lists and ``@graph`` arrays."""
+    if isinstance(data, list):
+        for entry in data:
+            yield from _iter_json_ld_nodes(entry)
+    elif isinstance(data, dict):
+        yield data
+        graph = data.get("@graph")
+        if isinstance(graph, list):
+            yield from _iter_json_ld_nodes(graph)
+
+
+def _offer_price(offers: Any) -> PriceResult | None:
+    """Return the first usable price from a schema.org ``offers`` value."""
+    for offer in offers if isinstance(offers, list) else [offers]:
+        if not isinstance(offer, dict):
+            continue
+        parsed = _to_amount(offer.get("price", offer.get("lowPrice")))
+        if parsed is None:
+            continue
+        amount, embedded_symbol = parsed
+        symbol = _to_symbol(offer.get("priceCurrency")) or embedded_symbol
+        if symbol is not None:
+            return PriceResult(amount=amount, currency=symbol)
+    return None
+
+
+def extract_json_ld_price(html: str) -> PriceResult | None:
+    """Read ``offers.price`` from the page's schema.org Product JSON-LD.
+
+    Args:
+        html: Raw page HTML.
+
+    Returns:
+        PriceResult | None: Product offer price, or ``None`` when unavailable.
+    """
+    if "ld+json" not in html:
+        return None
+
+    for index, block in enumerate(_JSON_LD_RE.finditer(html)):
+        if index >= _MAX_JSON_LD_BLOCKS:
+            break
+        payload = block.group(1)
+        if len(payload) > _MAX_JSON_LD_CHARS:
+            continue
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            continue
+        for node in _iter_json_ld_nodes(data):
+            node_type = node.get("@type")
+            types = node_type if isinstance(node_type, list) else [node_type]
+            if "Product" not in types or "offers" not in node:
+                continue
+            price = _offer_price(node["offers"])
+            if price is not None:
+                return price
+    return None
+
+
+def extract_microdata_price(html: str) -> PriceResult | None:
+    """Read the first ``itemprop="price"`` value and its ``priceCurrency``.
+
+    Args:
+        html: Raw page HTML.
+
+    Returns:
+        PriceResult | None: Microdata price, or ``None`` when unavailable.
+    """
+    if "itemprop" not in html:
+        return None
+
+    currency_tag = _ITEMPROP_CURRENCY_RE.search(html)
+    page_symbol = _to_symbol(_parse_attrs(currency_tag.group(0)).get("content")) if currency_tag else None
+
+    for index, match in enumerate(_ITEMPROP_PRICE_RE.finditer(html)):
+        if index >= _MAX_TAG_MATCHES:
+            break
+        attrs = _parse_attrs(match.group(0))
+        text_value = _to_amount(match.group(1))
+        parsed = _to_amount(attrs.get("content")) or text_value
+        if parsed is None:
+            continue
+        amount, embedded_symbol = parsed
+        symbol = page_symbol or embedded_symbol or (text_value[1] if text_value else None)
+        if symbol is not None:
+            return PriceResult(amount=amount, currency=symbol)
+    return None
+
+
+def extract_meta_price(html: str) -> PriceResult | None:
+    """Read Open Graph / product ``price:amount`` and ``price:currency`` meta tags.
+
+    Args:
+        html: Raw page HTML.
+
+    Returns:
+        PriceResult | None: Meta-tag price, or ``None`` when unavailable.
+    """
+    if "price:amount" not in html:
+        return None
+
+    values: dict[str, str] = {}
+    for index, match in enumerate(_META_RE.finditer(html)):
+        if index >= _MAX_TAG_MATCHES * 4:
+            break
+        attrs = _parse_attrs(match.group(0))
+        key = (attrs.get("property") or attrs.get("name") or "").lower()
+        if key in {"og:price:amount", "product:price:amount", "og:price:currency", "product:price:currency"}:
+            values.setdefault(key.split(":", 1)[1], attrs.get("content", ""))
+
+    parsed = _to_amount(values.get("price:amount"))
+    if parsed is None:
+        return None
+    amount, embedded_symbol = parsed
+    symbol = _to_symbol(values.get("price:currency")) or embedded_symbol
+    if symbol is None:
+        return None
+    return PriceResult(amount=amount, currency=symbol)
+
+
+def structured_price_sources(html: str) -> list[str]:
+    """Return the raw markup the structured extractors read a price from.
+
+    Args:
+        html: Raw page HTML.
+
+    Returns:
+        list[str]: JSON-LD blocks, microdata price tags and price meta tags, in that order.
+    """
+    sources: list[str] = []
+    if "ld+json" in html:
+        sources.extend(match.group(0) for match in islice(_JSON_LD_RE.finditer(html), _MAX_JSON_LD_BLOCKS))
+    if "itemprop" in html:
+        sources.extend(match.group(0) for match in islice(_ITEMPROP_PRICE_RE.finditer(html), _MAX_TAG_MATCHES))
+        currency_tag = _ITEMPROP_CURRENCY_RE.search(html)
+        if currency_tag is not None:
+            sources.append(currency_tag.group(0))
+    if "price:" in html:
+        sources.extend(
+            match.group(0)
+            for match in islice(_META_RE.finditer(html), _MAX_TAG_MATCHES * 4)
+            if "price:" in match.group(0).lower()
+        )
+    return sources
+
+
+STRUCTURED_EXTRACTORS: tuple[tuple[str, Callable[[str], PriceResult | None]], ...] = (
+    ("json_ld", extract_json_ld_price),
+    ("microdata", extract_microdata_price),
+    ("meta", extract_meta_price),
+)
+
+
+def extract_structured_price(html: str) -> PriceResult | None:
+    """Run the structured-data extractors in priority order.
+
+    Args:
+        html: Raw page HTML.
+
+    Returns:
+        PriceResult | None: First structured price found, tagged with its extractor name
+            as both ``extractor`` and ``extraction_hint``.
+    """
+    for name, extractor in STRUCTURED_EXTRACTORS:
+        price = extractor(html)
+        if price is not None:
+            price.extractor = name
+            price.extraction_hint = name
+            return price
+    return None
@@ -0,0 +1,275 @@
+"""Per-host token-bucket rate limiting with AIMD-adapted rate and concurrency."""
+
+import asyncio
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import math
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+@dataclass
+class FetchFeedback:
+    """Outcome of one rate-limited fetch reported back to the limiter.
+
+    Args:
+        status_code: HTTP status of the response, when the fetch path knows it.
+
+    Returns:
+        FetchFeedback: Mutable outcome filled in by the caller.
+    """
+
+    status_code: int | None = None
+
+
+@dataclass
+class _HostState:
+    """Token bucket and adaptive limits for one host."""
+
+    rate: float
+    concurrency: float
+    tokens: float
+    refilled_at: float
+    in_flight: int = 0
+    waiting: int = 0
+    throttled: int = 0
+
+
+class HostRateLimiter:
+    """Share request budgets per host across every fetch path.
+
+    Each host gets a token bucket refilled at an adaptive rate with ``burst``
+    capacity, plus a cap on requests in flight. Both adapt AIMD-style. A fast,
+    successful fetch adds ``rate_step`` to the rate and grows concurrency by about
+    one slot per window. A 429, a 5xx, an error or a fetch slower than
+    ``latency_target_seconds`` multiplies both by ``backoff_factor``.
+
+    Args:
+        None.
+
+    Returns:
+        HostRateLimiter: Thread-safe limiter shared by scrapers.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = 1.0,
+        burst: int = 3,
+        max_rate_per_second: float = 5.0,
+        min_rate_per_second: float = 0.05,
+        concurrency: int = 2,
+        max_concurrency: int = 4,
+        latency_target_seconds: float = 10.0,
+        rate_step: float = 0.1,
+        backoff_factor: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize starting limits and AIMD bounds.
+
+        Args:
+            rate_per_second: Starting token refill rate for each host.
+            burst: Token bucket capacity; requests that may start back to back.
+            max_rate_per_second: Upper bound for the adapted rate.
+            min_rate_per_second: Lower bound for the adapted rate.
+            concurrency: Starting number of requests allowed in flight per host.
+            max_concurrency: Upper bound for the adapted concurrency.
+            latency_target_seconds: Fetches slower than this count as congestion.
+            rate_step: Rate added after each uncongested fetch.
+            backoff_factor: Multiplier applied to rate and concurrency on congestion.
+            clock: Monotonic time source, replaceable in tests.
+
+        Returns:
+            None: This constructor initializes limiter state.
+        """
+        if rate_per_second <= 0 or burst < 1 or concurrency < 1:
+            raise ValueError("rate_per_second, burst and concurrency must be positive")
+        if not 0 < backoff_factor < 1:
+            raise ValueError("backoff_factor must be between 0 and 1")
+
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_rate_per_second = max(max_rate_per_second, rate_per_second)
+        self.min_rate_per_second = min(min_rate_per_second, rate_per_second)
+        self.concurrency = concurrency
+        self.max_concurrency = max(max_concurrency, concurrency)
+        self.latency_target_seconds = latency_target_seconds
+        self.rate_step = rate_step
+        self.backoff_factor = backoff_factor
+        self._clock = clock
+        self._hosts: dict[str, _HostState] = {}
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def limit(self, url: str) -> Iterator[FetchFeedback]:
+        """Hold a rate-limited slot for ``url``'s host for the duration of a ``with`` block.
+
+        The block may set ``status_code`` on the yielded feedback. An exception
+        escaping the block counts as a congested fetch.
+
+        Args:
+            url: URL about to be fetched.
+
+        Returns:
+            Iterator[FetchFeedback]: Context manager yielding the feedback to fill in.
+        """
+        self.acquire(url)
+        feedback = FetchFeedback()
+        started = self._clock()
+        failed = True
+        try:
+            yield feedback
+            failed = False
+        finally:
+            self.release(url, self._clock() - started, status_code=feedback.status_code, failed=failed)
+
+    def acquire(self, url: str) -> None:
+        """Block until ``url``'s host has a free slot and a token, then take both.
+
+        Args:
+            url: URL about to be fetched.
+
+        Returns:
+            None: Returns once the caller may start the request.
+        """
+        host = host_of(url)
+        with self._condition:
+            state = self._state(host)
+            state.waiting += 1
+            try:
+                while True:
+                    delay = self._take(state)
+                    if delay == 0:
+                        return
+                    self._condition.wait(timeout=delay)
+            finally:
+                state.waiting -= 1
+
+    def try_acquire(self, url: str) -> float:
+        """Take a slot and a token without blocking, if both are available.
+
+        Args:
+            url: URL about to be fetched.
+
+        Returns:
+            float: ``0.0`` when acquired, otherwise the suggested wait in seconds.
+        """
+        with self._condition:
+            return self._take(self._state(host_of(url)))
+
+    async def acquire_async(self, url: str) -> None:
+        """Wait without blocking the event loop until ``url``'s host may be fetched.
+
+        Args:
+            url: URL about to be fetched.
+
+        Returns:
+            None: Returns once the caller may start the request.
+        """
+        host = host_of(url)
+        with self._condition:
+            self._state(host).waiting += 1
+        try:
+            while (delay := self.try_acquire(url)) > 0:
+                await asyncio.sleep(delay)
+        finally:
+            with self._condition:
+                self._state(host).waiting -= 1
+
+    def release(
+        self,
+        url: str,
+        latency_seconds: float,
+        status_code: int | None = None,
+        failed: bool = False,
+    ) -> None:
+        """Return a slot and adapt the host's limits from the fetch outcome.
+
+        Args:
+            url: URL that was fetched.
+            latency_seconds: Wall-clock duration of the fetch.
+            status_code: HTTP status, when known.
+            failed: Whether the fetch raised an error.
+
+        Returns:
+            None: Updates host state and wakes waiting callers.
+        """
+        congested = (
+            failed
+            or status_code == 429
+            or (status_code is not None and status_code >= 500)
+            or latency_seconds > self.latency_target_seconds
+        )
+        with self._condition:
+            state = self._state(host_of(url))
+            state.in_flight = max(0, state.in_flight - 1)
+            if congested:
+                state.rate = max(self.min_rate_per_second, state.rate * self.backoff_factor)
+                state.concurrency = max(1.0, state.concurrency * self.backoff_factor)
+                state.throttled += 1
+            else:
+                state.rate = min(self.max_rate_per_second, state.rate + self.rate_step)
+                state.concurrency = min(float(self.max_concurrency), state.concurrency + 1 / state.concurrency)
+            self._condition.notify_all()
+
+    def metrics(self) -> dict[str, dict[str, float]]:
+        """Return current limits and load for every host seen so far.
+
+        Args:
+            None.
+
+        Returns:
+            dict[str, dict[str, float]]: Per-host ``rate_per_second``, ``concurrency_limit``,
+            ``in_flight``, ``queue_depth``, ``tokens`` and ``throttled`` counts.
+        """
+        with self._condition:
+            for state in self._hosts.values():
+                self._refill(state)
+            return {
+                host: {
+                    "rate_per_second": round(state.rate, 3),
+                    "concurrency_limit": math.floor(state.concurrency),
+                    "in_flight": state.in_flight,
+                    "queue_depth": state.waiting,
+                    "tokens": round(state.tokens, 3),
+                    "throttled": state.throttled,
+                }
+                for host, state in self._hosts.items()
+            }
+
+    def _state(self, host: str) -> _HostState:
+        """Return the state for a host, creating it with the starting limits."""
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(
+                rate=self.rate_per_second,
+                concurrency=float(self.concurrency),
+                tokens=float(self.burst),
+                refilled_at=self._clock(),
+            )
+            self._hosts[host] = state
+        return state
+
+    def _refill(self, state: _HostState) -> None:
+        """Add tokens earned since the last refill, up to the burst capacity."""
+        now = self._clock()
+        state.tokens = min(float(self.burst), state.tokens + (now - state.refilled_at) * state.rate)
+        state.refilled_at = now
+
+    def _take(self, state: _HostState) -> float:
+        """Take a slot and a token if possible; otherwise return how long to wait."""
+        self._refill(state)
+        if state.in_flight >= math.floor(state.concurrency):
+            # A slot frees up on release, which notifies waiters; this is only a fallback poll.
+            return max(0.05, 1 / state.rate)
+        if state.tokens < 1:
+            return (1 - state.tokens) / state.rate
+        state.tokens -= 1
+        state.in_flight += 1
+        return 0.0
+
+
+def host_of(url: str) -> str:
+    """Return the lower-cased host a URL points at."""
+    return (urlsplit(url).hostname or "").lower()
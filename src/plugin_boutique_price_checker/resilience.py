@@ -0,0 +1,196 @@
+"""Retry classification, jittered backoff and per-host circuit breaking for price fetches."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import random
+import threading
+import time
+
+import httpx
+from selenium.common.exceptions import WebDriverException
+
+from .rate_limiter import host_of
+
+
+class TransientFetchError(RuntimeError):
+    """Fetch failure that is likely to succeed on a later attempt, such as a timeout."""
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of fetching while a host's circuit breaker is open."""
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Return whether a fetch error is transient and worth retrying.
+
+    Timeouts, connection failures and browser/driver errors are retryable. Pages
+    that loaded but had no price, and configuration errors, are not.
+
+    Args:
+        exc: Exception raised by a fetch attempt.
+
+    Returns:
+        bool: ``True`` when another attempt may succeed.
+    """
+    if isinstance(exc, CircuitOpenError):
+        return False
+    return isinstance(
+        exc,
+        (TransientFetchError, TimeoutError, ConnectionError, httpx.TransportError, WebDriverException),
+    )
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Bounded retries with full-jitter exponential backoff.
+
+    Args:
+        max_attempts: Total attempts including the first one.
+        base_delay_seconds: Backoff ceiling for the first retry; doubles per retry.
+        max_delay_seconds: Upper bound for any single backoff.
+
+    Returns:
+        RetryPolicy: Immutable retry settings.
+    """
+
+    max_attempts: int = 3
+    base_delay_seconds: float = 2.0
+    max_delay_seconds: float = 30.0
+
+    def backoff_seconds(self, retry_number: int, rng: Callable[[], float] = random.random) -> float:
+        """Return a jittered delay before retry ``retry_number`` (starting at 1).
+
+        Args:
+            retry_number: Which retry is about to run.
+            rng: Source of uniform ``[0, 1)`` values, replaceable in tests.
+
+        Returns:
+            float: Seconds to sleep, uniformly drawn up to the exponential ceiling.
+        """
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * 2 ** (retry_number - 1))
+        return ceiling * rng()
+
+
+@dataclass
+class _Circuit:
+    """Failure tracking for one host."""
+
+    failures: int = 0
+    opened_at: float | None = None
+    trial_in_flight: bool = False
+
+
+class CircuitBreaker:
+    """Fail fast for hosts that keep failing, probing again after a cool-down.
+
+    After ``failure_threshold`` consecutive failed fetches a host's circuit opens
+    and calls are rejected with ``CircuitOpenError``. Once ``reset_timeout_seconds``
+    have passed, a single trial fetch is let through. Success closes the circuit;
+    failure opens it for another cool-down.
+
+    Args:
+        None.
+
+    Returns:
+        CircuitBreaker: Thread-safe breaker shared by scrapers.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize breaker thresholds.
+
+        Args:
+            failure_threshold: Consecutive failures that open a host's circuit.
+            reset_timeout_seconds: Cool-down before a trial fetch is allowed.
+            clock: Monotonic time source, replaceable in tests.
+
+        Returns:
+            None: This constructor initializes breaker state.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def before_call(self, url: str) -> None:
+        """Raise ``CircuitOpenError`` if ``url``'s host should not be fetched now.
+
+        Args:
+            url: URL about to be fetched.
+
+        Returns:
+            None: Returns when the fetch may proceed.
+        """
+        host = host_of(url)
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            if circuit.opened_at is None:
+                return
+            cooling = self._clock() - circuit.opened_at < self.reset_timeout_seconds
+            if cooling or circuit.trial_in_flight:
+                raise CircuitOpenError(f"Circuit open for {host} after {circuit.failures} consecutive failures")
+            circuit.trial_in_flight = True
+
+    def record_success(self, url: str) -> None:
+        """Close ``url``'s host circuit after a successful fetch.
+
+        Args:
+            url: URL that was fetched.
+
+        Returns:
+            None: Resets failure tracking for the host.
+        """
+        with self._lock:
+            self._circuits[host_of(url)] = _Circuit()
+
+    def record_inconclusive(self, url: str) -> None:
+        """End a fetch that says nothing about the host's health, leaving its state as is.
+
+        Failure counts and an open circuit are kept; only a half-open trial slot is
+        freed so the next call may probe the host again.
+
+        Args:
+            url: URL that was fetched.
+
+        Returns:
+            None: Releases the host's trial slot, if held.
+        """
+        with self._lock:
+            circuit = self._circuits.get(host_of(url))
+            if circuit is not None:
+                circuit.trial_in_flight = False
+
+    def record_failure(self, url: str) -> None:
+        """Count a failed fetch and open the host's circuit at the threshold.
+
+        Args:
+            url: URL whose fetch failed.
+
+        Returns:
+            None: Updates failure tracking for the host.
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(host_of(url), _Circuit())
+            circuit.failures += 1
+            circuit.trial_in_flight = False
+            if circuit.opened_at is not None or circuit.failures >= self.failure_threshold:
+                circuit.opened_at = self._clock()
+
+    def open_hosts(self) -> dict[str, int]:
+        """Return hosts whose circuit is currently open, with their failure counts.
+
+        Args:
+            None.
+
+        Returns:
+            dict[str, int]: Consecutive failures per open host.
+        """
+        with self._lock:
+            return {host: circuit.failures for host, circuit in self._circuits.items() if circuit.opened_at is not None}
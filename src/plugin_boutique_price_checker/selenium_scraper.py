@@ -1,9 +1,21 @@
 """Selenium-based scraper for extracting product prices from Plugin Boutique."""
 
+import asyncio
+from collections import Counter, deque
+from collections.abc import Sequence
+from contextlib import AbstractContextManager, nullcontext
+from functools import lru_cache
+import hashlib
+import os
+from pathlib import Path
 import re
+import shutil
+import threading
+import time
 
+import httpx
 from selenium import webdriver
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
@@ -11,7 +23,126 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
+from .cdp_browser import CdpBrowser
+from .driver_pool import ChromeDriverPool
 from .models import PriceResult
+from .page_archive import PageArchive
+from .page_cache import CachedPage, PageCache, canonical_product_url
+from .price_extractors import STRUCTURED_EXTRACTORS, extract_structured_price, structured_price_sources
+from .rate_limiter import FetchFeedback, HostRateLimiter
+from .resilience import CircuitBreaker, CircuitOpenError, RetryPolicy, TransientFetchError, is_retryable
+
+_CHROMEDRIVER_BINARY_NAMES = ("chromedriver", "chromium.chromedriver")
+_chromedriver_lock = threading.Lock()
+_PURCHASE_ANCHORS = ("add to cart", "buy now")
+_PURCHASE_ANCHOR_PATTERNS = tuple(re.compile(re.escape(text), re.IGNORECASE) for text in _PURCHASE_ANCHORS)
+_PRICE_PATTERN = re.compile(r"([\u00a3\u20ac$])\s?(\d[\d,]*(?:\.\d{2})?)")
+_PRICE_SCAN_WINDOW = 4096
+_FINGERPRINT_RADIUS = 2048
+BROWSER_BACKENDS = ("selenium", "cdp")
+DEFAULT_BLOCKED_URL_PATTERNS = (
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.avif",
+    "*.svg",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.mp4",
+    "*.webm",
+    "*.mp3",
+    "*.css",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*connect.facebook.net*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*tiktok.com*",
+)
+_HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "en-GB,en;q=0.9",
+}
+
+
+def resolve_chromedriver_path(explicit_path: str | None = None) -> str:
+    """Return the chromedriver binary path, resolving it at most once per process.
+
+    Resolution order is the explicit path, the ``CHROMEDRIVER_PATH`` environment
+    variable, a chromedriver on ``PATH``, and finally a webdriver_manager download.
+
+    Args:
+        explicit_path: Optional chromedriver path that overrides discovery.
+
+    Returns:
+        str: Filesystem path of the chromedriver executable.
+    """
+    configured = explicit_path or os.getenv("CHROMEDRIVER_PATH") or None
+    with _chromedriver_lock:
+        return _resolve_chromedriver_path_cached(configured)
+
+
+@lru_cache(maxsize=None)
+def _resolve_chromedriver_path_cached(configured_path: str | None) -> str:
+    """Resolve and memoize the chromedriver path for one configuration value."""
+    if configured_path is not None:
+        path = Path(configured_path).expanduser()
+        if not path.is_file():
+            raise RuntimeError(f"Configured chromedriver does not exist: {path}")
+        return str(path)
+
+    for name in _CHROMEDRIVER_BINARY_NAMES:
+        system_path = shutil.which(name)
+        if system_path:
+            return system_path
+
+    return ChromeDriverManager().install()
+
+
+# Shared by both browser backends. Pages with no price markup at all (discontinued
+# products) stop waiting once fully loaded instead of running into the timeout.
+_PURCHASE_READY_SCRIPT = """
+if (document.readyState === 'complete') { return true; }
+const body = document.body;
+if (!body) { return false; }
+if (document.querySelector(
+  'script[type="application/ld+json"], [itemprop="price"], meta[property$="price:amount"]'
+)) { return true; }
+const text = (body.textContent || '').toLowerCase();
+return text.includes('add to cart') || text.includes('buy now');
+"""
+
+
+class purchase_info_present:
+    """Expected condition that passes once price markup or a purchase anchor is in the DOM, or the page has loaded.
+
+    Args:
+        None.
+
+    Returns:
+        purchase_info_present: Callable condition for ``WebDriverWait.until``.
+    """
+
+    def __call__(self, driver: webdriver.Chrome) -> bool:
+        """Evaluate the readiness probe in the current page.
+
+        Args:
+            driver: WebDriver whose current page is inspected.
+
+        Returns:
+            bool: ``True`` when price-bearing markup is present.
+        """
+        return bool(driver.execute_script(_PURCHASE_READY_SCRIPT))
 
 
 class PluginBoutiqueSeleniumScraper:
@@ -24,18 +155,133 @@ class PluginBoutiqueSeleniumScraper:
         PluginBoutiqueSeleniumScraper: Scraper instance configured with Selenium options.
     """
 
-    def __init__(self, headless: bool = True, timeout_seconds: int = 20) -> None:
+    def __init__(
+        self,
+        headless: bool = True,
+        timeout_seconds: int = 20,
+        driver_pool_size: int = 0,
+        max_pages_per_driver: int = 50,
+        chromedriver_path: str | None = None,
+        http_first: bool = False,
+        block_resources: bool = False,
+        blocked_url_patterns: Sequence[str] | None = None,
+        eager_page_load: bool = False,
+        poll_interval_seconds: float = 0.5,
+        page_cache: PageCache | None = None,
+        page_archive: PageArchive | None = None,
+        browser_backend: str = "selenium",
+        rate_limiter: HostRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        max_driver_age_seconds: float | None = None,
+        max_driver_rss_mb: int | None = None,
+    ) -> None:
         """Initialize scraper runtime options.
 
         Args:
             headless: Whether to run Chrome in headless mode.
             timeout_seconds: Maximum wait time for page body presence.
+            driver_pool_size: Number of warm drivers to reuse; ``0`` starts a fresh driver per check.
+            max_pages_per_driver: Page loads after which a pooled driver is replaced.
+            chromedriver_path: Optional explicit chromedriver binary path.
+            http_first: Try a plain HTTP GET before falling back to a browser.
+            block_resources: Skip images, fonts, media, stylesheets and trackers in Chrome.
+            blocked_url_patterns: URL patterns blocked in lean-page mode; defaults to
+                ``DEFAULT_BLOCKED_URL_PATTERNS``.
+            eager_page_load: Use Chrome's eager load strategy and stop waiting as soon as
+                price markup or the purchase anchor appears.
+            poll_interval_seconds: Poll interval for the eager readiness condition.
+            page_cache: Optional store of validators and prices used for conditional
+                HTTP requests.
+            page_archive: Optional archive that keeps the HTML of every fetched page so
+                prices can be re-extracted later without fetching again.
+            browser_backend: ``selenium`` to drive Chrome through chromedriver, or ``cdp``
+                to drive headless Chromium directly over the DevTools websocket.
+            rate_limiter: Optional per-host limiter that every fetch path waits on; share
+                one instance between scrapers so they draw from the same host budget.
+            retry_policy: Optional retries with jittered backoff for transient fetch errors;
+                ``None`` makes a single attempt.
+            circuit_breaker: Optional per-host breaker that fails fast while a site keeps failing.
+            max_driver_age_seconds: Optional age after which a pooled driver is replaced.
+            max_driver_rss_mb: Optional memory limit for a pooled driver's Chrome process tree;
+                drivers are replaced in the background shortly before reaching it.
 
         Returns:
             None: This constructor initializes instance state.
         """
         self.headless = headless
         self.timeout_seconds = timeout_seconds
+        self.chromedriver_path = chromedriver_path
+        self.http_first = http_first
+        self.block_resources = block_resources
+        self.blocked_url_patterns = list(
+            DEFAULT_BLOCKED_URL_PATTERNS if blocked_url_patterns is None else blocked_url_patterns
+        )
+        self.eager_page_load = eager_page_load
+        self.poll_interval_seconds = poll_interval_seconds
+        self.page_cache = page_cache
+        self.page_archive = page_archive
+        self.cache_stats: Counter[str] = Counter()
+        self._http_client: httpx.Client | None = None
+        if browser_backend not in BROWSER_BACKENDS:
+            raise ValueError(f"Unknown browser backend: {browser_backend}")
+        self.browser_backend = browser_backend
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=1)
+        self.circuit_breaker = circuit_breaker
+        self.fetch_stats: Counter[str] = Counter()
+        self._cdp_browser: CdpBrowser | None = None
+        self._cdp_browser_lock = threading.Lock()
+        self.driver_pool: ChromeDriverPool | None = None
+        if driver_pool_size > 0 and browser_backend == "selenium":
+            self.driver_pool = ChromeDriverPool(
+                lambda: self._build_driver(),
+                size=driver_pool_size,
+                max_pages_per_driver=max_pages_per_driver,
+                max_driver_age_seconds=max_driver_age_seconds,
+                max_rss_bytes=max_driver_rss_mb * 1024 * 1024 if max_driver_rss_mb else None,
+            )
+
+    def __enter__(self) -> "PluginBoutiqueSeleniumScraper":
+        """Return the scraper for use in a ``with`` block.
+
+        Args:
+            None.
+
+        Returns:
+            PluginBoutiqueSeleniumScraper: This scraper instance.
+        """
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Release pooled drivers when leaving a ``with`` block.
+
+        Args:
+            _exc_info: Exception details supplied by the context manager protocol.
+
+        Returns:
+            None: Closes the driver pool if one is configured.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """Quit any warm drivers and close pooled HTTP connections held by this scraper.
+
+        Args:
+            None.
+
+        Returns:
+            None: Closes the driver pool and HTTP client if they were created.
+        """
+        if self.driver_pool is not None:
+            self.driver_pool.close()
+        with self._cdp_browser_lock:
+            if self._cdp_browser is not None:
+                self._cdp_browser.close()
+                self._cdp_browser = None
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
 
     def _build_driver(self) -> webdriver.Chrome:
         """Build and return a configured Chrome WebDriver instance.
@@ -53,54 +299,948 @@ class PluginBoutiqueSeleniumScraper:
         options.add_argument("--no-sandbox")
         options.add_argument("--window-size=1920,1080")
         options.add_argument("--disable-dev-shm-usage")
+        # Batch mode opens product tabs with window.open from a script.
+        options.add_argument("--disable-popup-blocking")
+        if self.eager_page_load:
+            options.page_load_strategy = "eager"
+        if self.block_resources:
+            # Chrome has no content setting for fonts or media; the URL patterns cover them.
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+        service = Service(resolve_chromedriver_path(self.chromedriver_path))
+        driver = webdriver.Chrome(service=service, options=options)
+        self._block_urls(driver)
+        return driver
 
-        service = Service(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=options)
+    def _block_urls(self, driver: webdriver.Chrome) -> None:
+        """Block ``blocked_url_patterns`` in the driver's current tab when lean mode is on.
+
+        DevTools blocking applies per tab, so tabs opened later need their own call.
+
+        Args:
+            driver: Live WebDriver whose current tab should skip blocked URLs.
+
+        Returns:
+            None: Sends the DevTools commands when blocking is configured.
+        """
+        if self.block_resources and self.blocked_url_patterns:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_url_patterns})
 
     def get_price(self, url: str) -> PriceResult:
         """Load a product page and return the extracted price.
 
+        Transient failures are retried under ``retry_policy``, and the circuit breaker
+        is consulted first so a host that keeps failing costs no browser time.
+
+        Args:
+            url: Product page URL to scrape.
+
+        Returns:
+            PriceResult: Parsed price and currency from the loaded page.
+        """
+        self._check_circuit(url)
+        attempt = 1
+        while True:
+            try:
+                price = self._fetch_price(url)
+            except Exception as exc:
+                delay = self._retry_delay(url, exc, attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_success(url)
+            return price
+
+    async def get_price_async(self, url: str, client: httpx.AsyncClient) -> PriceResult:
+        """Fetch a product page from an event loop and return the extracted price.
+
+        The HTTP tier runs on ``client`` without blocking the loop. Page-cache
+        access, extraction and the browser fallback run in worker threads. Retries
+        and the circuit breaker behave as in ``get_price``.
+
         Args:
             url: Product page URL to scrape.
+            client: Async HTTP client shared by the caller's concurrent checks.
 
         Returns:
             PriceResult: Parsed price and currency from the loaded page.
         """
+        self._check_circuit(url)
+        attempt = 1
+        while True:
+            try:
+                price = await self._fetch_price_async(url, client)
+            except Exception as exc:
+                delay = self._retry_delay(url, exc, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_success(url)
+            return price
+
+    def _check_circuit(self, url: str) -> None:
+        """Raise ``CircuitOpenError`` and count it when ``url``'s host circuit is open.
+
+        Args:
+            url: URL about to be fetched.
+
+        Returns:
+            None: Returns when the fetch may proceed.
+        """
+        if self.circuit_breaker is None:
+            return
+        try:
+            self.circuit_breaker.before_call(url)
+        except CircuitOpenError:
+            self.fetch_stats["circuit_open"] += 1
+            raise
+
+    def _retry_delay(self, url: str, exc: Exception, attempt: int) -> float | None:
+        """Return the backoff before retrying a failed attempt, or ``None`` to give up.
+
+        Giving up records the outcome with the circuit breaker.
+
+        Args:
+            url: URL whose fetch failed.
+            exc: Error raised by the attempt.
+            attempt: Number of the attempt that failed, starting at 1.
+
+        Returns:
+            float | None: Seconds to wait before the next attempt, or ``None`` to re-raise.
+        """
+        retryable = is_retryable(exc)
+        if retryable and attempt < self.retry_policy.max_attempts:
+            self.fetch_stats["retry"] += 1
+            return self.retry_policy.backoff_seconds(attempt)
+        if self.circuit_breaker is not None:
+            # A page that loaded without a price says nothing about the site's health.
+            if retryable:
+                self.circuit_breaker.record_failure(url)
+            else:
+                self.circuit_breaker.record_inconclusive(url)
+        return None
+
+    def _fetch_price(self, url: str) -> PriceResult:
+        """Run one fetch-and-extract attempt through the HTTP and browser tiers.
+
+        Args:
+            url: Product page URL to scrape.
+
+        Returns:
+            PriceResult: Parsed price and currency from the loaded page.
+        """
+        cache_key = canonical_product_url(url)
+        cached = self.page_cache.get(cache_key) if self.page_cache is not None else None
+
+        if self.http_first:
+            price = self._get_price_via_http(url, cache_key, cached)
+            if price is not None:
+                return price
+
+        return self._fetch_browser_price(url, cache_key, cached)
+
+    async def _fetch_price_async(self, url: str, client: httpx.AsyncClient) -> PriceResult:
+        """Run one ``_fetch_price`` attempt with the HTTP request awaited on ``client``.
+
+        Args:
+            url: Product page URL to scrape.
+            client: Async HTTP client for the HTTP tier.
+
+        Returns:
+            PriceResult: Parsed price and currency from the loaded page.
+        """
+        cache_key = canonical_product_url(url)
+        cached = await asyncio.to_thread(self.page_cache.get, cache_key) if self.page_cache is not None else None
+
+        if self.http_first:
+            response: httpx.Response | None = None
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(url)
+            started = time.monotonic()
+            try:
+                response = await client.get(url, headers=self._conditional_headers(cached))
+            except httpx.HTTPError:
+                pass
+            finally:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.release(
+                        url,
+                        time.monotonic() - started,
+                        status_code=response.status_code if response is not None else None,
+                        failed=response is None,
+                    )
+            if response is not None:
+                price = await asyncio.to_thread(self._price_from_http_response, response, cache_key, cached)
+                if price is not None:
+                    return price
+
+        return await asyncio.to_thread(self._fetch_browser_price, url, cache_key, cached)
+
+    def _fetch_browser_price(self, url: str, cache_key: str, cached: CachedPage | None) -> PriceResult:
+        """Load a page in the configured browser and extract, reuse or hint its price.
+
+        Args:
+            url: Product page URL to load.
+            cache_key: Canonical URL used for page cache lookups.
+            cached: Cache entry previously stored for ``cache_key``, if any.
+
+        Returns:
+            PriceResult: Parsed price tagged with the browser tier.
+        """
+        with self._rate_limited(url):
+            html = self._load_browser_html(url)
+
+        fingerprint = self._page_fingerprint(html)
+        price = self._reuse_if_unchanged(cached, fingerprint)
+        if price is None:
+            price = self._reuse_extraction_hint(html, cached) or self._extract_price(html)
+            if self.page_cache is not None and fingerprint is not None:
+                self.page_cache.put(
+                    cache_key,
+                    CachedPage(
+                        etag=None,
+                        last_modified=None,
+                        price=price,
+                        fingerprint=self._fingerprint_covering(fingerprint, price),
+                    ),
+                )
+
+        if self.browser_backend == "cdp":
+            price.fetch_tier = "cdp_eager" if self.eager_page_load else "cdp"
+        else:
+            price.fetch_tier = "selenium_eager" if self.eager_page_load else "selenium"
+        self._archive_page(html, price)
+        return price
+
+    def _load_browser_html(self, url: str) -> str:
+        """Load a product page with the configured browser backend and return its HTML.
+
+        Args:
+            url: Product page URL to load.
+
+        Returns:
+            str: Rendered page HTML.
+        """
+        if self.browser_backend == "cdp":
+            return self._get_cdp_browser().fetch_html(
+                url,
+                self.timeout_seconds,
+                ready_script=_PURCHASE_READY_SCRIPT if self.eager_page_load else None,
+            )
+        if self.driver_pool is not None:
+            with self.driver_pool.lease() as driver:
+                return self._load_page_source(driver, url)
         driver = self._build_driver()
         try:
-            driver.get(url)
+            return self._load_page_source(driver, url)
+        finally:
+            driver.quit()
+
+    def _rate_limited(self, url: str) -> AbstractContextManager[FetchFeedback]:
+        """Return a context that holds a per-host rate-limit slot while fetching ``url``.
+
+        Args:
+            url: URL about to be fetched.
+
+        Returns:
+            AbstractContextManager[FetchFeedback]: Limiter slot, or a no-op without a limiter.
+        """
+        if self.rate_limiter is None:
+            return nullcontext(FetchFeedback())
+        return self.rate_limiter.limit(url)
+
+    def _get_cdp_browser(self) -> CdpBrowser:
+        """Return the lazily started DevTools-protocol browser shared by page loads.
+
+        Args:
+            None.
+
+        Returns:
+            CdpBrowser: Browser handle configured from this scraper's options.
+        """
+        # Async checks reach this from ``asyncio.to_thread`` workers, so two threads
+        # could otherwise each start a Chromium.
+        with self._cdp_browser_lock:
+            if self._cdp_browser is None:
+                self._cdp_browser = CdpBrowser(
+                    headless=self.headless,
+                    blocked_url_patterns=self.blocked_url_patterns if self.block_resources else None,
+                )
+            return self._cdp_browser
+
+    def _archive_page(self, html: str, price: PriceResult) -> None:
+        """Store fetched HTML in the page archive and link it from the result.
+
+        Args:
+            html: Page HTML the price was extracted from.
+            price: Result to tag with the archived page digest.
+
+        Returns:
+            None: Sets ``price.page_sha256`` when an archive is configured.
+        """
+        if self.page_archive is not None:
+            price.page_sha256 = self.page_archive.put(html)
+
+    def _reuse_if_unchanged(self, cached: CachedPage | None, fingerprint: str | None) -> PriceResult | None:
+        """Return the cached price when the page fingerprint has not changed.
+
+        Args:
+            cached: Cache entry stored for the product URL, if any.
+            fingerprint: Fingerprint of the freshly loaded page, if it has an anchor.
+
+        Returns:
+            PriceResult | None: Copy of the cached price marked ``unchanged``, or ``None``.
+        """
+        if cached is None or fingerprint is None or cached.fingerprint != fingerprint:
+            return None
+        self.cache_stats["unchanged"] += 1
+        return PriceResult(
+            amount=cached.price.amount,
+            currency=cached.price.currency,
+            extractor=cached.price.extractor,
+            unchanged=True,
+            extraction_hint=cached.price.extraction_hint,
+        )
+
+    def _reuse_extraction_hint(self, html: str, cached: CachedPage | None) -> PriceResult | None:
+        """Extract a price through the hint learned on the previous check, if it still applies.
+
+        Args:
+            html: Freshly loaded page HTML.
+            cached: Cache entry stored for the product URL, if any.
+
+        Returns:
+            PriceResult | None: Price found through the hint, or ``None`` to run the full chain.
+        """
+        hint = cached.price.extraction_hint if cached is not None else None
+        if not hint:
+            return None
+        price = self._extract_with_hint(html, hint)
+        self.cache_stats["hint_hit" if price is not None else "hint_miss"] += 1
+        return price
+
+    def _get_http_client(self) -> httpx.Client:
+        """Return the scraper's pooled HTTP client, creating it on first use.
+
+        Args:
+            None.
+
+        Returns:
+            httpx.Client: Keep-alive client shared by all HTTP-tier fetches.
+        """
+        if self._http_client is None:
+            self._http_client = httpx.Client(
+                headers=_HTTP_HEADERS,
+                timeout=self.timeout_seconds,
+                follow_redirects=True,
+            )
+        return self._http_client
+
+    def _get_price_via_http(
+        self,
+        url: str,
+        cache_key: str,
+        cached: CachedPage | None,
+    ) -> PriceResult | None:
+        """Fetch server-rendered HTML and extract a price without a browser.
+
+        Args:
+            url: Product page URL to fetch.
+            cache_key: Canonical URL used for page cache lookups.
+            cached: Cache entry previously stored for ``cache_key``, if any.
+
+        Returns:
+            PriceResult | None: Parsed price, or ``None`` when the browser tier is needed.
+        """
+        try:
+            with self._rate_limited(url) as feedback:
+                response = self._get_http_client().get(url, headers=self._conditional_headers(cached))
+                feedback.status_code = response.status_code
+        except httpx.HTTPError:
+            return None
+        return self._price_from_http_response(response, cache_key, cached)
+
+    @staticmethod
+    def _conditional_headers(cached: CachedPage | None) -> dict[str, str]:
+        """Return revalidation headers for a cached page.
+
+        Args:
+            cached: Cache entry previously stored for the URL, if any.
+
+        Returns:
+            dict[str, str]: ``If-None-Match``/``If-Modified-Since`` headers, possibly empty.
+        """
+        headers: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def _price_from_http_response(
+        self,
+        response: httpx.Response,
+        cache_key: str,
+        cached: CachedPage | None,
+    ) -> PriceResult | None:
+        """Turn an HTTP-tier response into a price and refresh the page cache.
+
+        Args:
+            response: Response to the plain or conditional GET.
+            cache_key: Canonical URL used for page cache lookups.
+            cached: Cache entry previously stored for ``cache_key``, if any.
+
+        Returns:
+            PriceResult | None: Parsed price, or ``None`` when the browser tier is needed.
+                429 and 5xx responses raise ``TransientFetchError`` instead.
+        """
+        if response.status_code == 304 and cached is not None:
+            self.cache_stats["hit"] += 1
+            return PriceResult(
+                amount=cached.price.amount,
+                currency=cached.price.currency,
+                fetch_tier="http_cache",
+                extractor=cached.price.extractor,
+                unchanged=True,
+                extraction_hint=cached.price.extraction_hint,
+            )
+        if self.page_cache is not None:
+            self.cache_stats["miss"] += 1
+        if response.status_code == 429 or response.status_code >= 500:
+            # The browser would only load the same error page; let the retry policy
+            # and circuit breaker deal with the failing host instead.
+            raise TransientFetchError(f"HTTP {response.status_code} fetching {response.url}")
+        if response.status_code != 200:
+            return None
+
+        html = response.text
+        fingerprint = self._page_fingerprint(html)
+        price = self._reuse_if_unchanged(cached, fingerprint) or self._reuse_extraction_hint(html, cached)
+        if price is None:
+            price = self._extract_http_price(html)
+        if price is None:
+            return None
+
+        price.fetch_tier = "http"
+        self._archive_page(html, price)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.page_cache is not None and (etag or last_modified or fingerprint):
+            self.page_cache.put(
+                cache_key,
+                CachedPage(
+                    etag=etag,
+                    last_modified=last_modified,
+                    price=price,
+                    fingerprint=self._fingerprint_covering(fingerprint, price),
+                ),
+            )
+        return price
+
+    @classmethod
+    def _extract_http_price(cls, html: str) -> PriceResult | None:
+        """Extract a price from server-rendered HTML when the page is complete enough.
+
+        Args:
+            html: Response body returned by a plain HTTP GET.
+
+        Returns:
+            PriceResult | None: Parsed price tagged with the ``http`` tier, or ``None``.
+        """
+        price = extract_structured_price(html)
+        if price is None:
+            if cls._find_purchase_anchor(html) == -1:
+                # Without the purchase anchor the page is probably client-rendered,
+                # so the nearest currency token would not be the product price.
+                return None
+            try:
+                price = cls._extract_anchor_heuristic(html)
+            except RuntimeError:
+                return None
+
+        price.fetch_tier = "http"
+        return price
+
+    def build_async_http_client(self) -> httpx.AsyncClient:
+        """Build a keep-alive async HTTP client for ``get_prices`` or ``get_price_async`` callers.
+
+        Args:
+            None.
+
+        Returns:
+            httpx.AsyncClient: Keep-alive async client with scraper headers and timeouts.
+        """
+        return httpx.AsyncClient(
+            headers=_HTTP_HEADERS,
+            timeout=self.timeout_seconds,
+            follow_redirects=True,
+        )
+
+    async def get_prices(
+        self,
+        urls: Sequence[str],
+        per_host_concurrency: int = 4,
+    ) -> list[PriceResult | Exception]:
+        """Fetch many product pages concurrently over HTTP and extract their prices.
+
+        Requests to the same host are capped at ``per_host_concurrency`` in flight,
+        and each request is bounded by ``timeout_seconds``. A failing URL yields its
+        exception in place of a result instead of aborting the batch.
+
+        Args:
+            urls: Product page URLs to check.
+            per_host_concurrency: Maximum simultaneous requests per host.
+
+        Returns:
+            list[PriceResult | Exception]: One entry per URL, in input order.
+        """
+        if per_host_concurrency < 1:
+            raise ValueError("per_host_concurrency must be at least 1")
+
+        host_limits: dict[str, asyncio.Semaphore] = {}
+
+        async with self.build_async_http_client() as client:
+
+            async def fetch(url: str) -> PriceResult:
+                host = httpx.URL(url).host
+                limit = host_limits.setdefault(host, asyncio.Semaphore(per_host_concurrency))
+                async with limit:
+                    if self.rate_limiter is not None:
+                        await self.rate_limiter.acquire_async(url)
+                    started = time.monotonic()
+                    response: httpx.Response | None = None
+                    try:
+                        response = await asyncio.wait_for(client.get(url), self.timeout_seconds)
+                    except asyncio.TimeoutError as exc:
+                        raise TransientFetchError(f"Timed out fetching {url}") from exc
+                    finally:
+                        if self.rate_limiter is not None:
+                            self.rate_limiter.release(
+                                url,
+                                time.monotonic() - started,
+                                status_code=response.status_code if response is not None else None,
+                                failed=response is None,
+                            )
+
+                if response.status_code == 429 or response.status_code >= 500:
+                    raise TransientFetchError(f"HTTP {response.status_code} fetching {url}")
+                if response.status_code != 200:
+                    raise RuntimeError(f"HTTP {response.status_code} fetching {url}")
+                price = self._extract_http_price(response.text)
+                if price is None:
+                    raise RuntimeError(f"No server-rendered price found for {url}")
+                return price
+
+            results = await asyncio.gather(*(fetch(url) for url in urls), return_exceptions=True)
+
+        return list(results)
+
+    def get_prices_in_tabs(
+        self,
+        urls: Sequence[str],
+        max_tabs: int = 4,
+        poll_interval_seconds: float = 0.2,
+    ) -> list[PriceResult | Exception]:
+        """Load several product pages in parallel tabs of one browser and extract their prices.
+
+        Up to ``max_tabs`` pages load at once. Each tab is polled for readiness on its
+        own, extracted as soon as it finishes, and closed to make room for the next URL.
+        A page that fails or exceeds ``timeout_seconds`` yields its exception in place.
+
+        Args:
+            urls: Product page URLs to check.
+            max_tabs: Maximum number of tabs loading at the same time.
+            poll_interval_seconds: Delay between readiness sweeps over open tabs.
+
+        Returns:
+            list[PriceResult | Exception]: One entry per URL, in input order.
+        """
+        if max_tabs < 1:
+            raise ValueError("max_tabs must be at least 1")
+
+        results: list[PriceResult | Exception | None] = [None] * len(urls)
+        if not urls:
+            return []
+
+        if self.driver_pool is not None:
+            # Lease per slice of at most one driver's page budget, so page-count
+            # recycling still happens inside a long batch.
+            step = self.driver_pool.max_pages_per_driver
+            for start in range(0, len(urls), step):
+                chunk = urls[start : start + step]
+                chunk_results: list[PriceResult | Exception | None] = [None] * len(chunk)
+                try:
+                    with self.driver_pool.lease(pages=len(chunk)) as driver:
+                        self._run_tab_batch(driver, chunk, chunk_results, max_tabs, poll_interval_seconds)
+                except WebDriverException as exc:
+                    # The pool discards the crashed driver; later slices lease a fresh one.
+                    chunk_results = [exc if result is None else result for result in chunk_results]
+                results[start : start + len(chunk)] = chunk_results
+        else:
             try:
+                driver = self._build_driver()
+                try:
+                    self._run_tab_batch(driver, urls, results, max_tabs, poll_interval_seconds)
+                finally:
+                    driver.quit()
+            except WebDriverException as exc:
+                # A browser crash fails every page that had not finished yet.
+                results = [exc if result is None else result for result in results]
+
+        return [RuntimeError("Price check did not complete") if result is None else result for result in results]
+
+    def _run_tab_batch(
+        self,
+        driver: webdriver.Chrome,
+        urls: Sequence[str],
+        results: list[PriceResult | Exception | None],
+        max_tabs: int,
+        poll_interval_seconds: float,
+    ) -> None:
+        """Drive the open-poll-extract-close loop for ``get_prices_in_tabs``.
+
+        Args:
+            driver: Live WebDriver whose current window stays open as the home tab.
+            urls: Product page URLs to check.
+            results: Output list filled in place, indexed like ``urls``.
+            max_tabs: Maximum number of tabs loading at the same time.
+            poll_interval_seconds: Delay between readiness sweeps over open tabs.
+
+        Returns:
+            None: Results are written into ``results``.
+        """
+        home_handle = driver.current_window_handle
+        pending = deque(enumerate(urls))
+        open_tabs: dict[str, tuple[int, float, float]] = {}
+
+        try:
+            while pending or open_tabs:
+                while pending and len(open_tabs) < max_tabs:
+                    index, url = pending[0]
+                    if self.rate_limiter is not None and self.rate_limiter.try_acquire(url) > 0:
+                        # Host budget exhausted: poll open tabs and try again next sweep.
+                        break
+                    pending.popleft()
+                    started = time.monotonic()
+                    handle = self._open_tab(driver, url)
+                    if handle is None:
+                        results[index] = RuntimeError(f"Could not open a browser tab for {url}")
+                        self._release_tab(url, started, failed=True)
+                        continue
+                    open_tabs[handle] = (index, started, started + self.timeout_seconds)
+
+                for handle, (index, started, deadline) in list(open_tabs.items()):
+                    driver.switch_to.window(handle)
+                    if driver.execute_script("return document.readyState") == "complete":
+                        self._release_tab(urls[index], started, failed=False)
+                        try:
+                            price = self._extract_price(driver.page_source)
+                            price.fetch_tier = "selenium_tab"
+                            results[index] = price
+                        except RuntimeError as exc:
+                            results[index] = exc
+                    elif time.monotonic() >= deadline:
+                        self._release_tab(urls[index], started, failed=True)
+                        results[index] = TransientFetchError("Timed out waiting for page to load")
+                    else:
+                        continue
+                    driver.close()
+                    del open_tabs[handle]
+
+                driver.switch_to.window(home_handle)
+                if pending or open_tabs:
+                    time.sleep(poll_interval_seconds)
+        finally:
+            for index, started, _deadline in open_tabs.values():
+                self._release_tab(urls[index], started, failed=True)
+
+    def _open_tab(self, driver: webdriver.Chrome, url: str) -> str | None:
+        """Open ``url`` in a new tab without waiting for it to load.
+
+        In lean mode the tab opens blank, gets its own URL blocking, and only then
+        navigates, so the page's first requests are already filtered.
+
+        Args:
+            driver: Live WebDriver to open the tab in.
+            url: Product page URL to load.
+
+        Returns:
+            str | None: Handle of the new tab, or ``None`` when no tab opened.
+        """
+        blocking = self.block_resources and bool(self.blocked_url_patterns)
+        known_handles = set(driver.window_handles)
+        driver.execute_script("window.open(arguments[0], '_blank');", "about:blank" if blocking else url)
+        new_handles = [handle for handle in driver.window_handles if handle not in known_handles]
+        if not new_handles:
+            return None
+        if blocking:
+            driver.switch_to.window(new_handles[0])
+            self._block_urls(driver)
+            driver.execute_script("window.location.href = arguments[0];", url)
+        return new_handles[0]
+
+    def _release_tab(self, url: str, started: float, failed: bool) -> None:
+        """Return a tab's rate-limit slot once its page has finished or failed.
+
+        Args:
+            url: URL the tab loaded.
+            started: Monotonic time the tab was opened.
+            failed: Whether the load timed out or could not start.
+
+        Returns:
+            None: Releases the slot when a limiter is configured.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.release(url, time.monotonic() - started, failed=failed)
+
+    def _load_page_source(self, driver: webdriver.Chrome, url: str) -> str:
+        """Navigate an existing driver to a product page and return its HTML once ready.
+
+        Args:
+            driver: Live WebDriver used to load the page.
+            url: Product page URL to scrape.
+
+        Returns:
+            str: Page source of the loaded product page.
+        """
+        driver.get(url)
+        try:
+            if self.eager_page_load:
+                WebDriverWait(
+                    driver,
+                    self.timeout_seconds,
+                    poll_frequency=self.poll_interval_seconds,
+                ).until(purchase_info_present())
+            else:
                 WebDriverWait(driver, self.timeout_seconds).until(
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
-            except TimeoutException as exc:
-                raise RuntimeError("Timed out waiting for page to load") from exc
+        except TimeoutException as exc:
+            raise TransientFetchError("Timed out waiting for page to load") from exc
 
-            html = driver.page_source
-            return self._extract_closest_price(html)
-        finally:
-            driver.quit()
+        return driver.page_source
+
+    @classmethod
+    def _extract_price(cls, html: str) -> PriceResult:
+        """Run structured-data extractors first and the anchor heuristic as a last resort.
+
+        Args:
+            html: Raw page HTML to inspect.
+
+        Returns:
+            PriceResult: Parsed price tagged with the extractor that produced it.
+        """
+        price = extract_structured_price(html)
+        if price is not None:
+            return price
+        return cls._extract_anchor_heuristic(html)
+
+    @classmethod
+    def _extract_anchor_heuristic(cls, html: str) -> PriceResult:
+        """Run the anchor-distance heuristic and record where the price was found.
+
+        Args:
+            html: Raw page HTML to inspect.
+
+        Returns:
+            PriceResult: Parsed price with an ``anchor:<anchor>:<price>`` offset hint.
+        """
+        anchor, best = cls._locate_closest_price(html)
+        price = PriceResult(amount=float(best.group(2).replace(",", "")), currency=best.group(1))
+        price.extractor = "anchor_heuristic"
+        if anchor != -1:
+            price.extraction_hint = f"anchor:{anchor}:{best.start()}"
+        return price
+
+    @classmethod
+    def _extract_with_hint(cls, html: str, hint: str | None) -> PriceResult | None:
+        """Check a learned extraction hint with a bounded amount of work.
+
+        Structured hints skip the extractors ranked below the one that succeeded last
+        time. Offset hints confirm the stored offset is still the page's first purchase
+        anchor and the price is still at its offset. They also check that no other price
+        sits closer to the anchor, scanning only the span between them. A hint never
+        changes the result: when an extractor ranked above it now finds a price, the
+        hint is rejected and the full chain runs.
+
+        Args:
+            html: Raw page HTML to inspect.
+            hint: Hint string stored from a previous successful extraction.
+
+        Returns:
+            PriceResult | None: Price found through the hint, or ``None`` when it no longer applies.
+        """
+        if not hint:
+            return None
+
+        names = [name for name, _ in STRUCTURED_EXTRACTORS]
+        if not hint.startswith("anchor:"):
+            if hint not in names:
+                return None
+            ranked_above = STRUCTURED_EXTRACTORS[: names.index(hint)]
+            if any(extractor(html) is not None for _, extractor in ranked_above):
+                return None
+            price = dict(STRUCTURED_EXTRACTORS)[hint](html)
+            if price is not None:
+                price.extractor = hint
+                price.extraction_hint = hint
+            return price
+
+        try:
+            _, anchor_raw, price_raw = hint.split(":")
+            anchor, price_start = int(anchor_raw), int(price_raw)
+        except ValueError:
+            return None
+        # A full scan anchors on the first purchase text, so an earlier one voids the hint.
+        if cls._find_purchase_anchor(html) != anchor:
+            return None
+        hinted = _PRICE_PATTERN.match(html, price_start)
+        if hinted is None:
+            return None
+        # Structured data added since the last check outranks the heuristic.
+        if extract_structured_price(html) is not None:
+            return None
+
+        distance = abs(price_start - anchor)
+        for match in _PRICE_PATTERN.finditer(html, max(0, anchor - distance)):
+            if match.start() > anchor + distance:
+                break
+            if match.start() < price_start and abs(match.start() - anchor) <= distance:
+                return None
+            if match.start() > price_start and abs(match.start() - anchor) < distance:
+                return None
+
+        price = PriceResult(amount=float(hinted.group(2).replace(",", "")), currency=hinted.group(1))
+        price.extractor = "anchor_heuristic"
+        price.extraction_hint = hint
+        return price
+
+    @classmethod
+    def _page_fingerprint(cls, html: str) -> str | None:
+        """Hash the markup a price can be read from to detect unchanged pages.
+
+        The digest covers the region around the purchase anchor plus every
+        structured price source, so a JSON-LD price in ``<head>`` is covered too.
+
+        Args:
+            html: Raw page HTML.
+
+        Returns:
+            str | None: Hex digest, or ``None`` when the page has no anchor and no structured data.
+        """
+        anchor = cls._find_purchase_anchor(html)
+        sources = structured_price_sources(html)
+        if anchor == -1 and not sources:
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        if anchor != -1:
+            digest.update(html[max(0, anchor - _FINGERPRINT_RADIUS) : anchor + _FINGERPRINT_RADIUS].encode("utf-8"))
+        for source in sources:
+            digest.update(b"\0" + source.encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _fingerprint_covering(fingerprint: str | None, price: PriceResult) -> str | None:
+        """Return ``fingerprint`` only if the hashed markup includes where ``price`` came from.
+
+        Structured prices are always covered. Heuristic prices are covered when they
+        lie within the anchor region; otherwise the price could change without the
+        fingerprint changing, so no fingerprint is stored and the next check extracts.
+
+        Args:
+            fingerprint: Fingerprint of the page the price was extracted from.
+            price: Extracted price carrying its extractor and hint.
+
+        Returns:
+            str | None: Fingerprint safe to store for the unchanged-page short cut.
+        """
+        if fingerprint is None or price.extractor != "anchor_heuristic":
+            return fingerprint
+        hint = price.extraction_hint or ""
+        try:
+            _, anchor_raw, price_raw = hint.split(":")
+            distance = abs(int(price_raw) - int(anchor_raw))
+        except ValueError:
+            return None
+        # The price text itself must fit inside the hashed window too.
+        return fingerprint if distance + 32 <= _FINGERPRINT_RADIUS else None
+
+    @staticmethod
+    def _find_purchase_anchor(html: str) -> int:
+        """Locate the purchase-action text used to anchor price selection.
+
+        Args:
+            html: Raw page HTML to search.
+
+        Returns:
+            int: Offset of the first purchase anchor, or ``-1`` when absent.
+        """
+        for pattern in _PURCHASE_ANCHOR_PATTERNS:
+            match = pattern.search(html)
+            if match is not None:
+                return match.start()
+        return -1
 
     @staticmethod
     def _extract_closest_price(html: str) -> PriceResult:
         """Extract the most relevant currency value from HTML content.
 
+        The nearest price after the anchor is found with one forward search, then
+        windows before the anchor are scanned outward, never further back than that
+        forward distance. Ties go to the earlier price, and without an anchor the
+        first price on the page wins.
+
         Args:
             html: Raw page HTML to inspect for price-like values.
 
         Returns:
             PriceResult: Best-match price nearest the purchase-action anchor text.
         """
-        lower_html = html.lower()
-        anchor = lower_html.find("add to cart")
-        if anchor == -1:
-            anchor = lower_html.find("buy now")
-
-        matches = list(re.finditer(r"([\u00a3\u20ac$])\s?(\d[\d,]*(?:\.\d{2})?)", html))
-        if not matches:
-            raise RuntimeError("No currency-like prices found in page source")
-
-        best = min(matches, key=lambda m: abs(m.start() - anchor) if anchor != -1 else m.start())
+        _anchor, best = PluginBoutiqueSeleniumScraper._locate_closest_price(html)
         currency = best.group(1)
         amount = float(best.group(2).replace(",", ""))
         return PriceResult(amount=amount, currency=currency)
+
+    @staticmethod
+    def _locate_closest_price(html: str) -> tuple[int, re.Match[str]]:
+        """Find the purchase anchor and the price match chosen by the anchor heuristic.
+
+        Args:
+            html: Raw page HTML to inspect for price-like values.
+
+        Returns:
+            tuple[int, re.Match[str]]: Anchor offset (``-1`` when absent) and best price match.
+        """
+        anchor = PluginBoutiqueSeleniumScraper._find_purchase_anchor(html)
+        if anchor == -1:
+            best = _PRICE_PATTERN.search(html)
+        else:
+            after = _PRICE_PATTERN.search(html, anchor)
+            # Prices can never overlap (each one starts with a currency symbol that
+            # cannot occur inside another), so scanning from any offset is safe.
+            limit = 0 if after is None else max(0, anchor - (after.start() - anchor))
+            before = None
+            window = _PRICE_SCAN_WINDOW
+            low = anchor
+            while before is None and low > limit:
+                low = max(limit, anchor - window)
+                for match in _PRICE_PATTERN.finditer(html, low):
+                    if match.start() >= anchor:
+                        break
+                    before = match
+                window *= 2
+            best = before or after
+
+        if best is None:
+            raise RuntimeError("No currency-like prices found in page source")
+        return anchor, best
@@ -1,4 +1,4 @@
-"""FastAPI application exposing users, watchlists, and manual checks."""
+"""FastAPI application exposing users, watchlists, and queued manual checks."""
 
 from pathlib import Path
 from typing import Annotated
@@ -24,15 +24,17 @@ from .auth import (
     send_email_otp,
     send_sms_otp,
 )
+from .check_jobs import cancel_pending_jobs, enqueue_check
 from .database import create_all_tables
 from .deps import get_db
-from .orm_models import PriceCheckRun, User, WatchlistItem, utc_now
+from .orm_models import CheckJob, PriceCheckRun, User, WatchlistItem, utc_now
 from .schemas import (
     AuthCodeVerify,
     AuthFlowResponse,
     AuthLoginStart,
     AuthRegisterStart,
     AuthTokenResponse,
+    CheckJobRead,
     PriceCheckRunRead,
     UserCreate,
     UserRead,
@@ -40,7 +42,7 @@ from .schemas import (
     WatchlistItemRead,
     WatchlistItemUpdate,
 )
-from .scrape_runner import run_check_for_item
+from .scheduler import reschedule
 from .settings import load_settings
 
 app = FastAPI(title="Plugin Boutique Price Checker API", version="0.1.0")
@@ -276,6 +278,7 @@ def create_my_watchlist_item(payload: WatchlistItemCreate, db: DBDep, current_us
         product_url=payload.product_url,
         threshold=payload.threshold,
         is_active=payload.is_active,
+        check_interval_seconds=payload.check_interval_seconds,
     )
     db.add(item)
     db.commit()
@@ -301,6 +304,13 @@ def update_my_watchlist_item(item_id: int, payload: WatchlistItemUpdate, db: DBD
         item.threshold = payload.threshold
     if payload.is_active is not None:
         item.is_active = payload.is_active
+        if not payload.is_active:
+            # Workers skip inactive items, so a queued check would never run.
+            cancel_pending_jobs(db, item)
+    if "check_interval_seconds" in payload.model_fields_set:
+        # An explicit null goes back to the default interval.
+        item.check_interval_seconds = payload.check_interval_seconds
+        reschedule(db, item, settings)
 
     db.add(item)
     db.commit()
@@ -315,22 +325,37 @@ def delete_my_watchlist_item(item_id: int, db: DBDep, current_user: UserDep) ->
     if item is None or item.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Watchlist item not found")
 
+    db.execute(delete(CheckJob).where(CheckJob.watchlist_item_id == item_id))
     db.execute(delete(PriceCheckRun).where(PriceCheckRun.watchlist_item_id == item_id))
     db.delete(item)
     db.commit()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-@app.post("/me/watchlist-items/{item_id}/check", response_model=PriceCheckRunRead)
-def check_my_watchlist_item(item_id: int, db: DBDep, current_user: UserDep) -> PriceCheckRun:
-    """Run check for own active watchlist item."""
+@app.post(
+    "/me/watchlist-items/{item_id}/check",
+    response_model=CheckJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def check_my_watchlist_item(item_id: int, db: DBDep, current_user: UserDep) -> CheckJob:
+    """Queue a check for own active watchlist item; a worker runs it ahead of scheduled checks."""
     item = db.get(WatchlistItem, item_id)
     if item is None or item.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Watchlist item not found")
     if not item.is_active:
         raise HTTPException(status_code=400, detail="Watchlist item is inactive")
 
-    return run_check_for_item(db, item)
+    return enqueue_check(db, item)
+
+
+@app.get("/me/check-jobs/{job_id}", response_model=CheckJobRead)
+def get_my_check_job(job_id: int, db: DBDep, current_user: UserDep) -> CheckJob:
+    """Report progress of a queued check on own watchlist item."""
+    job = db.get(CheckJob, job_id)
+    item = db.get(WatchlistItem, job.watchlist_item_id) if job is not None else None
+    if job is None or item is None or item.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Check job not found")
+    return job
 
 
 @app.get("/me/watchlist-items/{item_id}/runs", response_model=list[PriceCheckRunRead])
@@ -366,6 +391,7 @@ def create_watchlist_item(user_id: int, payload: WatchlistItemCreate, db: DBDep)
         product_url=payload.product_url,
         threshold=payload.threshold,
         is_active=payload.is_active,
+        check_interval_seconds=payload.check_interval_seconds,
     )
     db.add(item)
     db.commit()
@@ -395,6 +421,13 @@ def update_watchlist_item(item_id: int, payload: WatchlistItemUpdate, db: DBDep)
         item.threshold = payload.threshold
     if payload.is_active is not None:
         item.is_active = payload.is_active
+        if not payload.is_active:
+            # Workers skip inactive items, so a queued check would never run.
+            cancel_pending_jobs(db, item)
+    if "check_interval_seconds" in payload.model_fields_set:
+        # An explicit null goes back to the default interval.
+        item.check_interval_seconds = payload.check_interval_seconds
+        reschedule(db, item, settings)
 
     db.add(item)
     db.commit()
@@ -409,22 +442,36 @@ def delete_watchlist_item(item_id: int, db: DBDep) -> Response:
     if item is None:
         raise HTTPException(status_code=404, detail="Watchlist item not found")
 
+    db.execute(delete(CheckJob).where(CheckJob.watchlist_item_id == item_id))
     db.execute(delete(PriceCheckRun).where(PriceCheckRun.watchlist_item_id == item_id))
     db.delete(item)
     db.commit()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-@app.post("/watchlist-items/{item_id}/check", response_model=PriceCheckRunRead)
-def check_watchlist_item(item_id: int, db: DBDep) -> PriceCheckRun:
-    """Run a check immediately for one watchlist item."""
+@app.post(
+    "/watchlist-items/{item_id}/check",
+    response_model=CheckJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def check_watchlist_item(item_id: int, db: DBDep) -> CheckJob:
+    """Queue a check for one watchlist item; a worker runs it ahead of scheduled checks."""
     item = db.get(WatchlistItem, item_id)
     if item is None:
         raise HTTPException(status_code=404, detail="Watchlist item not found")
     if not item.is_active:
         raise HTTPException(status_code=400, detail="Watchlist item is inactive")
 
-    return run_check_for_item(db, item)
+    return enqueue_check(db, item)
+
+
+@app.get("/check-jobs/{job_id}", response_model=CheckJobRead)
+def get_check_job(job_id: int, db: DBDep) -> CheckJob:
+    """Report progress of a queued check."""
+    job = db.get(CheckJob, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Check job not found")
+    return job
 
 
 @app.get("/watchlist-items/{item_id}/runs", response_model=list[PriceCheckRunRead])
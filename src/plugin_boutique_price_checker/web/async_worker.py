@@ -0,0 +1,308 @@
+"""Asyncio worker that checks active watchlist items on a single event loop."""
+
+import asyncio
+from collections import Counter
+from time import monotonic, perf_counter
+import os
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from plugin_boutique_price_checker.email_notifier import EmailNotifier
+from plugin_boutique_price_checker.selenium_scraper import PluginBoutiqueSeleniumScraper
+
+from .check_results import (
+    CheckOutcome,
+    QueuedCheck,
+    error_outcome,
+    queued_checks,
+    queued_checks_statement,
+    success_outcome,
+    write_outcomes,
+)
+from .check_jobs import any_pending_job, start_jobs_statement
+from .database import create_all_tables, dispose_async_engine, get_async_session_factory
+from .leases import claim_statement, renew_statement, renewal_interval_seconds, worker_identity
+from .scheduler import next_due_statement, sleep_seconds_until
+from .scrape_runner import build_cycle_scraper, build_notifier_if_configured, plan_alert
+from .settings import Settings, load_settings
+from .worker import print_rate_limits, print_scraper_stats
+
+
+async def run_once_async(settings: Settings | None = None) -> int:
+    """Check every due watchlist item this worker can lease as a pipeline of asyncio tasks.
+
+    A reader leases batches of active items, ``WORKER_ASYNC_CONCURRENCY`` fetch tasks
+    check them, and a writer stores results ``WORKER_WRITE_BATCH_SIZE`` at a time.
+    Bounded queues between the stages provide backpressure, so a slow site or a
+    slow database pauses the stages before it instead of buffering the watchlist.
+    Leases on items claimed but not yet checked are renewed while they wait.
+    """
+    settings = settings or load_settings()
+    started = perf_counter()
+    concurrency = max(1, settings.worker_async_concurrency)
+    batch_size = max(1, settings.worker_write_batch_size)
+    session_factory = get_async_session_factory()
+    worker_id = worker_identity(settings)
+    pending: asyncio.Queue[QueuedCheck | None] = asyncio.Queue(maxsize=concurrency)
+    outcomes: asyncio.Queue[CheckOutcome | None] = asyncio.Queue(maxsize=batch_size * 2)
+    held: set[int] = set()
+
+    scraper = build_cycle_scraper(settings)
+    notifier = build_notifier_if_configured()
+    try:
+        async with scraper.build_async_http_client() as client:
+            writer = asyncio.create_task(
+                _write_results(outcomes, session_factory, batch_size, worker_id, settings)
+            )
+            fetchers = [
+                asyncio.create_task(_check_items(pending, outcomes, held, scraper, client, notifier))
+                for _ in range(concurrency)
+            ]
+            renewer = asyncio.create_task(_renew_held_leases(held, session_factory, worker_id, settings))
+
+            async def feed() -> None:
+                await _claim_active_items(pending, held, session_factory, worker_id, settings)
+                for _ in fetchers:
+                    await pending.put(None)
+                await asyncio.gather(*fetchers)
+                await outcomes.put(None)
+
+            feeder = asyncio.create_task(feed())
+            try:
+                # Gathering the writer too means a failed write stops the cycle instead of
+                # leaving fetchers blocked on a full queue.
+                _, statuses = await asyncio.gather(feeder, writer)
+            except BaseException:
+                for task in (feeder, *fetchers, writer):
+                    task.cancel()
+                raise
+            finally:
+                renewer.cancel()
+    finally:
+        await asyncio.to_thread(scraper.close)
+
+    processed = sum(statuses.values())
+    print(
+        f"Cycle: {processed} processed, {statuses['error']} errors in {perf_counter() - started:.1f}s "
+        f"with {concurrency} async checks"
+    )
+    print_scraper_stats([scraper])
+    print_rate_limits()
+    return processed
+
+
+async def _claim_active_items(
+    pending: asyncio.Queue[QueuedCheck | None],
+    held: set[int],
+    session_factory: async_sessionmaker[AsyncSession],
+    worker_id: str,
+    settings: Settings,
+) -> None:
+    """Lease due items a batch at a time and queue them until none are left.
+
+    Each batch is leased in a short transaction and queued before the next is
+    claimed, so waiting on a full queue never pins a transaction and the rest of
+    the watchlist stays available to other workers.
+    """
+    batch_size = max(1, settings.worker_async_concurrency)
+    while True:
+        async with session_factory() as db:
+            claimed = list((await db.scalars(claim_statement(worker_id, batch_size, settings.worker_lease_seconds))).all())
+            if not claimed:
+                await db.commit()
+                return
+            await db.execute(start_jobs_statement(claimed))
+            await db.commit()
+            held.update(claimed)
+            checks = queued_checks((await db.execute(queued_checks_statement(claimed))).all())
+        for check in checks:
+            await pending.put(check)
+
+
+async def _renew_held_leases(
+    held: set[int],
+    session_factory: async_sessionmaker[AsyncSession],
+    worker_id: str,
+    settings: Settings,
+) -> None:
+    """Extend the leases on items still waiting for a fetcher until cancelled.
+
+    A leased batch can sit in the queue behind slow checks for longer than
+    ``WORKER_LEASE_SECONDS``; without renewal another worker would claim it again.
+    """
+    interval = renewal_interval_seconds(settings.worker_lease_seconds)
+    while True:
+        await asyncio.sleep(interval)
+        if not held:
+            continue
+        async with session_factory() as db:
+            await db.execute(renew_statement(worker_id, sorted(held), settings.worker_lease_seconds))
+            await db.commit()
+
+
+async def _check_items(
+    pending: asyncio.Queue[QueuedCheck | None],
+    outcomes: asyncio.Queue[CheckOutcome | None],
+    held: set[int],
+    scraper: PluginBoutiqueSeleniumScraper,
+    client: httpx.AsyncClient,
+    notifier: EmailNotifier | None,
+) -> None:
+    """Check queued items until a ``None`` sentinel arrives."""
+    while (check := await pending.get()) is not None:
+        outcome = await _check_item(check, scraper, client, notifier)
+        # The writer releases the lease within WORKER_WRITE_FLUSH_SECONDS from here.
+        held.discard(check.item_id)
+        await outcomes.put(outcome)
+
+
+async def _check_item(
+    check: QueuedCheck,
+    scraper: PluginBoutiqueSeleniumScraper,
+    client: httpx.AsyncClient,
+    notifier: EmailNotifier | None,
+) -> CheckOutcome:
+    """Fetch one price, send its alert if due, and describe the run to store."""
+    fetch_ms: int | None = None
+    try:
+        started = perf_counter()
+        try:
+            price = await scraper.get_price_async(check.product_url, client)
+        finally:
+            fetch_ms = int((perf_counter() - started) * 1000)
+
+        alert_sent, message = plan_alert(
+            price,
+            check.threshold,
+            notifier_configured=notifier is not None,
+            last_run_sent_alert=lambda: check.last_alert_sent,
+        )
+        if alert_sent and notifier is not None:
+            await asyncio.to_thread(
+                notifier.send_price_alert,
+                to_email=check.user_email,
+                product_url=check.product_url,
+                price=price,
+                threshold=check.threshold,
+            )
+        return success_outcome(check, price, fetch_ms, alert_sent, message)
+    except Exception as exc:  # pragma: no cover - broad catch is deliberate for worker robustness
+        return error_outcome(check, exc, fetch_ms)
+
+
+async def _write_results(
+    outcomes: asyncio.Queue[CheckOutcome | None],
+    session_factory: async_sessionmaker[AsyncSession],
+    batch_size: int,
+    worker_id: str,
+    settings: Settings,
+) -> Counter[str]:
+    """Store outcomes in batches until a ``None`` sentinel arrives; return status counts.
+
+    A batch is written once it holds ``batch_size`` outcomes or its oldest outcome
+    has waited ``WORKER_WRITE_FLUSH_SECONDS``.
+    """
+    statuses: Counter[str] = Counter()
+    batch: list[CheckOutcome] = []
+    flush_at = 0.0
+    finished = False
+    while not finished:
+        stale = False
+        try:
+            timeout = max(0.0, flush_at - monotonic()) if batch else None
+            outcome = await asyncio.wait_for(outcomes.get(), timeout)
+        except asyncio.TimeoutError:
+            stale = True
+        else:
+            if outcome is None:
+                finished = True
+            else:
+                if not batch:
+                    flush_at = monotonic() + settings.worker_write_flush_seconds
+                batch.append(outcome)
+        if batch and (stale or finished or len(batch) >= batch_size):
+            await _write_batch(session_factory, batch, worker_id, settings)
+            statuses.update(entry.status for entry in batch)
+            batch = []
+    return statuses
+
+
+async def _write_batch(
+    session_factory: async_sessionmaker[AsyncSession],
+    batch: list[CheckOutcome],
+    worker_id: str,
+    settings: Settings,
+) -> None:
+    """Write one batch of outcomes in a single transaction, retrying once after a concurrent delete."""
+    try:
+        async with session_factory() as db, db.begin():
+            await db.run_sync(write_outcomes, batch, worker_id, settings)
+    except IntegrityError:
+        async with session_factory() as db, db.begin():
+            await db.run_sync(write_outcomes, batch, worker_id, settings)
+
+
+async def _run_once_then_dispose() -> int:
+    """Run one cycle and close async connections before the event loop ends."""
+    try:
+        return await run_once_async()
+    finally:
+        await dispose_async_engine()
+
+
+def run_once() -> int:
+    """Run one async cycle on a fresh event loop and return the number of checks."""
+    return asyncio.run(_run_once_then_dispose())
+
+
+async def _serve(settings: Settings) -> None:
+    """Run cycles forever on the current event loop, sleeping until the next item is due."""
+    session_factory = get_async_session_factory()
+    try:
+        while True:
+            processed = await run_once_async(settings)
+            async with session_factory() as db:
+                wait_seconds = sleep_seconds_until(await db.scalar(next_due_statement()), settings)
+            print(f"Worker cycle complete. Processed items: {processed}. Next check due in {wait_seconds:.0f}s")
+            await _sleep_until_due(session_factory, wait_seconds, settings)
+    finally:
+        await dispose_async_engine()
+
+
+async def _sleep_until_due(
+    session_factory: async_sessionmaker[AsyncSession],
+    wait_seconds: float,
+    settings: Settings,
+) -> None:
+    """Sleep ``wait_seconds``, waking early once a manual check job is pending."""
+    poll_seconds = settings.worker_job_poll_seconds
+    if poll_seconds <= 0:
+        await asyncio.sleep(wait_seconds)
+        return
+    deadline = monotonic() + wait_seconds
+    while (remaining := deadline - monotonic()) > 0:
+        await asyncio.sleep(min(poll_seconds, remaining))
+        async with session_factory() as db:
+            if await db.scalar(select(any_pending_job())):
+                return
+
+
+def main() -> None:
+    """Continuously process due watchlist items on one asyncio event loop."""
+    settings = load_settings()
+    if settings.db_auto_create:
+        create_all_tables()
+
+    run_once_mode_raw = os.getenv("WORKER_RUN_ONCE", "false").strip().lower()
+    run_once_mode = run_once_mode_raw in {"1", "true", "yes", "on"}
+
+    if run_once_mode:
+        processed = run_once()
+        print(f"Async worker one-shot complete. Processed items: {processed}")
+        return
+
+    print(f"Async worker started. Default check interval: {settings.worker_sleep_seconds} seconds")
+    asyncio.run(_serve(settings))
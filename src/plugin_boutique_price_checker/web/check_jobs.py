@@ -0,0 +1,107 @@
+"""Durable queue of manual check requests served by the workers.
+
+The API only records a ``queued`` job, so requests return before any page is
+fetched. A queued job makes its item claimable at once and puts it at the front
+of the next claim; claiming marks the item's queued jobs ``running``, and the
+batch that writes the item's run row marks them ``finished`` and links the run.
+Deactivating an item marks its pending jobs ``cancelled``, since workers only
+claim active items. Running jobs of an item whose lease lapsed count as pending
+again, so a worker crash never strands a job.
+"""
+
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import ColumnElement, Exists, Update, and_, bindparam, exists, or_, select, update
+from sqlalchemy.orm import Session
+
+from .orm_models import CheckJob, WatchlistItem, utc_now
+
+
+def _job_pending(now: datetime) -> ColumnElement[bool]:
+    """Match queued jobs, and running jobs whose worker let the item's lease lapse.
+
+    A worker that crashes after claiming leaves its jobs ``running``; once the
+    lease expires they are waiting again and the next claim picks them up.
+    """
+    return or_(
+        CheckJob.status == "queued",
+        and_(
+            CheckJob.status == "running",
+            or_(WatchlistItem.lease_expires_at.is_(None), WatchlistItem.lease_expires_at <= now),
+        ),
+    )
+
+
+def pending_job_exists(now: datetime) -> Exists:
+    """Return an EXISTS clause, correlated to ``WatchlistItem``, for items with a pending job."""
+    return (
+        select(CheckJob.id)
+        .where(CheckJob.watchlist_item_id == WatchlistItem.id, _job_pending(now))
+        .correlate(WatchlistItem)
+        .exists()
+    )
+
+
+def any_pending_job() -> ColumnElement[bool]:
+    """Return an EXISTS clause that is true while any active item has a pending job."""
+    return exists().where(
+        CheckJob.watchlist_item_id == WatchlistItem.id,
+        WatchlistItem.is_active.is_(True),
+        _job_pending(utc_now()),
+    )
+
+
+def enqueue_check(db: Session, item: WatchlistItem) -> CheckJob:
+    """Queue a check for ``item``, reusing a job that is still waiting for a worker."""
+    job = db.scalar(
+        select(CheckJob)
+        .where(CheckJob.watchlist_item_id == item.id, CheckJob.status == "queued")
+        .order_by(CheckJob.id)
+        .limit(1)
+    )
+    if job is None:
+        job = CheckJob(watchlist_item_id=item.id)
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+    return job
+
+
+def cancel_pending_jobs(db: Session, item: WatchlistItem) -> None:
+    """Cancel ``item``'s pending jobs; the caller commits."""
+    pending = (
+        select(CheckJob.id)
+        .join(WatchlistItem, CheckJob.watchlist_item_id == WatchlistItem.id)
+        .where(CheckJob.watchlist_item_id == item.id, _job_pending(utc_now()))
+    )
+    db.execute(
+        update(CheckJob)
+        .where(CheckJob.id.in_(pending.scalar_subquery()))
+        .values(status="cancelled", finished_at=utc_now())
+        .execution_options(synchronize_session=False)
+    )
+
+
+def start_jobs_statement(item_ids: Sequence[int]) -> Update:
+    """Build an UPDATE that marks queued jobs for freshly leased ``item_ids`` as running."""
+    return (
+        update(CheckJob)
+        .where(CheckJob.watchlist_item_id.in_(item_ids), CheckJob.status == "queued")
+        .values(status="running", started_at=utc_now())
+        .execution_options(synchronize_session=False)
+    )
+
+
+def finish_jobs_statement() -> Update:
+    """Build an UPDATE that finishes an item's running jobs with the run just written.
+
+    Execute it with ``{"item_id": ..., "run_id": ...}`` parameter sets, one per item.
+    Jobs queued after the item was leased stay queued for the next claim.
+    """
+    table = CheckJob.__table__
+    return (
+        update(table)
+        .where(table.c.watchlist_item_id == bindparam("item_id"), table.c.status == "running")
+        .values(status="finished", price_check_run_id=bindparam("run_id"), finished_at=utc_now())
+    )
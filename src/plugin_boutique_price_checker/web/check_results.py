@@ -0,0 +1,254 @@
+"""Check snapshots, outcomes and batched result writes shared by the workers.
+
+Workers load the fields a check needs once per leased batch, run checks without
+touching the database, and write finished outcomes in bulk: one multi-row
+insert of run rows, one bulk update of item prices, and one lease release per
+batch instead of a transaction and refresh per item.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from time import monotonic
+
+from sqlalchemy import Select, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from plugin_boutique_price_checker.models import PriceResult
+
+from .check_jobs import finish_jobs_statement
+from .database import SessionLocal
+from .leases import release_statement
+from .orm_models import PriceCheckRun, User, WatchlistItem, utc_now
+from .scheduler import PricePoint, group_price_history, next_check_time, recent_prices_statement
+from .settings import Settings
+
+
+@dataclass(frozen=True)
+class QueuedCheck:
+    """Item fields a check needs, detached from any session."""
+
+    item_id: int
+    product_url: str
+    threshold: float
+    user_email: str
+    last_alert_sent: bool
+    check_interval_seconds: int | None
+
+
+@dataclass(frozen=True)
+class CheckOutcome:
+    """Result of one check waiting to be written."""
+
+    item_id: int
+    threshold: float
+    check_interval_seconds: int | None
+    run_values: dict[str, object]
+    price: PriceResult | None
+    checked_at: datetime
+
+    @property
+    def status(self) -> str:
+        return str(self.run_values["status"])
+
+
+def queued_checks_statement(item_ids: Sequence[int]) -> Select:
+    """Build a SELECT of the check fields for ``item_ids``, one row per item in id order."""
+    last_alert_sent = (
+        select(PriceCheckRun.alert_sent)
+        .where(PriceCheckRun.watchlist_item_id == WatchlistItem.id)
+        .order_by(PriceCheckRun.id.desc())
+        .limit(1)
+        .correlate(WatchlistItem)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            WatchlistItem.id,
+            WatchlistItem.product_url,
+            WatchlistItem.threshold,
+            User.email,
+            last_alert_sent,
+            WatchlistItem.check_interval_seconds,
+        )
+        .join(User, WatchlistItem.user_id == User.id)
+        .where(WatchlistItem.id.in_(item_ids))
+        .order_by(WatchlistItem.id)
+    )
+
+
+def queued_checks(rows: Sequence[tuple]) -> list[QueuedCheck]:
+    """Turn rows from :func:`queued_checks_statement` into check snapshots."""
+    return [
+        QueuedCheck(
+            item_id=item_id,
+            product_url=product_url,
+            threshold=float(threshold),
+            user_email=email,
+            last_alert_sent=bool(alert_sent),
+            check_interval_seconds=interval_seconds,
+        )
+        for item_id, product_url, threshold, email, alert_sent, interval_seconds in rows
+    ]
+
+
+def success_outcome(
+    check: QueuedCheck,
+    price: PriceResult,
+    fetch_ms: int | None,
+    alert_sent: bool,
+    message: str,
+) -> CheckOutcome:
+    """Describe a successful check as a run row plus the price to store on its item."""
+    return _outcome(
+        check,
+        price,
+        {
+            "status": "success",
+            "message": message,
+            "price_amount": price.amount,
+            "price_currency": price.currency,
+            "alert_sent": alert_sent,
+            "fetch_tier": price.fetch_tier,
+            "duration_ms": fetch_ms,
+            "page_sha256": price.page_sha256,
+        },
+    )
+
+
+def error_outcome(check: QueuedCheck, exc: Exception, fetch_ms: int | None) -> CheckOutcome:
+    """Describe a failed check as an error run row."""
+    return _outcome(
+        check,
+        None,
+        {
+            "status": "error",
+            "message": str(exc),
+            "price_amount": None,
+            "price_currency": None,
+            "alert_sent": False,
+            "fetch_tier": None,
+            "duration_ms": fetch_ms,
+            "page_sha256": None,
+        },
+    )
+
+
+def _outcome(check: QueuedCheck, price: PriceResult | None, run_values: dict[str, object]) -> CheckOutcome:
+    return CheckOutcome(
+        item_id=check.item_id,
+        threshold=check.threshold,
+        check_interval_seconds=check.check_interval_seconds,
+        run_values={**run_values, "watchlist_item_id": check.item_id},
+        price=price,
+        checked_at=utc_now(),
+    )
+
+
+def write_outcomes(db: Session, batch: Sequence[CheckOutcome], worker_id: str, settings: Settings) -> None:
+    """Insert run rows, finish their check jobs, update checked items, and release and reschedule them.
+
+    Issues a fixed handful of statements per batch and leaves committing to the
+    caller, so the whole batch lands in one transaction. The async worker runs it
+    through ``AsyncSession.run_sync``. Outcomes for items deleted since they were
+    claimed are dropped, so one deletion cannot fail the rest of the batch.
+    """
+    item_ids = [entry.item_id for entry in batch]
+    existing = set(db.scalars(select(WatchlistItem.id).where(WatchlistItem.id.in_(item_ids))))
+    batch = [entry for entry in batch if entry.item_id in existing]
+    if not batch:
+        return
+    item_updates = [
+        {
+            "id": entry.item_id,
+            "last_price": entry.price.amount,
+            "last_currency": entry.price.currency,
+            "last_checked_at": entry.checked_at,
+        }
+        for entry in batch
+        if entry.price is not None
+    ]
+    run_ids = db.scalars(
+        insert(PriceCheckRun).returning(PriceCheckRun.id, sort_by_parameter_order=True),
+        [entry.run_values for entry in batch],
+    ).all()
+    db.execute(
+        finish_jobs_statement(),
+        [{"item_id": entry.item_id, "run_id": run_id} for entry, run_id in zip(batch, run_ids)],
+    )
+    if item_updates:
+        db.execute(update(WatchlistItem), item_updates)
+    histories: dict[int, list[PricePoint]] = {}
+    adaptive_ids = [entry.item_id for entry in batch if not entry.check_interval_seconds]
+    if settings.scheduler_adaptive and adaptive_ids:
+        # Read after the insert above, so each history includes the check just made.
+        histories = group_price_history(db.execute(recent_prices_statement(adaptive_ids)))
+    db.execute(
+        release_statement(worker_id),
+        [
+            {
+                "item_id": entry.item_id,
+                "due_at": next_check_time(
+                    entry.check_interval_seconds,
+                    settings,
+                    now=entry.checked_at,
+                    threshold=entry.threshold,
+                    history=histories.get(entry.item_id, []),
+                ),
+            }
+            for entry in batch
+        ],
+    )
+
+
+class ResultBatcher:
+    """Buffer check outcomes and write them in batches on a sync session.
+
+    A batch is written once ``batch_size`` outcomes are buffered or the oldest has
+    waited ``flush_seconds``; :meth:`flush` writes whatever is left. Not
+    thread-safe: the worker's scheduling thread owns it.
+    """
+
+    def __init__(self, worker_id: str, settings: Settings) -> None:
+        self.worker_id = worker_id
+        self.settings = settings
+        self.batch_size = max(1, settings.worker_write_batch_size)
+        self.flush_seconds = max(0.0, settings.worker_write_flush_seconds)
+        self._pending: list[CheckOutcome] = []
+        self._oldest_at: float | None = None
+
+    def add(self, outcome: CheckOutcome) -> None:
+        """Buffer one outcome, writing the batch when it is full or stale."""
+        if not self._pending:
+            self._oldest_at = monotonic()
+        self._pending.append(outcome)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+        else:
+            self.flush_if_stale()
+
+    def seconds_until_stale(self) -> float | None:
+        """Return how long the buffered outcomes may still wait, or ``None`` when empty."""
+        if self._oldest_at is None:
+            return None
+        return max(0.0, self.flush_seconds - (monotonic() - self._oldest_at))
+
+    def flush_if_stale(self) -> None:
+        """Write the buffer when its oldest outcome has waited ``flush_seconds``."""
+        if self.seconds_until_stale() == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write every buffered outcome in one transaction."""
+        if not self._pending:
+            return
+        batch, self._pending, self._oldest_at = self._pending, [], None
+        try:
+            with SessionLocal() as db, db.begin():
+                write_outcomes(db, batch, self.worker_id, self.settings)
+        except IntegrityError:
+            # An item was deleted between the existence check and the insert; the
+            # retry drops it and still releases every other lease.
+            with SessionLocal() as db, db.begin():
+                write_outcomes(db, batch, self.worker_id, self.settings)
@@ -1,11 +1,19 @@
 """SQLAlchemy setup for API and worker processes."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from sqlalchemy import create_engine
 from sqlalchemy import text
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from .settings import load_settings
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
 
 class Base(DeclarativeBase):
     """Base declarative model class."""
@@ -19,6 +27,47 @@ engine = create_engine(
 )
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
 
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def async_database_url(database_url: str) -> str:
+    """Return ``database_url`` rewritten to an asyncio-capable driver.
+
+    SQLite uses ``aiosqlite`` and PostgreSQL uses psycopg 3, whose dialect serves
+    both sync and async engines.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    elif url.get_backend_name() == "postgresql":
+        url = url.set(drivername="postgresql+psycopg")
+    return url.render_as_string(hide_password=False)
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Return the async session factory, creating the async engine on first use.
+
+    The engine and the asyncio extension are loaded lazily, so only the async
+    worker needs the ``async`` extra (greenlet and aiosqlite).
+    """
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    global _async_engine, _async_session_factory
+    if _async_session_factory is None:
+        _async_engine = create_async_engine(async_database_url(settings.database_url))
+        _async_session_factory = async_sessionmaker(_async_engine, autoflush=False, expire_on_commit=False)
+    return _async_session_factory
+
+
+async def dispose_async_engine() -> None:
+    """Close pooled async connections; call before the owning event loop ends."""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
+
 
 def create_all_tables() -> None:
     """Create all tables declared in ORM models."""
@@ -48,3 +97,41 @@ def _ensure_sqlite_schema_compat() -> None:
             conn.execute(text("ALTER TABLE users ADD COLUMN phone_verified_at DATETIME"))
         if "two_factor_enabled" not in existing:
             conn.execute(text("ALTER TABLE users ADD COLUMN two_factor_enabled BOOLEAN NOT NULL DEFAULT 0"))
+
+        item_columns = {row[1] for row in conn.execute(text("PRAGMA table_info(watchlist_items)")).fetchall()}
+        if item_columns and "lease_owner" not in item_columns:
+            conn.execute(text("ALTER TABLE watchlist_items ADD COLUMN lease_owner VARCHAR(64)"))
+        if item_columns and "lease_expires_at" not in item_columns:
+            conn.execute(text("ALTER TABLE watchlist_items ADD COLUMN lease_expires_at DATETIME"))
+        if item_columns:
+            # Unconditional, so databases upgraded before the index was added here get it too.
+            conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_watchlist_items_lease_expires_at "
+                    "ON watchlist_items (lease_expires_at)"
+                )
+            )
+        if item_columns and "check_interval_seconds" not in item_columns:
+            conn.execute(text("ALTER TABLE watchlist_items ADD COLUMN check_interval_seconds INTEGER"))
+        if item_columns and "next_check_at" not in item_columns:
+            conn.execute(text("ALTER TABLE watchlist_items ADD COLUMN next_check_at DATETIME"))
+            conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_watchlist_items_active_next_check_at "
+                    "ON watchlist_items (is_active, next_check_at)"
+                )
+            )
+
+        run_columns = {row[1] for row in conn.execute(text("PRAGMA table_info(price_check_runs)")).fetchall()}
+        if run_columns and "fetch_tier" not in run_columns:
+            conn.execute(text("ALTER TABLE price_check_runs ADD COLUMN fetch_tier VARCHAR(16)"))
+        if run_columns and "duration_ms" not in run_columns:
+            conn.execute(text("ALTER TABLE price_check_runs ADD COLUMN duration_ms INTEGER"))
+        if run_columns and "page_sha256" not in run_columns:
+            conn.execute(text("ALTER TABLE price_check_runs ADD COLUMN page_sha256 VARCHAR(64)"))
+
+        cache_columns = {row[1] for row in conn.execute(text("PRAGMA table_info(page_cache_entries)")).fetchall()}
+        if cache_columns and "content_fingerprint" not in cache_columns:
+            conn.execute(text("ALTER TABLE page_cache_entries ADD COLUMN content_fingerprint VARCHAR(64)"))
+        if cache_columns and "extraction_hint" not in cache_columns:
+            conn.execute(text("ALTER TABLE page_cache_entries ADD COLUMN extraction_hint VARCHAR(64)"))
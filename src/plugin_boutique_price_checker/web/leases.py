@@ -0,0 +1,134 @@
+"""Lease protocol that lets several workers share watchlist checks without overlap.
+
+A worker claims a batch of due items by stamping them with its id and a lease
+expiry. Other workers skip leased items until the lease is released or expires, so
+the items of a crashed worker come back after at most one lease period. Releasing
+after a check records the item's next due time. Items with a queued manual check
+job, or a job left running by a worker whose lease lapsed, are due at once and
+claimed first; claiming starts their jobs.
+
+The statement builders are shared by the sync and async workers; the helpers
+below them run the statements on a sync session.
+"""
+
+from datetime import datetime, timedelta
+import os
+import socket
+
+from sqlalchemy import Update, bindparam, or_, select, update
+from sqlalchemy.orm import Session
+
+from .check_jobs import pending_job_exists, start_jobs_statement
+from .orm_models import WatchlistItem, utc_now
+from .settings import Settings
+
+
+def worker_identity(settings: Settings) -> str:
+    """Return the lease owner id for this process: ``WORKER_ID`` or ``host-pid``."""
+    return (settings.worker_id or f"{socket.gethostname()}-{os.getpid()}")[:64]
+
+
+def claim_statement(worker_id: str, limit: int, lease_seconds: float) -> Update:
+    """Build an UPDATE ... RETURNING that leases up to ``limit`` due, unleased active items.
+
+    Items with a pending check job come first, then items in due order with
+    never-scheduled items ahead of the rest.
+
+    On PostgreSQL the candidate rows are picked with ``FOR UPDATE SKIP LOCKED``, so
+    concurrent claims never wait on or take each other's rows. SQLite has no row
+    locks and renders no ``FOR UPDATE``; it runs the single UPDATE under its
+    database write lock, which makes the claim just as exclusive.
+    """
+    now = utc_now()
+    has_job = pending_job_exists(now)
+    claimable = (
+        WatchlistItem.is_active.is_(True),
+        or_(WatchlistItem.next_check_at.is_(None), WatchlistItem.next_check_at <= now, has_job),
+        or_(WatchlistItem.lease_expires_at.is_(None), WatchlistItem.lease_expires_at <= now),
+    )
+    candidates = (
+        select(WatchlistItem.id)
+        .where(*claimable)
+        .order_by(has_job.desc(), WatchlistItem.next_check_at.asc().nulls_first(), WatchlistItem.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return (
+        update(WatchlistItem)
+        .where(WatchlistItem.id.in_(candidates.scalar_subquery()), *claimable)
+        .values(
+            lease_owner=worker_id,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+            # Lease bookkeeping is not a user-visible change to the item.
+            updated_at=WatchlistItem.updated_at,
+        )
+        .returning(WatchlistItem.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def renew_statement(worker_id: str, item_ids: list[int], lease_seconds: float) -> Update:
+    """Build an UPDATE ... RETURNING that extends this worker's leases on ``item_ids``.
+
+    Items another worker has claimed since are left alone and not returned.
+    """
+    return (
+        update(WatchlistItem)
+        .where(WatchlistItem.id.in_(item_ids), WatchlistItem.lease_owner == worker_id)
+        .values(
+            lease_expires_at=utc_now() + timedelta(seconds=lease_seconds),
+            updated_at=WatchlistItem.updated_at,
+        )
+        .returning(WatchlistItem.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def release_statement(worker_id: str) -> Update:
+    """Build an UPDATE that gives up this worker's lease on one item and schedules it.
+
+    Execute it with ``{"item_id": ..., "due_at": ...}`` parameter sets, one per item;
+    a ``None`` due time makes the item due immediately.
+    """
+    table = WatchlistItem.__table__
+    return (
+        update(table)
+        .where(table.c.id == bindparam("item_id"), table.c.lease_owner == worker_id)
+        .values(
+            lease_owner=None,
+            lease_expires_at=None,
+            next_check_at=bindparam("due_at"),
+            updated_at=table.c.updated_at,
+        )
+    )
+
+
+def renewal_interval_seconds(lease_seconds: float) -> float:
+    """Return how often a worker renews the leases it still holds: three times per lease."""
+    return max(1.0, lease_seconds / 3)
+
+
+def claim_items(db: Session, worker_id: str, limit: int, lease_seconds: float) -> list[int]:
+    """Lease up to ``limit`` free active items to ``worker_id``, start their jobs, and return their ids."""
+    item_ids = sorted(db.scalars(claim_statement(worker_id, limit, lease_seconds)).all())
+    if item_ids:
+        db.execute(start_jobs_statement(item_ids))
+    db.commit()
+    return item_ids
+
+
+def renew_leases(db: Session, worker_id: str, item_ids: list[int], lease_seconds: float) -> list[int]:
+    """Extend this worker's leases and return the ids it still holds."""
+    held = sorted(db.scalars(renew_statement(worker_id, item_ids, lease_seconds)).all())
+    db.commit()
+    return held
+
+
+def release_leases(db: Session, worker_id: str, next_checks: dict[int, datetime | None]) -> None:
+    """Give up this worker's leases and set each item's next due time."""
+    if next_checks:
+        db.execute(
+            release_statement(worker_id),
+            [{"item_id": item_id, "due_at": due_at} for item_id, due_at in next_checks.items()],
+        )
+    db.commit()
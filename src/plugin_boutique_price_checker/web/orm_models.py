@@ -2,7 +2,7 @@
 
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .database import Base
@@ -35,6 +35,7 @@ class WatchlistItem(Base):
     """URL + threshold item monitored by the worker."""
 
     __tablename__ = "watchlist_items"
+    __table_args__ = (Index("ix_watchlist_items_active_next_check_at", "is_active", "next_check_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
@@ -44,6 +45,10 @@ class WatchlistItem(Base):
     last_price: Mapped[float | None] = mapped_column(Float, nullable=True)
     last_currency: Mapped[str | None] = mapped_column(String(4), nullable=True)
     last_checked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    check_interval_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    next_check_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    lease_owner: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -68,11 +73,58 @@ class PriceCheckRun(Base):
     price_amount: Mapped[float | None] = mapped_column(Float, nullable=True)
     price_currency: Mapped[str | None] = mapped_column(String(4), nullable=True)
     alert_sent: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    fetch_tier: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    duration_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    page_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
 
     watchlist_item: Mapped[WatchlistItem] = relationship(back_populates="runs")
 
 
+class CheckJob(Base):
+    """Manual check request queued by the API and run by a worker.
+
+    Jobs move from ``queued`` to ``running`` when a worker leases the item and to
+    ``finished`` once the run row is written.
+    """
+
+    __tablename__ = "check_jobs"
+    __table_args__ = (Index("ix_check_jobs_status_watchlist_item_id", "status", "watchlist_item_id"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    watchlist_item_id: Mapped[int] = mapped_column(ForeignKey("watchlist_items.id"), nullable=False, index=True)
+    status: Mapped[str] = mapped_column(String(16), default="queued", nullable=False)
+    price_check_run_id: Mapped[int | None] = mapped_column(ForeignKey("price_check_runs.id"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utc_now, nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    run: Mapped[PriceCheckRun | None] = relationship()
+
+
+class PageCacheEntry(Base):
+    """HTTP validators and last extracted price for one canonical product URL."""
+
+    __tablename__ = "page_cache_entries"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    url_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
+    canonical_url: Mapped[str] = mapped_column(Text, nullable=False)
+    etag: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    price_amount: Mapped[float] = mapped_column(Float, nullable=False)
+    price_currency: Mapped[str] = mapped_column(String(4), nullable=False)
+    extractor: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    content_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    extraction_hint: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utc_now,
+        onupdate=utc_now,
+        nullable=False,
+    )
+
+
 class AuthCode(Base):
     """One-time code used for email verification and phone 2FA."""
 
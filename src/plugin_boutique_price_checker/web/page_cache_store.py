@@ -0,0 +1,63 @@
+"""Database-backed page cache used for conditional HTTP product fetches."""
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from plugin_boutique_price_checker.models import PriceResult
+from plugin_boutique_price_checker.page_cache import CachedPage, canonical_product_url, url_cache_key
+
+from .database import SessionLocal
+from .orm_models import PageCacheEntry
+
+
+class DatabasePageCache:
+    """Store page validators and last prices in ``page_cache_entries``.
+
+    Each call uses its own short-lived session so one cache instance can be shared
+    by every check in a worker cycle.
+    """
+
+    def get(self, url: str) -> CachedPage | None:
+        """Return the cached entry for a product URL, if any."""
+        db = SessionLocal()
+        try:
+            entry = db.scalar(select(PageCacheEntry).where(PageCacheEntry.url_hash == url_cache_key(url)))
+            if entry is None:
+                return None
+            return CachedPage(
+                etag=entry.etag,
+                last_modified=entry.last_modified,
+                price=PriceResult(
+                    amount=entry.price_amount,
+                    currency=entry.price_currency,
+                    extractor=entry.extractor,
+                    extraction_hint=entry.extraction_hint,
+                ),
+                fingerprint=entry.content_fingerprint,
+            )
+        finally:
+            db.close()
+
+    def put(self, url: str, page: CachedPage) -> None:
+        """Insert or update the cached entry for a product URL."""
+        db = SessionLocal()
+        try:
+            url_hash = url_cache_key(url)
+            entry = db.scalar(select(PageCacheEntry).where(PageCacheEntry.url_hash == url_hash))
+            if entry is None:
+                entry = PageCacheEntry(url_hash=url_hash, canonical_url=canonical_product_url(url))
+            entry.etag = page.etag
+            entry.last_modified = page.last_modified
+            entry.price_amount = page.price.amount
+            entry.price_currency = page.price.currency
+            entry.extractor = page.price.extractor
+            entry.content_fingerprint = page.fingerprint
+            entry.extraction_hint = page.price.extraction_hint
+            db.add(entry)
+            try:
+                db.commit()
+            except IntegrityError:
+                # Another worker inserted the same URL first; its entry is just as fresh.
+                db.rollback()
+        finally:
+            db.close()
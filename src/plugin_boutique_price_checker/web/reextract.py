@@ -0,0 +1,120 @@
+"""CLI entrypoint that re-runs price extraction over the page archive in parallel."""
+
+import argparse
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+import json
+import multiprocessing
+import os
+from pathlib import Path
+
+from sqlalchemy import select, update
+
+from plugin_boutique_price_checker.page_archive import PageArchive, digest_from_path, read_archived_page
+from plugin_boutique_price_checker.selenium_scraper import PluginBoutiqueSeleniumScraper
+
+from .database import SessionLocal
+from .orm_models import PriceCheckRun
+from .settings import load_settings
+
+
+@dataclass
+class ReextractedPage:
+    """Outcome of re-running extraction on one archived page."""
+
+    page_sha256: str
+    amount: float | None = None
+    currency: str | None = None
+    extractor: str | None = None
+    error: str | None = None
+
+
+def _reextract_file(path: Path) -> ReextractedPage:
+    """Decompress and extract one archived page; runs inside a pool worker."""
+    digest = digest_from_path(path)
+    try:
+        price = PluginBoutiqueSeleniumScraper._extract_price(read_archived_page(path))
+    except (OSError, UnicodeDecodeError, RuntimeError) as exc:
+        return ReextractedPage(page_sha256=digest, error=str(exc))
+    return ReextractedPage(
+        page_sha256=digest,
+        amount=price.amount,
+        currency=price.currency,
+        extractor=price.extractor,
+    )
+
+
+def reextract_archive(archive: PageArchive, workers: int, chunksize: int = 64) -> Iterator[ReextractedPage]:
+    """Re-extract every archived page across ``workers`` processes.
+
+    Workers receive file paths rather than HTML, so pages are read and decompressed
+    in parallel. Results are yielded as they finish, not in archive order.
+    """
+    if workers <= 1:
+        yield from map(_reextract_file, archive.iter_paths())
+        return
+    with multiprocessing.Pool(processes=workers) as pool:
+        yield from pool.imap_unordered(_reextract_file, archive.iter_paths(), chunksize=chunksize)
+
+
+def _stored_prices() -> dict[str, tuple[float, str]]:
+    """Return the stored run price for every archived page digest."""
+    db = SessionLocal()
+    try:
+        stmt = select(PriceCheckRun.page_sha256, PriceCheckRun.price_amount, PriceCheckRun.price_currency).where(
+            PriceCheckRun.page_sha256.is_not(None),
+            PriceCheckRun.price_amount.is_not(None),
+        )
+        return {digest: (amount, currency) for digest, amount, currency in db.execute(stmt)}
+    finally:
+        db.close()
+
+
+def _backfill(changed: list[ReextractedPage]) -> None:
+    """Overwrite stored run prices with re-extracted ones."""
+    db = SessionLocal()
+    try:
+        for page in changed:
+            db.execute(
+                update(PriceCheckRun)
+                .where(PriceCheckRun.page_sha256 == page.page_sha256)
+                .values(price_amount=page.amount, price_currency=page.currency)
+            )
+        db.commit()
+    finally:
+        db.close()
+
+
+def main() -> None:
+    """Re-extract archived pages and report prices that differ from stored runs."""
+    parser = argparse.ArgumentParser(description="Re-run price extraction over archived product pages.")
+    parser.add_argument("--archive-dir", default=load_settings().page_archive_dir, help="Defaults to PAGE_ARCHIVE_DIR")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Extraction processes")
+    parser.add_argument("--chunksize", type=int, default=64, help="Pages handed to a worker at a time")
+    parser.add_argument("--output", type=Path, help="Write one JSON line per page to this file")
+    parser.add_argument("--backfill", action="store_true", help="Update stored run prices that changed")
+    args = parser.parse_args()
+    if not args.archive_dir:
+        parser.error("--archive-dir or PAGE_ARCHIVE_DIR is required")
+
+    stored = _stored_prices()
+    total = failed = 0
+    changed: list[ReextractedPage] = []
+    output = args.output.open("w", encoding="utf-8") if args.output else None
+    try:
+        for page in reextract_archive(PageArchive(args.archive_dir), args.workers, args.chunksize):
+            total += 1
+            if page.error is not None:
+                failed += 1
+            elif page.page_sha256 in stored and stored[page.page_sha256] != (page.amount, page.currency):
+                changed.append(page)
+            if output is not None:
+                output.write(json.dumps(asdict(page)) + "\n")
+    finally:
+        if output is not None:
+            output.close()
+
+    print(f"Re-extracted {total} pages: {failed} failed, {len(changed)} differ from stored runs")
+    if args.backfill and changed:
+        _backfill(changed)
+        print(f"Backfilled prices for {len(changed)} pages")
@@ -0,0 +1,173 @@
+"""Due-time scheduling for watchlist checks."""
+
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Select, case, func, select
+from sqlalchemy.orm import Session
+
+from .orm_models import PriceCheckRun, WatchlistItem, utc_now
+from .settings import Settings
+
+PricePoint = tuple[datetime, float]
+_HISTORY_RUNS = 50
+# An item that has been flat for N days is checked about every N hours.
+_CHECKS_PER_STABLE_PERIOD = 24
+
+
+def check_interval(
+    item_interval_seconds: int | None,
+    settings: Settings,
+    threshold: float | None = None,
+    history: Sequence[PricePoint] = (),
+    now: datetime | None = None,
+) -> timedelta:
+    """Return the time until an item's next check.
+
+    An item's own ``check_interval_seconds`` always wins. Otherwise, with
+    ``SCHEDULER_ADAPTIVE`` on and some price ``history``, the interval adapts to
+    how recently the price moved and how close it is to ``threshold``; without
+    history it is ``WORKER_SLEEP_SECONDS``.
+    """
+    if item_interval_seconds:
+        return timedelta(seconds=item_interval_seconds)
+    if not settings.scheduler_adaptive or not history or threshold is None:
+        return timedelta(seconds=settings.worker_sleep_seconds)
+    return adaptive_interval(history, threshold, settings, now or utc_now())
+
+
+def adaptive_interval(history: Sequence[PricePoint], threshold: float, settings: Settings, now: datetime) -> timedelta:
+    """Derive a check interval from recent successful prices, newest first.
+
+    An item whose price last moved ``N`` days ago is checked about every ``N``
+    hours. An item with no move in its history is never checked more often than
+    ``WORKER_SLEEP_SECONDS``. Within ``SCHEDULER_NEAR_THRESHOLD_PERCENT`` above
+    the threshold, the interval shrinks linearly towards the minimum. The result
+    is clamped to ``SCHEDULER_MIN_INTERVAL_SECONDS`` and
+    ``SCHEDULER_MAX_INTERVAL_SECONDS``.
+    """
+    minimum = float(settings.scheduler_min_interval_seconds)
+    maximum = max(minimum, float(settings.scheduler_max_interval_seconds))
+    base = min(maximum, max(minimum, float(settings.worker_sleep_seconds)))
+
+    changed_at = next(
+        (newer_at for (newer_at, newer), (_, older) in zip(history, history[1:]) if newer != older),
+        None,
+    )
+    if changed_at is None:
+        stable_seconds = (now - _as_utc(history[-1][0])).total_seconds()
+        seconds = max(base, stable_seconds / _CHECKS_PER_STABLE_PERIOD)
+    else:
+        seconds = (now - _as_utc(changed_at)).total_seconds() / _CHECKS_PER_STABLE_PERIOD
+
+    near_ratio = settings.scheduler_near_threshold_percent / 100
+    gap_ratio = (history[0][1] - threshold) / threshold if threshold > 0 else float("inf")
+    if near_ratio > 0 and 0 <= gap_ratio <= near_ratio:
+        seconds = minimum + (min(seconds, base) - minimum) * gap_ratio / near_ratio
+
+    return timedelta(seconds=min(maximum, max(minimum, seconds)))
+
+
+def next_check_time(
+    item_interval_seconds: int | None,
+    settings: Settings,
+    now: datetime | None = None,
+    threshold: float | None = None,
+    history: Sequence[PricePoint] = (),
+) -> datetime:
+    """Return when an item checked at ``now`` is due again."""
+    now = now or utc_now()
+    return now + check_interval(item_interval_seconds, settings, threshold=threshold, history=history, now=now)
+
+
+def recent_prices_statement(item_ids: Sequence[int]) -> Select:
+    """Build a query for the latest successful prices of ``item_ids``, newest first per item."""
+    ranked = (
+        select(
+            PriceCheckRun.watchlist_item_id,
+            PriceCheckRun.created_at,
+            PriceCheckRun.price_amount,
+            func.row_number()
+            .over(partition_by=PriceCheckRun.watchlist_item_id, order_by=PriceCheckRun.id.desc())
+            .label("recency"),
+        )
+        .where(
+            PriceCheckRun.watchlist_item_id.in_(item_ids),
+            PriceCheckRun.status == "success",
+            PriceCheckRun.price_amount.is_not(None),
+        )
+        .subquery()
+    )
+    return (
+        select(ranked.c.watchlist_item_id, ranked.c.created_at, ranked.c.price_amount)
+        .where(ranked.c.recency <= _HISTORY_RUNS)
+        .order_by(ranked.c.watchlist_item_id, ranked.c.recency)
+    )
+
+
+def group_price_history(rows: Iterable[tuple[int, datetime, float]]) -> dict[int, list[PricePoint]]:
+    """Group ``recent_prices_statement`` rows into per-item histories."""
+    histories: dict[int, list[PricePoint]] = {}
+    for item_id, created_at, amount in rows:
+        histories.setdefault(item_id, []).append((created_at, amount))
+    return histories
+
+
+def next_check_time_for(db: Session, item: WatchlistItem, settings: Settings, now: datetime | None = None) -> datetime:
+    """Return an item's next due time, reading its price history when the interval adapts."""
+    history: list[PricePoint] = []
+    if settings.scheduler_adaptive and not item.check_interval_seconds:
+        history = group_price_history(db.execute(recent_prices_statement([item.id]))).get(item.id, [])
+    return next_check_time(
+        item.check_interval_seconds,
+        settings,
+        now=now,
+        threshold=float(item.threshold),
+        history=history,
+    )
+
+
+def reschedule(db: Session, item: WatchlistItem, settings: Settings) -> None:
+    """Recompute an item's due time after its interval changed, counting from its last check."""
+    if item.last_checked_at is None:
+        item.next_check_at = None
+    else:
+        item.next_check_at = next_check_time_for(db, item, settings, now=_as_utc(item.last_checked_at))
+
+
+def next_due_statement() -> Select:
+    """Build a query for the earliest time any active item can next be claimed.
+
+    Unleased items are due at ``next_check_at``; items never scheduled count as due
+    since creation. Leased items come back when their lease expires.
+    """
+    due_at = case(
+        (
+            WatchlistItem.lease_owner.is_(None),
+            func.coalesce(WatchlistItem.next_check_at, WatchlistItem.created_at),
+        ),
+        else_=WatchlistItem.lease_expires_at,
+    )
+    return select(func.min(due_at)).where(WatchlistItem.is_active.is_(True))
+
+
+def seconds_until_next_due(db: Session, settings: Settings) -> float:
+    """Return how long the worker may sleep before an item is due.
+
+    The wait is capped at ``WORKER_SLEEP_SECONDS`` so items added in the meantime
+    are picked up, and floored at one second so a busy watchlist never spins.
+    """
+    return sleep_seconds_until(db.scalar(next_due_statement()), settings)
+
+
+def sleep_seconds_until(due_at: datetime | None, settings: Settings) -> float:
+    """Clamp the wait until ``due_at`` to between one second and ``WORKER_SLEEP_SECONDS``."""
+    if due_at is None:
+        return float(settings.worker_sleep_seconds)
+    wait = (_as_utc(due_at) - utc_now()).total_seconds()
+    return min(float(settings.worker_sleep_seconds), max(1.0, wait))
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Attach UTC to naive datetimes, which SQLite returns for timezone-aware columns."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
@@ -31,6 +31,7 @@ class WatchlistItemCreate(BaseModel):
     product_url: str = Field(min_length=1)
     threshold: float = Field(gt=0)
     is_active: bool = True
+    check_interval_seconds: int | None = Field(default=None, ge=60)
 
 
 class WatchlistItemUpdate(BaseModel):
@@ -38,6 +39,7 @@ class WatchlistItemUpdate(BaseModel):
 
     threshold: float | None = Field(default=None, gt=0)
     is_active: bool | None = None
+    check_interval_seconds: int | None = Field(default=None, ge=60)
 
 
 class WatchlistItemRead(BaseModel):
@@ -53,6 +55,8 @@ class WatchlistItemRead(BaseModel):
     last_price: float | None
     last_currency: str | None
     last_checked_at: datetime | None
+    check_interval_seconds: int | None = None
+    next_check_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -69,9 +73,27 @@ class PriceCheckRunRead(BaseModel):
     price_amount: float | None
     price_currency: str | None
     alert_sent: bool
+    fetch_tier: str | None = None
+    duration_ms: int | None = None
+    page_sha256: str | None = None
     created_at: datetime
 
 
+class CheckJobRead(BaseModel):
+    """API response for a queued manual check and, once finished, its run."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    watchlist_item_id: int
+    status: str
+    price_check_run_id: int | None
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+    run: PriceCheckRunRead | None = None
+
+
 class AuthRegisterStart(BaseModel):
     """Start registration with email and phone."""
 
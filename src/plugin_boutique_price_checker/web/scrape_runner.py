@@ -1,16 +1,25 @@
-"""Shared check runner used by API-triggered and worker-triggered checks."""
+"""Scraper, notifier and alert decisions shared by the worker processes."""
 
-from sqlalchemy.orm import Session
+from collections.abc import Callable
+import threading
 
 from plugin_boutique_price_checker.email_notifier import EmailNotifier
+from plugin_boutique_price_checker.models import PriceResult
+from plugin_boutique_price_checker.page_archive import PageArchive
+from plugin_boutique_price_checker.rate_limiter import HostRateLimiter
+from plugin_boutique_price_checker.resilience import CircuitBreaker, RetryPolicy
 from plugin_boutique_price_checker.selenium_scraper import PluginBoutiqueSeleniumScraper
 
-from .orm_models import PriceCheckRun, WatchlistItem, utc_now
-from .settings import load_settings
-from .database import SessionLocal
+from .page_cache_store import DatabasePageCache
+from .settings import Settings, load_settings
 
+_rate_limiter: HostRateLimiter | None = None
+_circuit_breaker: CircuitBreaker | None = None
+_shared_lock = threading.Lock()
 
-def _build_notifier_if_configured() -> EmailNotifier | None:
+
+def build_notifier_if_configured() -> EmailNotifier | None:
+    """Return an SMTP notifier when alert email settings are complete, else ``None``."""
     settings = load_settings()
     if not settings.smtp_address or not settings.email_address or not settings.email_password:
         return None
@@ -21,64 +30,93 @@ def _build_notifier_if_configured() -> EmailNotifier | None:
     )
 
 
-def run_check_for_item(db: Session, item: WatchlistItem) -> PriceCheckRun:
-    """Execute one check, persist run row, and optionally send alert email."""
-    scraper = PluginBoutiqueSeleniumScraper(headless=True)
-    notifier = _build_notifier_if_configured()
-
-    try:
-        price = scraper.get_price(item.product_url)
-        item.last_price = price.amount
-        item.last_currency = price.currency
-        item.last_checked_at = utc_now()
-
-        alert_sent = False
-        message = "Price checked successfully; no alert sent."
-        if price.amount < float(item.threshold):
-            if notifier is None:
-                message = "Price below threshold, but SMTP settings are missing; alert skipped."
-            else:
-                notifier.send_price_alert(
-                    to_email=item.user.email,
-                    product_url=item.product_url,
-                    price=price,
-                    threshold=float(item.threshold),
-                )
-                alert_sent = True
-                message = "Price below threshold and alert email sent."
-
-        run = PriceCheckRun(
-            watchlist_item_id=item.id,
-            status="success",
-            message=message,
-            price_amount=price.amount,
-            price_currency=price.currency,
-            alert_sent=alert_sent,
-        )
-    except Exception as exc:  # pragma: no cover - broad catch is deliberate for worker robustness
-        run = PriceCheckRun(
-            watchlist_item_id=item.id,
-            status="error",
-            message=str(exc),
-            price_amount=None,
-            price_currency=None,
-            alert_sent=False,
-        )
-
-    db.add(run)
-    db.add(item)
-    db.commit()
-    db.refresh(run)
-    return run
-
-
-def run_check_by_id(item_id: int) -> PriceCheckRun:
-    """Open a session and run one check by watchlist item id."""
-    db = SessionLocal()
-    try:
-        item = db.get(WatchlistItem, item_id)
-        if item is None:
-            raise RuntimeError(f"Watchlist item {item_id} not found")
-        return run_check_for_item(db, item)
-    finally:
-        db.close()
+def get_rate_limiter(settings: Settings | None = None) -> HostRateLimiter | None:
+    """Return the process-wide per-host rate limiter, or ``None`` when disabled.
+
+    Every check in a process shares this instance, so concurrent scrapers in one
+    process draw from the same per-host budget.
+    """
+    global _rate_limiter
+    settings = settings or load_settings()
+    if settings.scraper_host_rate_per_second <= 0:
+        return None
+    with _shared_lock:
+        if _rate_limiter is None:
+            _rate_limiter = HostRateLimiter(
+                rate_per_second=settings.scraper_host_rate_per_second,
+                burst=settings.scraper_host_burst,
+                max_rate_per_second=settings.scraper_host_rate_per_second * 5,
+                concurrency=min(2, settings.scraper_host_max_concurrency),
+                max_concurrency=settings.scraper_host_max_concurrency,
+                # Browser loads routinely take seconds; only near-timeout loads signal congestion.
+                latency_target_seconds=20,
+            )
+        return _rate_limiter
+
+
+def get_circuit_breaker(settings: Settings | None = None) -> CircuitBreaker:
+    """Return the process-wide per-host circuit breaker shared by all checks."""
+    global _circuit_breaker
+    settings = settings or load_settings()
+    with _shared_lock:
+        if _circuit_breaker is None:
+            _circuit_breaker = CircuitBreaker(
+                failure_threshold=settings.scraper_circuit_failure_threshold,
+                reset_timeout_seconds=settings.scraper_circuit_reset_seconds,
+            )
+        return _circuit_breaker
+
+
+def _build_scraper(driver_pool_size: int = 0, settings: Settings | None = None) -> PluginBoutiqueSeleniumScraper:
+    """Build a headless scraper configured from settings."""
+    settings = settings or load_settings()
+    return PluginBoutiqueSeleniumScraper(
+        headless=True,
+        driver_pool_size=driver_pool_size,
+        max_pages_per_driver=settings.scraper_max_pages_per_driver,
+        http_first=settings.scraper_http_first,
+        block_resources=settings.scraper_block_resources,
+        blocked_url_patterns=settings.scraper_blocked_url_patterns,
+        eager_page_load=settings.scraper_eager_page_load,
+        poll_interval_seconds=settings.scraper_poll_interval_seconds,
+        page_cache=DatabasePageCache() if settings.scraper_page_cache else None,
+        page_archive=PageArchive(settings.page_archive_dir) if settings.page_archive_dir else None,
+        browser_backend=settings.scraper_browser_backend,
+        rate_limiter=get_rate_limiter(settings),
+        retry_policy=RetryPolicy(
+            max_attempts=max(1, settings.scraper_retry_attempts),
+            base_delay_seconds=settings.scraper_retry_base_delay_seconds,
+        ),
+        circuit_breaker=get_circuit_breaker(settings),
+        max_driver_age_seconds=settings.scraper_max_driver_age_seconds or None,
+        max_driver_rss_mb=settings.scraper_max_driver_rss_mb or None,
+    )
+
+
+def build_cycle_scraper(settings: Settings | None = None) -> PluginBoutiqueSeleniumScraper:
+    """Build a scraper whose warm driver pool is reused for a whole worker cycle."""
+    settings = settings or load_settings()
+    return _build_scraper(driver_pool_size=settings.scraper_pool_size, settings=settings)
+
+
+def plan_alert(
+    price: PriceResult,
+    threshold: float,
+    notifier_configured: bool,
+    last_run_sent_alert: Callable[[], bool],
+) -> tuple[bool, str]:
+    """Decide whether a successful check should email an alert, and the run message.
+
+    ``last_run_sent_alert`` is only called for unchanged pages below the threshold,
+    so callers can defer the lookup it needs.
+    """
+    if price.amount >= threshold:
+        if price.unchanged:
+            return False, "Page unchanged since last check; no alert sent."
+        return False, "Price checked successfully; no alert sent."
+    if price.unchanged and last_run_sent_alert():
+        return False, "Page unchanged since last alert; alert not repeated."
+    if not notifier_configured:
+        return False, "Price below threshold, but SMTP settings are missing; alert skipped."
+    return True, "Price below threshold and alert email sent."
+
@@ -13,6 +13,36 @@ class Settings:
     email_address: str | None
     email_password: str | None
     worker_sleep_seconds: int
+    worker_concurrency: int
+    worker_async_concurrency: int
+    worker_write_batch_size: int
+    worker_write_flush_seconds: float
+    worker_id: str | None
+    worker_lease_seconds: float
+    worker_job_poll_seconds: float
+    scheduler_adaptive: bool
+    scheduler_min_interval_seconds: int
+    scheduler_max_interval_seconds: int
+    scheduler_near_threshold_percent: float
+    scraper_pool_size: int
+    scraper_max_pages_per_driver: int
+    scraper_max_driver_age_seconds: float
+    scraper_max_driver_rss_mb: int
+    scraper_http_first: bool
+    scraper_block_resources: bool
+    scraper_blocked_url_patterns_raw: str
+    scraper_eager_page_load: bool
+    scraper_poll_interval_seconds: float
+    scraper_page_cache: bool
+    page_archive_dir: str | None
+    scraper_browser_backend: str
+    scraper_host_rate_per_second: float
+    scraper_host_burst: int
+    scraper_host_max_concurrency: int
+    scraper_retry_attempts: int
+    scraper_retry_base_delay_seconds: float
+    scraper_circuit_failure_threshold: int
+    scraper_circuit_reset_seconds: float
     auth_dev_mode: bool
     auth_code_ttl_minutes: int
     auth_session_ttl_hours: int
@@ -36,18 +66,59 @@ class Settings:
             return []
         return [origin.strip() for origin in self.cors_allowed_origins_raw.split(",") if origin.strip()]
 
+    @property
+    def scraper_blocked_url_patterns(self) -> list[str] | None:
+        """Return configured lean-page blocklist, or ``None`` to use the scraper defaults."""
+        patterns = [pattern.strip() for pattern in self.scraper_blocked_url_patterns_raw.split(",") if pattern.strip()]
+        return patterns or None
+
 
 def load_settings() -> Settings:
     """Read settings from environment variables with safe defaults."""
     auth_dev_mode_raw = os.getenv("AUTH_DEV_MODE", "true").strip().lower()
     auth_cookie_secure_raw = os.getenv("AUTH_COOKIE_SECURE", "false").strip().lower()
     db_auto_create_raw = os.getenv("DB_AUTO_CREATE", "true").strip().lower()
+    scraper_http_first_raw = os.getenv("SCRAPER_HTTP_FIRST", "true").strip().lower()
+    scraper_block_resources_raw = os.getenv("SCRAPER_BLOCK_RESOURCES", "false").strip().lower()
+    scraper_eager_page_load_raw = os.getenv("SCRAPER_EAGER_PAGE_LOAD", "false").strip().lower()
+    scraper_page_cache_raw = os.getenv("SCRAPER_PAGE_CACHE", "true").strip().lower()
+    scheduler_adaptive_raw = os.getenv("SCHEDULER_ADAPTIVE", "true").strip().lower()
     return Settings(
         database_url=os.getenv("DATABASE_URL", "sqlite:///./plugin_boutique.db"),
         smtp_address=os.getenv("SMTP_ADDRESS"),
         email_address=os.getenv("EMAIL_ADDRESS"),
         email_password=os.getenv("EMAIL_PASSWORD"),
         worker_sleep_seconds=int(os.getenv("WORKER_SLEEP_SECONDS", "300")),
+        worker_concurrency=int(os.getenv("WORKER_CONCURRENCY", "1")),
+        worker_async_concurrency=int(os.getenv("WORKER_ASYNC_CONCURRENCY", "32")),
+        worker_write_batch_size=int(os.getenv("WORKER_WRITE_BATCH_SIZE", "50")),
+        worker_write_flush_seconds=float(os.getenv("WORKER_WRITE_FLUSH_SECONDS", "5")),
+        worker_id=os.getenv("WORKER_ID") or None,
+        worker_lease_seconds=float(os.getenv("WORKER_LEASE_SECONDS", "600")),
+        worker_job_poll_seconds=float(os.getenv("WORKER_JOB_POLL_SECONDS", "2")),
+        scheduler_adaptive=scheduler_adaptive_raw in {"1", "true", "yes", "on"},
+        scheduler_min_interval_seconds=int(os.getenv("SCHEDULER_MIN_INTERVAL_SECONDS", "300")),
+        scheduler_max_interval_seconds=int(os.getenv("SCHEDULER_MAX_INTERVAL_SECONDS", "86400")),
+        scheduler_near_threshold_percent=float(os.getenv("SCHEDULER_NEAR_THRESHOLD_PERCENT", "10")),
+        scraper_pool_size=int(os.getenv("SCRAPER_POOL_SIZE", "1")),
+        scraper_max_pages_per_driver=int(os.getenv("SCRAPER_MAX_PAGES_PER_DRIVER", "50")),
+        scraper_max_driver_age_seconds=float(os.getenv("SCRAPER_MAX_DRIVER_AGE_SECONDS", "1800")),
+        scraper_max_driver_rss_mb=int(os.getenv("SCRAPER_MAX_DRIVER_RSS_MB", "1024")),
+        scraper_http_first=scraper_http_first_raw in {"1", "true", "yes", "on"},
+        scraper_block_resources=scraper_block_resources_raw in {"1", "true", "yes", "on"},
+        scraper_blocked_url_patterns_raw=os.getenv("SCRAPER_BLOCKED_URL_PATTERNS", ""),
+        scraper_eager_page_load=scraper_eager_page_load_raw in {"1", "true", "yes", "on"},
+        scraper_poll_interval_seconds=float(os.getenv("SCRAPER_POLL_INTERVAL_SECONDS", "0.2")),
+        scraper_page_cache=scraper_page_cache_raw in {"1", "true", "yes", "on"},
+        page_archive_dir=os.getenv("PAGE_ARCHIVE_DIR") or None,
+        scraper_browser_backend=os.getenv("SCRAPER_BROWSER_BACKEND", "selenium").strip().lower(),
+        scraper_host_rate_per_second=float(os.getenv("SCRAPER_HOST_RATE_PER_SECOND", "1.0")),
+        scraper_host_burst=int(os.getenv("SCRAPER_HOST_BURST", "3")),
+        scraper_host_max_concurrency=int(os.getenv("SCRAPER_HOST_MAX_CONCURRENCY", "4")),
+        scraper_retry_attempts=int(os.getenv("SCRAPER_RETRY_ATTEMPTS", "3")),
+        scraper_retry_base_delay_seconds=float(os.getenv("SCRAPER_RETRY_BASE_DELAY_SECONDS", "2.0")),
+        scraper_circuit_failure_threshold=int(os.getenv("SCRAPER_CIRCUIT_FAILURE_THRESHOLD", "5")),
+        scraper_circuit_reset_seconds=float(os.getenv("SCRAPER_CIRCUIT_RESET_SECONDS", "300")),
         auth_dev_mode=auth_dev_mode_raw in {"1", "true", "yes", "on"},
         auth_code_ttl_minutes=int(os.getenv("AUTH_CODE_TTL_MINUTES", "10")),
         auth_session_ttl_hours=int(os.getenv("AUTH_SESSION_TTL_HOURS", "168")),
@@ -11,6 +11,9 @@ const itemsContainer = document.getElementById("items-container");
 const runsContainer = document.getElementById("runs-container");
 const runsHint = document.getElementById("runs-hint");
 const statusBox = document.getElementById("status");
+// Scheduled workers may only pick a queued check up on their next run.
+const CHECK_POLL_INTERVAL_MS = 2000;
+const CHECK_POLL_TIMEOUT_MS = 120000;
 
 function notify(message, isError = false) {
   statusBox.textContent = message;
@@ -125,7 +128,19 @@ function renderItems() {
 
     element.querySelector(".run-btn").addEventListener("click", async () => {
       try {
-        await request(`/me/watchlist-items/${item.id}/check`, { method: "POST" });
+        let job = await request(`/me/watchlist-items/${item.id}/check`, { method: "POST" });
+        notify(`Check queued for item ${item.id}`);
+        const deadline = Date.now() + CHECK_POLL_TIMEOUT_MS;
+        while (job.status === "queued" || job.status === "running") {
+          if (Date.now() >= deadline) {
+            throw new Error(`Check for item ${item.id} is still ${job.status}; it will run with the next worker cycle`);
+          }
+          await new Promise((resolve) => window.setTimeout(resolve, CHECK_POLL_INTERVAL_MS));
+          job = await request(`/me/check-jobs/${job.id}`);
+        }
+        if (job.status !== "finished") {
+          throw new Error(`Check for item ${item.id} was ${job.status}`);
+        }
         notify(`Check completed for item ${item.id}`);
         await loadItems();
       } catch (error) {
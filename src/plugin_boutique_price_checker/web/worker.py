@@ -1,32 +1,221 @@
 """Background worker scaffold that polls active watchlist items."""
 
-from time import sleep
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from time import monotonic, perf_counter, sleep
 import os
+import threading
 
 from sqlalchemy import select
 
+from plugin_boutique_price_checker.email_notifier import EmailNotifier
+from plugin_boutique_price_checker.selenium_scraper import PluginBoutiqueSeleniumScraper
+
+from .check_jobs import any_pending_job
+from .check_results import (
+    CheckOutcome,
+    QueuedCheck,
+    ResultBatcher,
+    error_outcome,
+    queued_checks,
+    queued_checks_statement,
+    success_outcome,
+)
 from .database import SessionLocal, create_all_tables
-from .orm_models import WatchlistItem
-from .scrape_runner import run_check_for_item
-from .settings import load_settings
+from .leases import claim_items, renew_leases, renewal_interval_seconds, worker_identity
+from .scheduler import seconds_until_next_due
+from .scrape_runner import (
+    build_cycle_scraper,
+    build_notifier_if_configured,
+    get_circuit_breaker,
+    get_rate_limiter,
+    plan_alert,
+)
+from .settings import Settings, load_settings
 
 
 def run_once() -> int:
-    """Run checks for all active watchlist items one time."""
-    db = SessionLocal()
-    processed = 0
+    """Check every due watchlist item this worker can lease, reusing warm browsers.
+
+    Items are leased in small batches in due order, so any number of workers can
+    share a watchlist without checking the same item twice. Checks run on
+    ``WORKER_CONCURRENCY`` threads, each keeping its own scraper for the whole
+    cycle; results are written in batches rather than one transaction per check.
+    """
+    settings = load_settings()
+    started = perf_counter()
+    statuses, scrapers = _run_items(worker_identity(settings), settings)
+    processed = len(statuses)
+    errors = statuses.count("error")
+    print(
+        f"Cycle: {processed} processed, {errors} errors in {perf_counter() - started:.1f}s "
+        f"with concurrency {max(1, settings.worker_concurrency)}"
+    )
+    print_scraper_stats(scrapers)
+    print_rate_limits()
+    return processed
+
+
+def _run_items(worker_id: str, settings: Settings) -> tuple[list[str], list[PluginBoutiqueSeleniumScraper]]:
+    """Lease and check items on a bounded thread pool; return run statuses plus the scrapers used.
+
+    A new batch is leased whenever a thread frees up, so at most about two batches
+    are held at once and the rest of the watchlist stays available to other workers.
+    Leases on items not yet checked are renewed three times per lease period.
+    Check threads never touch the database: this thread loads each leased batch in
+    one query and hands finished outcomes to a :class:`ResultBatcher`.
+    """
+    concurrency = max(1, settings.worker_concurrency)
+    scrapers: list[PluginBoutiqueSeleniumScraper] = []
+    scrapers_lock = threading.Lock()
+    local = threading.local()
+    notifier = build_notifier_if_configured()
+    results = ResultBatcher(worker_id, settings)
+
+    def thread_scraper() -> PluginBoutiqueSeleniumScraper:
+        scraper = getattr(local, "scraper", None)
+        if scraper is None:
+            scraper = build_cycle_scraper(settings)
+            local.scraper = scraper
+            with scrapers_lock:
+                scrapers.append(scraper)
+        return scraper
+
+    def claim() -> list[QueuedCheck] | None:
+        """Lease the next batch and load its check fields; ``None`` once nothing is due."""
+        db = SessionLocal()
+        try:
+            item_ids = claim_items(db, worker_id, concurrency, settings.worker_lease_seconds)
+            if not item_ids:
+                return None
+            return queued_checks(db.execute(queued_checks_statement(item_ids)).all())
+        finally:
+            db.close()
+
+    def renew(item_ids: list[int]) -> None:
+        db = SessionLocal()
+        try:
+            renew_leases(db, worker_id, item_ids, settings.worker_lease_seconds)
+        finally:
+            db.close()
+
+    renew_every = renewal_interval_seconds(settings.worker_lease_seconds)
+    statuses: list[str] = []
     try:
-        items = list(db.scalars(select(WatchlistItem).where(WatchlistItem.is_active.is_(True))).all())
-        for item in items:
-            run_check_for_item(db, item)
-            processed += 1
-        return processed
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="check") as pool:
+            in_flight: dict[Future[CheckOutcome], int] = {}
+            exhausted = False
+            renew_at = monotonic() + renew_every
+            while True:
+                if not exhausted and len(in_flight) < concurrency:
+                    checks = claim()
+                    exhausted = checks is None
+                    for check in checks or []:
+                        in_flight[pool.submit(_check_item, check, thread_scraper, notifier)] = check.item_id
+                if not in_flight:
+                    break
+                if monotonic() >= renew_at:
+                    # Slow checks can keep queued items waiting longer than a lease.
+                    renew(sorted(in_flight.values()))
+                    renew_at = monotonic() + renew_every
+                # Wake up in time to write a stale batch or renew leases while every check is slow.
+                stale_in = results.seconds_until_stale()
+                timeout = max(0.0, renew_at - monotonic())
+                done, _ = wait(
+                    in_flight,
+                    timeout=timeout if stale_in is None else min(timeout, stale_in),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    del in_flight[future]
+                    outcome = future.result()
+                    statuses.append(outcome.status)
+                    results.add(outcome)
+                results.flush_if_stale()
+            results.flush()
     finally:
-        db.close()
+        for scraper in scrapers:
+            scraper.close()
+    return statuses, scrapers
+
+
+def _check_item(
+    check: QueuedCheck,
+    scraper_factory: Callable[[], PluginBoutiqueSeleniumScraper],
+    notifier: EmailNotifier | None,
+) -> CheckOutcome:
+    """Fetch one price on a pool thread, send its alert if due, and describe the run to store."""
+    fetch_ms: int | None = None
+    try:
+        started = perf_counter()
+        try:
+            price = scraper_factory().get_price(check.product_url)
+        finally:
+            fetch_ms = int((perf_counter() - started) * 1000)
+
+        alert_sent, message = plan_alert(
+            price,
+            check.threshold,
+            notifier_configured=notifier is not None,
+            last_run_sent_alert=lambda: check.last_alert_sent,
+        )
+        if alert_sent and notifier is not None:
+            notifier.send_price_alert(
+                to_email=check.user_email,
+                product_url=check.product_url,
+                price=price,
+                threshold=check.threshold,
+            )
+        return success_outcome(check, price, fetch_ms, alert_sent, message)
+    except Exception as exc:  # pragma: no cover - broad catch is deliberate for worker robustness
+        return error_outcome(check, exc, fetch_ms)
+
+
+def print_scraper_stats(scrapers: list[PluginBoutiqueSeleniumScraper]) -> None:
+    """Print cache, resilience and driver-recycling counters summed over a cycle's scrapers."""
+    cache_stats: Counter[str] = Counter()
+    fetch_stats: Counter[str] = Counter()
+    recycle_stats: Counter[str] = Counter()
+    for scraper in scrapers:
+        cache_stats.update(scraper.cache_stats)
+        fetch_stats.update(scraper.fetch_stats)
+        if scraper.driver_pool is not None:
+            recycle_stats.update(scraper.driver_pool.recycle_stats)
+
+    print(
+        f"Page cache: {cache_stats['hit']} hits, {cache_stats['miss']} misses, "
+        f"{cache_stats['unchanged']} unchanged pages, "
+        f"{cache_stats['hint_hit']} hint hits, {cache_stats['hint_miss']} hint misses"
+    )
+    print(
+        f"Fetch resilience: {fetch_stats['retry']} retries, "
+        f"{fetch_stats['circuit_open']} checks skipped by open circuits"
+    )
+    for host, failures in get_circuit_breaker().open_hosts().items():
+        print(f"Circuit open for {host} after {failures} consecutive failures")
+    if recycle_stats:
+        print(
+            f"Driver recycling: {recycle_stats['pages']} by page count, {recycle_stats['age']} by age, "
+            f"{recycle_stats['rss']} by memory, {recycle_stats['crash']} after crashes"
+        )
+
+
+def print_rate_limits() -> None:
+    """Print the adaptive per-host rate limits reached during the cycle."""
+    limiter = get_rate_limiter()
+    if limiter is None:
+        return
+    for host, metrics in limiter.metrics().items():
+        print(
+            f"Rate limit {host}: {metrics['rate_per_second']}/s, concurrency {metrics['concurrency_limit']}, "
+            f"{metrics['in_flight']} in flight, queue depth {metrics['queue_depth']}, "
+            f"{metrics['throttled']} throttled fetches"
+        )
 
 
 def main() -> None:
-    """Continuously process active watchlist items with a fixed sleep interval."""
+    """Continuously process watchlist items, sleeping until the next one is due."""
     settings = load_settings()
     if settings.db_auto_create:
         create_all_tables()
@@ -39,8 +228,30 @@ def main() -> None:
         print(f"Worker one-shot complete. Processed items: {processed}")
         return
 
-    print(f"Worker started. Poll interval: {settings.worker_sleep_seconds} seconds")
+    print(f"Worker started. Default check interval: {settings.worker_sleep_seconds} seconds")
     while True:
         processed = run_once()
-        print(f"Worker cycle complete. Processed items: {processed}")
-        sleep(settings.worker_sleep_seconds)
+        db = SessionLocal()
+        try:
+            wait_seconds = seconds_until_next_due(db, settings)
+        finally:
+            db.close()
+        print(f"Worker cycle complete. Processed items: {processed}. Next check due in {wait_seconds:.0f}s")
+        _sleep_until_due(wait_seconds, settings)
+
+
+def _sleep_until_due(wait_seconds: float, settings: Settings) -> None:
+    """Sleep ``wait_seconds``, waking early once a manual check job is pending."""
+    poll_seconds = settings.worker_job_poll_seconds
+    if poll_seconds <= 0:
+        sleep(wait_seconds)
+        return
+    deadline = monotonic() + wait_seconds
+    while (remaining := deadline - monotonic()) > 0:
+        sleep(min(poll_seconds, remaining))
+        db = SessionLocal()
+        try:
+            if db.scalar(select(any_pending_job())):
+                return
+        finally:
+            db.close()
@@ -1,8 +1,71 @@
-"""Test configuration for local package imports."""
+"""Test configuration for local package imports and shared web fixtures."""
 
+from collections.abc import Callable, Sequence
+import importlib
 from pathlib import Path
 import sys
+from types import SimpleNamespace
+
+import pytest
 
 SRC_PATH = Path(__file__).resolve().parents[1] / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
+
+# Reloaded in dependency order, so statements built at import time (correlated
+# subqueries, bound sessions) point at the freshly configured database.
+_WEB_MODULES = {
+    "settings": "settings",
+    "database": "database",
+    "orm": "orm_models",
+    "jobs": "check_jobs",
+    "leases": "leases",
+    "scheduler": "scheduler",
+    "store": "page_cache_store",
+    "runner": "scrape_runner",
+    "results": "check_results",
+    "worker": "worker",
+    "async_worker": "async_worker",
+}
+
+
+@pytest.fixture
+def web_env(monkeypatch, tmp_path) -> Callable[..., SimpleNamespace]:
+    """Return a factory that reloads the web modules against a temp SQLite DB and seeds it.
+
+    Call it with the items to seed and any extra environment; it returns the
+    reloaded modules as attributes named after the keys of ``_WEB_MODULES``.
+    """
+
+    def build(
+        name: str,
+        item_urls: Sequence[str],
+        inactive_url: str | None = None,
+        env: dict[str, str] | None = None,
+    ) -> SimpleNamespace:
+        monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / f'{name}.db'}")
+        for key, value in (env or {}).items():
+            monkeypatch.setenv(key, value)
+        for key in ("SMTP_ADDRESS", "EMAIL_ADDRESS", "EMAIL_PASSWORD"):
+            monkeypatch.delenv(key, raising=False)
+
+        modules = {
+            attr: importlib.reload(importlib.import_module(f"plugin_boutique_price_checker.web.{module}"))
+            for attr, module in _WEB_MODULES.items()
+        }
+        web = SimpleNamespace(**modules)
+        web.database.create_all_tables()
+
+        db = web.database.SessionLocal()
+        user = web.orm.User(email=f"{name}@example.com")
+        db.add(user)
+        db.flush()
+        for url in item_urls:
+            db.add(web.orm.WatchlistItem(user_id=user.id, product_url=url, threshold=1))
+        if inactive_url is not None:
+            db.add(web.orm.WatchlistItem(user_id=user.id, product_url=inactive_url, threshold=1, is_active=False))
+        db.commit()
+        db.close()
+        return web
+
+    return build
@@ -20,6 +20,7 @@ def client(monkeypatch, tmp_path):
 
     import plugin_boutique_price_checker.web.api as api_module
     import plugin_boutique_price_checker.web.auth as auth_module
+    import plugin_boutique_price_checker.web.check_jobs as jobs_module
     import plugin_boutique_price_checker.web.database as database_module
     import plugin_boutique_price_checker.web.deps as deps_module
     import plugin_boutique_price_checker.web.orm_models as orm_models_module
@@ -31,6 +32,7 @@ def client(monkeypatch, tmp_path):
     importlib.reload(orm_models_module)
     importlib.reload(deps_module)
     importlib.reload(auth_module)
+    importlib.reload(jobs_module)
     importlib.reload(schemas_module)
     importlib.reload(api_module)
 
@@ -96,6 +98,44 @@ def test_registration_login_and_me_watchlist_flow(client: TestClient) -> None:
     assert float(update_item_response.json()["threshold"]) == 49.99
     assert update_item_response.json()["is_active"] is False
 
+    interval_response = client.patch(
+        f"/me/watchlist-items/{item_id}",
+        headers=auth_headers,
+        json={"check_interval_seconds": 3600},
+    )
+    assert interval_response.status_code == 200
+    assert interval_response.json()["check_interval_seconds"] == 3600
+    assert interval_response.json()["next_check_at"] is None
+    assert float(interval_response.json()["threshold"]) == 49.99
+
+    inactive_check_response = client.post(f"/me/watchlist-items/{item_id}/check", headers=auth_headers)
+    assert inactive_check_response.status_code == 400
+
+    client.patch(f"/me/watchlist-items/{item_id}", headers=auth_headers, json={"is_active": True})
+    check_response = client.post(f"/me/watchlist-items/{item_id}/check", headers=auth_headers)
+    assert check_response.status_code == 202
+    job = check_response.json()
+    assert job["watchlist_item_id"] == item_id
+    assert job["status"] == "queued"
+    assert job["run"] is None
+
+    repeat_response = client.post(f"/me/watchlist-items/{item_id}/check", headers=auth_headers)
+    assert repeat_response.status_code == 202
+    assert repeat_response.json()["id"] == job["id"]
+
+    job_response = client.get(f"/me/check-jobs/{job['id']}", headers=auth_headers)
+    assert job_response.status_code == 200
+    assert job_response.json()["status"] == "queued"
+
+    other_token = _register_and_get_token(client, "mallory@example.com", "+15550001111")
+    other_job_response = client.get(f"/me/check-jobs/{job['id']}", headers={"Authorization": f"Bearer {other_token}"})
+    assert other_job_response.status_code == 404
+
+    client.patch(f"/me/watchlist-items/{item_id}", headers=auth_headers, json={"is_active": False})
+    cancelled_response = client.get(f"/me/check-jobs/{job['id']}", headers=auth_headers)
+    assert cancelled_response.json()["status"] == "cancelled"
+    assert cancelled_response.json()["finished_at"] is not None
+
     delete_item_response = client.delete(f"/me/watchlist-items/{item_id}", headers=auth_headers)
     assert delete_item_response.status_code == 204
 
@@ -0,0 +1,134 @@
+"""Tests for the asyncio worker pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+import time
+
+import httpx
+import pytest
+
+from plugin_boutique_price_checker.models import PriceResult
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+
+@pytest.fixture
+def async_worker_env(web_env):
+    """Reload web modules against a temp SQLite DB and return the async worker module."""
+    web = web_env(
+        "async_worker",
+        [
+            "https://shop.example/broken" if index == 0 else f"https://shop.example/p{index}" for index in range(8)
+        ],
+        inactive_url="https://shop.example/off",
+        env={"WORKER_ASYNC_CONCURRENCY": "8", "WORKER_WRITE_BATCH_SIZE": "3"},
+    )
+    return web.async_worker, web.database, web.orm
+
+
+class SlowAsyncFakeScraper:
+    def __init__(self) -> None:
+        self.cache_stats: Counter[str] = Counter()
+        self.fetch_stats: Counter[str] = Counter()
+        self.driver_pool = None
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.closed = False
+
+    def build_async_http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(lambda _request: httpx.Response(500)))
+
+    async def get_price_async(self, url: str, client: httpx.AsyncClient) -> PriceResult:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.1)
+        finally:
+            self.in_flight -= 1
+        if url.endswith("broken"):
+            raise RuntimeError("No currency-like prices found in page source")
+        return PriceResult(amount=25.0, currency="$", fetch_tier="http")
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_run_once_checks_items_concurrently_and_writes_in_batches(async_worker_env, monkeypatch, capsys) -> None:
+    async_worker_module, database_module, orm_models_module = async_worker_env
+    scraper = SlowAsyncFakeScraper()
+    monkeypatch.setattr(async_worker_module, "build_cycle_scraper", lambda settings: scraper)
+    batch_sizes: list[int] = []
+    write_batch = async_worker_module._write_batch
+
+    async def recording_write_batch(session_factory, batch, *args) -> None:
+        batch_sizes.append(len(batch))
+        await write_batch(session_factory, batch, *args)
+
+    monkeypatch.setattr(async_worker_module, "_write_batch", recording_write_batch)
+
+    started = time.perf_counter()
+    processed = async_worker_module.run_once()
+    elapsed = time.perf_counter() - started
+
+    assert processed == 8
+    # Eight 100 ms checks as concurrent tasks finish in about one round.
+    assert elapsed < 0.6
+    assert scraper.peak_in_flight > 1
+    assert scraper.closed
+    assert batch_sizes == [3, 3, 2]
+    assert "Cycle: 8 processed, 1 errors" in capsys.readouterr().out
+
+    db = database_module.SessionLocal()
+    try:
+        runs = db.query(orm_models_module.PriceCheckRun).all()
+        checked = db.query(orm_models_module.WatchlistItem).filter_by(last_price=25.0).count()
+    finally:
+        db.close()
+    assert Counter(run.status for run in runs) == {"success": 7, "error": 1}
+    assert all(run.duration_ms is not None for run in runs)
+    assert checked == 7
+
+
+def test_renewer_extends_leases_only_on_items_still_waiting(async_worker_env, monkeypatch) -> None:
+    async_worker_module, database_module, orm_models_module = async_worker_env
+    import plugin_boutique_price_checker.web.leases as leases_module
+
+    settings = async_worker_module.load_settings()
+    db = database_module.SessionLocal()
+    try:
+        claimed = leases_module.claim_items(db, "worker-a", limit=2, lease_seconds=60)
+        before = {
+            item.id: item.lease_expires_at
+            for item in db.query(orm_models_module.WatchlistItem).filter(
+                orm_models_module.WatchlistItem.id.in_(claimed)
+            )
+        }
+    finally:
+        db.close()
+    monkeypatch.setattr(async_worker_module, "renewal_interval_seconds", lambda lease_seconds: 0.01)
+
+    async def renew_briefly() -> None:
+        renewer = asyncio.create_task(
+            async_worker_module._renew_held_leases(
+                {claimed[0]}, database_module.get_async_session_factory(), "worker-a", settings
+            )
+        )
+        await asyncio.sleep(0.1)
+        renewer.cancel()
+        await database_module.dispose_async_engine()
+
+    asyncio.run(renew_briefly())
+
+    db = database_module.SessionLocal()
+    try:
+        after = {item.id: item for item in db.query(orm_models_module.WatchlistItem).filter(
+            orm_models_module.WatchlistItem.id.in_(claimed)
+        )}
+    finally:
+        db.close()
+    assert after[claimed[0]].lease_expires_at > before[claimed[0]]
+    assert after[claimed[1]].lease_expires_at == before[claimed[1]]
+    assert after[claimed[0]].lease_owner == "worker-a"
@@ -0,0 +1,178 @@
+"""Tests for the DevTools-protocol browser backend."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+from plugin_boutique_price_checker.cdp_browser import CdpBrowser
+from plugin_boutique_price_checker.models import PriceResult
+from plugin_boutique_price_checker.selenium_scraper import PluginBoutiqueSeleniumScraper
+
+
+class FakeSocket:
+    def __init__(self, html: str, navigate_error: str | None = None) -> None:
+        self.html = html
+        self.navigate_error = navigate_error
+        self.sent: list[dict] = []
+        self.pending: list[dict] = []
+
+    def send(self, payload: str) -> None:
+        message = json.loads(payload)
+        self.sent.append(message)
+        method = message["method"]
+        result: dict = {}
+        if method == "Target.createTarget":
+            result = {"targetId": "T1"}
+        elif method == "Target.attachToTarget":
+            result = {"sessionId": "S1"}
+        elif method == "Page.navigate":
+            result = {"frameId": "F1"}
+            if self.navigate_error:
+                result["errorText"] = self.navigate_error
+            else:
+                # Events can arrive before the command reply and must be buffered.
+                self.pending.append({"method": "Page.loadEventFired", "sessionId": "S1", "params": {}})
+        elif method == "Runtime.evaluate":
+            result = {"result": {"type": "string", "value": self.html}}
+        self.pending.append({"id": message["id"], "result": result})
+
+    def recv(self) -> str:
+        return json.dumps(self.pending.pop(0))
+
+    def settimeout(self, _timeout: float) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+def _browser_with(socket: FakeSocket, blocked: list[str] | None = None) -> CdpBrowser:
+    browser = CdpBrowser(blocked_url_patterns=blocked)
+    browser._socket = socket
+    browser._ensure_started = lambda: None
+    return browser
+
+
+def test_fetch_html_drives_a_fresh_target_and_closes_it() -> None:
+    socket = FakeSocket("<html><body>$12.00</body></html>")
+    browser = _browser_with(socket, blocked=["*.png"])
+
+    html = browser.fetch_html("https://example.com/product", timeout_seconds=5)
+
+    assert html == "<html><body>$12.00</body></html>"
+    methods = [message["method"] for message in socket.sent]
+    assert methods == [
+        "Target.createTarget",
+        "Target.attachToTarget",
+        "Page.enable",
+        "Network.enable",
+        "Network.setBlockedURLs",
+        "Page.navigate",
+        "Runtime.evaluate",
+        "Target.closeTarget",
+    ]
+    assert socket.sent[4]["params"] == {"urls": ["*.png"]}
+    assert all(message.get("sessionId") == "S1" for message in socket.sent[2:7])
+
+
+def test_fetch_html_raises_on_navigation_error_and_still_closes_target() -> None:
+    socket = FakeSocket("", navigate_error="net::ERR_NAME_NOT_RESOLVED")
+    browser = _browser_with(socket)
+
+    with pytest.raises(RuntimeError, match="ERR_NAME_NOT_RESOLVED"):
+        browser.fetch_html("https://invalid.example", timeout_seconds=5)
+
+    assert socket.sent[-1]["method"] == "Target.closeTarget"
+
+
+def test_scraper_cdp_backend_skips_selenium(monkeypatch) -> None:
+    class FakeCdpBrowser:
+        def __init__(self, **_kwargs) -> None:
+            self.closed = False
+
+        def fetch_html(self, url: str, timeout_seconds: float, ready_script: str | None = None) -> str:
+            return "<button>Add to Cart</button><span>£19.00</span>"
+
+        def close(self) -> None:
+            self.closed = True
+
+    import plugin_boutique_price_checker.selenium_scraper as scraper_module
+
+    monkeypatch.setattr(scraper_module, "CdpBrowser", FakeCdpBrowser)
+    monkeypatch.setattr(
+        PluginBoutiqueSeleniumScraper,
+        "_build_driver",
+        lambda self: pytest.fail("Selenium must not start with the cdp backend"),
+    )
+
+    with PluginBoutiqueSeleniumScraper(browser_backend="cdp", driver_pool_size=2) as scraper:
+        price = scraper.get_price("https://example.com/product")
+        browser = scraper._cdp_browser
+
+    assert price == PriceResult(amount=19.0, currency="£")
+    assert price.fetch_tier == "cdp"
+    assert scraper.driver_pool is None
+    assert browser.closed is True
+    with pytest.raises(ValueError):
+        PluginBoutiqueSeleniumScraper(browser_backend="playwright")
+
+
+def test_relaunch_stops_the_old_chromium_before_starting_a_new_one(monkeypatch, tmp_path) -> None:
+    import plugin_boutique_price_checker.cdp_browser as cdp_module
+
+    class FakeProcess:
+        def __init__(self, args, **_kwargs) -> None:
+            self.calls: list[str] = []
+            (tmp_path / "DevToolsActivePort").write_text("9222\n/devtools/browser/x\n")
+            launched.append(self)
+
+        def poll(self) -> int | None:
+            return None
+
+        def terminate(self) -> None:
+            self.calls.append("terminate")
+
+        def wait(self, timeout: float | None = None) -> int:
+            self.calls.append("wait")
+            return 0
+
+    launched: list[FakeProcess] = []
+    monkeypatch.setattr(cdp_module.subprocess, "Popen", FakeProcess)
+    monkeypatch.setattr(cdp_module, "resolve_chrome_binary", lambda _path: "chromium")
+    monkeypatch.setattr(cdp_module.websocket, "create_connection", lambda *_args, **_kwargs: FakeSocket(""))
+
+    browser = CdpBrowser()
+    browser._profile_dir = str(tmp_path)
+    browser._ensure_started()
+    # Disconnected websocket: the next page load must relaunch.
+    browser._socket = None
+    browser._ensure_started()
+
+    assert len(launched) == 2
+    assert launched[0].calls == ["terminate", "wait"]
+    assert launched[1].calls == []
+
+
+def test_scraper_starts_one_cdp_browser_across_threads(monkeypatch) -> None:
+    import plugin_boutique_price_checker.selenium_scraper as scraper_module
+
+    created: list[object] = []
+
+    class SlowCdpBrowser:
+        def __init__(self, **_kwargs) -> None:
+            time.sleep(0.05)
+            created.append(self)
+
+    monkeypatch.setattr(scraper_module, "CdpBrowser", SlowCdpBrowser)
+    scraper = PluginBoutiqueSeleniumScraper(browser_backend="cdp")
+    threads = [threading.Thread(target=scraper._get_cdp_browser) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
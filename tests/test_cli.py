@@ -215,8 +215,13 @@ def test_main_single_url_mode_builds_services_and_checks(monkeypatch) -> None:
 
 def test_main_watchlist_mode_uses_item_or_default_recipient(monkeypatch) -> None:
     class FakeScraper:
-        def __init__(self, headless: bool) -> None:
+        def __init__(self, headless: bool, driver_pool_size: int = 0) -> None:
             self.headless = headless
+            self.driver_pool_size = driver_pool_size
+            self.closed = False
+
+        def close(self) -> None:
+            self.closed = True
 
     class FakeNotifier:
         def __init__(self, smtp_address: str, email_address: str, app_password: str) -> None:
@@ -269,6 +274,8 @@ def test_main_watchlist_mode_uses_item_or_default_recipient(monkeypatch) -> None
     cli.main()
 
     assert created["scraper"].headless is False
+    assert created["scraper"].driver_pool_size == 1
+    assert created["scraper"].closed is True
     assert created["service"].calls == [
         ("https://example.com/a", 10.0, "fallback@example.com"),
         ("https://example.com/b", 20.0, "item@example.com"),
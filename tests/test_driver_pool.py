@@ -0,0 +1,173 @@
+"""Unit tests for the reusable Chrome WebDriver pool."""
+
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from plugin_boutique_price_checker.driver_pool import ChromeDriverPool
+
+
+class FakeDriver:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.quit_called = False
+        self.alive = True
+
+    @property
+    def current_url(self) -> str:
+        if not self.alive:
+            raise WebDriverException("session deleted")
+        return "about:blank"
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
+def _factory(created: list[FakeDriver]):
+    def build() -> FakeDriver:
+        driver = FakeDriver(f"driver-{len(created)}")
+        created.append(driver)
+        return driver
+
+    return build
+
+
+def test_lease_reuses_warm_driver() -> None:
+    created: list[FakeDriver] = []
+    pool = ChromeDriverPool(_factory(created), size=1)
+
+    with pool.lease() as first:
+        pass
+    with pool.lease() as second:
+        pass
+
+    assert first is second
+    assert len(created) == 1
+    assert first.quit_called is False
+
+
+def test_driver_replaced_after_max_pages() -> None:
+    created: list[FakeDriver] = []
+    pool = ChromeDriverPool(_factory(created), size=1, max_pages_per_driver=2)
+
+    for _ in range(3):
+        with pool.lease():
+            pass
+
+    assert len(created) == 2
+    assert created[0].quit_called is True
+    assert created[1].quit_called is False
+
+
+def test_multi_page_lease_counts_every_page() -> None:
+    created: list[FakeDriver] = []
+    pool = ChromeDriverPool(_factory(created), size=1, max_pages_per_driver=3)
+
+    with pool.lease(pages=3):
+        pass
+    with pool.lease():
+        pass
+
+    assert len(created) == 2
+    assert created[0].quit_called is True
+
+
+def test_driver_replaced_after_crash_but_not_after_timeout() -> None:
+    created: list[FakeDriver] = []
+    pool = ChromeDriverPool(_factory(created), size=1)
+
+    with pytest.raises(TimeoutException):
+        with pool.lease():
+            raise TimeoutException("slow page")
+    assert len(created) == 1
+
+    with pytest.raises(WebDriverException):
+        with pool.lease():
+            raise WebDriverException("chrome not reachable")
+    assert created[0].quit_called is True
+
+    with pool.lease() as driver:
+        assert driver is created[1]
+
+
+def test_unhealthy_idle_driver_is_replaced_on_lease() -> None:
+    created: list[FakeDriver] = []
+    pool = ChromeDriverPool(_factory(created), size=1)
+
+    with pool.lease() as driver:
+        pass
+    driver.alive = False
+
+    with pool.lease() as replacement:
+        assert replacement is not driver
+
+    assert driver.quit_called is True
+
+
+def test_close_quits_idle_drivers_and_rejects_new_leases() -> None:
+    created: list[FakeDriver] = []
+    with ChromeDriverPool(_factory(created), size=2) as pool:
+        with pool.lease(), pool.lease():
+            pass
+
+    assert len(created) == 2
+    assert all(driver.quit_called for driver in created)
+    with pytest.raises(RuntimeError, match="Driver pool is closed"):
+        with pool.lease():
+            pass
+
+
+def test_pool_rejects_invalid_size() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        ChromeDriverPool(lambda: FakeDriver("x"), size=0)
+
+
+def test_driver_over_rss_watermark_is_replaced_in_background() -> None:
+    created: list[FakeDriver] = []
+    rss = {"driver-0": 950, "driver-1": 100}
+    pool = ChromeDriverPool(
+        _factory(created),
+        size=1,
+        max_rss_bytes=1000,
+        rss_headroom=0.9,
+        rss_probe=lambda driver: rss[driver.name],
+    )
+
+    with pool.lease() as first:
+        pass
+    with pool.lease() as second:
+        pass
+
+    assert first.quit_called is True
+    assert second is created[1]
+    assert pool.recycle_stats == {"rss": 1}
+    pool.close()
+
+
+def test_driver_replaced_after_max_age(monkeypatch) -> None:
+    import plugin_boutique_price_checker.driver_pool as pool_module
+
+    now = {"t": pool_module.time.monotonic()}
+    monkeypatch.setattr(pool_module.time, "monotonic", lambda: now["t"])
+    created: list[FakeDriver] = []
+    pool = ChromeDriverPool(_factory(created), size=1, max_driver_age_seconds=60)
+
+    with pool.lease():
+        pass
+    now["t"] += 61
+    with pool.lease():
+        pass
+    pool.close()
+
+    assert created[0].quit_called is True
+    assert pool.recycle_stats == {"age": 1}
+
+
+def test_close_waits_for_background_replacement() -> None:
+    created: list[FakeDriver] = []
+    pool = ChromeDriverPool(_factory(created), size=1, max_pages_per_driver=1)
+
+    with pool.lease():
+        pass
+    pool.close()
+
+    assert all(driver.quit_called for driver in created)
@@ -0,0 +1,25 @@
+"""Accuracy regression tests over the offline extraction corpus."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from plugin_boutique_price_checker.models import PriceResult
+from plugin_boutique_price_checker.selenium_scraper import PluginBoutiqueSeleniumScraper
+
+CORPUS_DIR = Path(__file__).resolve().parents[1] / "benchmarks" / "corpus" / "v1"
+CASES = [
+    case
+    for case in json.loads((CORPUS_DIR / "manifest.json").read_text(encoding="utf-8"))["cases"]
+    if not case.get("pad_to_bytes")
+]
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case["id"] for case in CASES])
+def test_extraction_chain_matches_labelled_price(case) -> None:
+    html = (CORPUS_DIR / case["file"]).read_text(encoding="utf-8")
+
+    result = PluginBoutiqueSeleniumScraper._extract_price(html)
+
+    assert result == PriceResult(amount=case["amount"], currency=case["currency"])
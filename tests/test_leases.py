@@ -0,0 +1,110 @@
+"""Tests for the watchlist item lease protocol used to shard worker checks."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+
+@pytest.fixture
+def lease_env(web_env):
+    """Reload web modules against a temp SQLite DB seeded with five active items."""
+    web = web_env(
+        "leases",
+        [f"https://shop.example/p{index}" for index in range(5)],
+        inactive_url="https://shop.example/off",
+    )
+    db = web.database.SessionLocal()
+    yield web.leases, db, web.orm
+    db.close()
+
+
+def test_workers_claim_disjoint_batches_until_items_run_out(lease_env) -> None:
+    leases, db, _ = lease_env
+
+    first = leases.claim_items(db, "worker-a", 2, lease_seconds=60)
+    second = leases.claim_items(db, "worker-b", 2, lease_seconds=60)
+    third = leases.claim_items(db, "worker-a", 2, lease_seconds=60)
+
+    assert first == [1, 2]
+    assert second == [3, 4]
+    assert third == [5]
+    assert leases.claim_items(db, "worker-b", 2, lease_seconds=60) == []
+
+
+def test_expired_lease_comes_back_and_renew_only_keeps_held_items(lease_env) -> None:
+    leases, db, orm_models = lease_env
+    assert leases.claim_items(db, "crashed", 1, lease_seconds=60) == [1]
+
+    item = db.get(orm_models.WatchlistItem, 1)
+    item.lease_expires_at = orm_models.utc_now() - timedelta(seconds=1)
+    db.commit()
+
+    assert leases.claim_items(db, "worker-a", 1, lease_seconds=60) == [1]
+    assert leases.renew_leases(db, "crashed", [1], lease_seconds=60) == []
+    assert leases.renew_leases(db, "worker-a", [1], lease_seconds=60) == [1]
+
+
+def test_release_schedules_items_and_claims_take_due_items_first(lease_env) -> None:
+    leases, db, orm_models = lease_env
+    now = orm_models.utc_now()
+    claimed = leases.claim_items(db, "worker-a", 3, lease_seconds=60)
+
+    leases.release_leases(
+        db,
+        "worker-a",
+        {claimed[0]: now - timedelta(minutes=1), claimed[1]: now + timedelta(minutes=5), claimed[2]: None},
+    )
+    leases.release_leases(db, "worker-b", {4: now + timedelta(minutes=5)})
+
+    assert leases.claim_items(db, "worker-b", 5, lease_seconds=60) == [1, 3, 4, 5]
+    db.expire_all()
+    assert db.get(orm_models.WatchlistItem, 2).next_check_at is not None
+    assert db.get(orm_models.WatchlistItem, 4).next_check_at is None
+
+
+def test_claim_skips_rows_locked_by_other_workers_on_postgres(lease_env) -> None:
+    leases, _, _ = lease_env
+
+    sql = str(leases.claim_statement("worker-a", 10, lease_seconds=60).compile(dialect=postgresql.dialect()))
+
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "RETURNING watchlist_items.id" in sql
+
+
+def test_items_with_queued_check_jobs_are_claimed_first_and_started(lease_env) -> None:
+    leases, db, orm_models = lease_env
+    later = orm_models.utc_now() + timedelta(minutes=5)
+    for item in db.query(orm_models.WatchlistItem).all():
+        item.next_check_at = later
+    db.add(orm_models.CheckJob(watchlist_item_id=4))
+    db.commit()
+
+    assert leases.claim_items(db, "worker-a", 2, lease_seconds=60) == [4]
+    db.expire_all()
+    job = db.query(orm_models.CheckJob).one()
+    assert job.status == "running"
+    assert job.started_at is not None
+
+
+def test_running_job_of_crashed_worker_is_reclaimed_once_its_lease_lapses(lease_env) -> None:
+    leases, db, orm_models = lease_env
+    later = orm_models.utc_now() + timedelta(hours=6)
+    for item in db.query(orm_models.WatchlistItem).all():
+        item.next_check_at = later
+    db.add(orm_models.CheckJob(watchlist_item_id=1))
+    db.commit()
+
+    assert leases.claim_items(db, "crashed", 1, lease_seconds=60) == [1]
+    assert leases.claim_items(db, "worker-b", 1, lease_seconds=60) == []
+
+    item = db.get(orm_models.WatchlistItem, 1)
+    item.lease_expires_at = orm_models.utc_now() - timedelta(seconds=1)
+    db.commit()
+
+    assert leases.claim_items(db, "worker-b", 1, lease_seconds=60) == [1]
+    db.expire_all()
+    assert db.query(orm_models.CheckJob).one().status == "running"
+    assert db.get(orm_models.WatchlistItem, 1).lease_owner == "worker-b"
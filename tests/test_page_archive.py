@@ -0,0 +1,54 @@
+"""Tests for the content-addressed page archive and parallel re-extraction."""
+
+from __future__ import annotations
+
+import gzip
+
+import httpx
+
+from plugin_boutique_price_checker.models import PriceResult
+from plugin_boutique_price_checker.page_archive import PageArchive, digest_from_path
+from plugin_boutique_price_checker.selenium_scraper import PluginBoutiqueSeleniumScraper
+
+
+def test_archive_deduplicates_and_round_trips_pages(tmp_path) -> None:
+    archive = PageArchive(tmp_path / "pages")
+
+    first = archive.put("<p>£10.00</p>")
+    second = archive.put("<p>£10.00</p>")
+    other = archive.put("<p>£12.00</p>")
+
+    assert first == second != other
+    assert archive.get(first) == "<p>£10.00</p>"
+    paths = list(archive.iter_paths())
+    assert sorted(digest_from_path(path) for path in paths) == sorted([first, other])
+    assert gzip.decompress(archive.path_for(first).read_bytes()) == "<p>£10.00</p>".encode("utf-8")
+
+
+def test_http_tier_links_result_to_archived_page(tmp_path) -> None:
+    html = "<button>Add to Cart</button><span>$42.00</span>"
+    archive = PageArchive(tmp_path)
+    scraper = PluginBoutiqueSeleniumScraper(http_first=True, page_archive=archive)
+    scraper._http_client = httpx.Client(transport=httpx.MockTransport(lambda _request: httpx.Response(200, text=html)))
+
+    price = scraper.get_price("https://example.com/product")
+
+    assert price == PriceResult(amount=42.0, currency="$")
+    assert price.page_sha256 is not None
+    assert archive.get(price.page_sha256) == html
+
+
+def test_reextract_archive_runs_across_worker_processes(tmp_path) -> None:
+    from plugin_boutique_price_checker.web.reextract import reextract_archive
+
+    archive = PageArchive(tmp_path)
+    good = archive.put("<button>Buy now</button><b>€7.50</b>")
+    structured = archive.put('<meta property="og:price:amount" content="3.00"><meta property="og:price:currency" content="USD">')
+    broken = archive.put("<p>no prices here</p>")
+
+    results = {page.page_sha256: page for page in reextract_archive(archive, workers=2, chunksize=1)}
+
+    assert (results[good].amount, results[good].currency, results[good].extractor) == (7.5, "€", "anchor_heuristic")
+    assert (results[structured].amount, results[structured].extractor) == (3.0, "meta")
+    assert results[broken].amount is None
+    assert results[broken].error == "No currency-like prices found in page source"
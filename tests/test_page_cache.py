@@ -0,0 +1,264 @@
+"""Tests for conditional-request page caching."""
+
+from __future__ import annotations
+
+import importlib
+
+import httpx
+
+from plugin_boutique_price_checker.models import PriceResult
+from plugin_boutique_price_checker.page_cache import CachedPage, canonical_product_url
+from plugin_boutique_price_checker.selenium_scraper import PluginBoutiqueSeleniumScraper
+
+
+class DictPageCache:
+    def __init__(self) -> None:
+        self.entries: dict[str, CachedPage] = {}
+
+    def get(self, url: str) -> CachedPage | None:
+        return self.entries.get(url)
+
+    def put(self, url: str, page: CachedPage) -> None:
+        self.entries[url] = page
+
+
+def test_canonical_product_url_drops_tracking_fragment_and_trailing_slash() -> None:
+    url = "HTTPS://WWW.PluginBoutique.com/product/1-De-Esser/?utm_source=mail&b=2&a=1#reviews"
+
+    assert canonical_product_url(url) == "https://www.pluginboutique.com/product/1-De-Esser?a=1&b=2"
+
+
+def test_http_tier_sends_validators_and_serves_cached_price_on_304() -> None:
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            text="<button>Add to Cart</button><span>£59.00</span>",
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Oct 2026 10:00:00 GMT"},
+        )
+
+    cache = DictPageCache()
+    scraper = PluginBoutiqueSeleniumScraper(http_first=True, page_cache=cache)
+    scraper._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    first = scraper.get_price("https://example.com/product?utm_campaign=x")
+    second = scraper.get_price("https://example.com/product")
+
+    assert first == second == PriceResult(amount=59.0, currency="£")
+    assert first.fetch_tier == "http"
+    assert second.fetch_tier == "http_cache"
+    assert "if-none-match" not in seen_headers[0]
+    assert seen_headers[1]["if-modified-since"] == "Wed, 01 Oct 2026 10:00:00 GMT"
+    assert scraper.cache_stats == {"miss": 1, "hit": 1}
+
+
+def test_database_page_cache_round_trip(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'cache.db'}")
+
+    import plugin_boutique_price_checker.web.database as database_module
+    import plugin_boutique_price_checker.web.orm_models as orm_models_module
+    import plugin_boutique_price_checker.web.page_cache_store as store_module
+    import plugin_boutique_price_checker.web.settings as settings_module
+
+    importlib.reload(settings_module)
+    importlib.reload(database_module)
+    importlib.reload(orm_models_module)
+    importlib.reload(store_module)
+    database_module.create_all_tables()
+
+    cache = store_module.DatabasePageCache()
+    assert cache.get("https://example.com/p") is None
+
+    cache.put("https://example.com/p", CachedPage(etag='"a"', last_modified=None, price=PriceResult(10.0, "$")))
+    cache.put(
+        "https://example.com/p/",
+        CachedPage(etag='"b"', last_modified=None, price=PriceResult(12.0, "$", extractor="json_ld")),
+    )
+
+    cached = cache.get("https://example.com/p")
+    assert cached is not None
+    assert cached.etag == '"b"'
+    assert cached.price == PriceResult(12.0, "$")
+    assert cached.price.extractor == "json_ld"
+
+
+def test_unchanged_fingerprint_skips_extraction_on_browser_tier(monkeypatch) -> None:
+    import plugin_boutique_price_checker.selenium_scraper as scraper_module
+
+    class FakeDriver:
+        page_source = "<header>ad-1</header><button>Add to Cart</button><span>$42.00</span>"
+
+        def get(self, _url: str) -> None:
+            return None
+
+        def quit(self) -> None:
+            return None
+
+    class FakeWait:
+        def __init__(self, driver, timeout_seconds: int) -> None:
+            self.driver = driver
+
+        def until(self, _condition) -> bool:
+            return True
+
+    extractions = {"count": 0}
+    original_extract = PluginBoutiqueSeleniumScraper._extract_price.__func__
+
+    def counting_extract(cls, html: str) -> PriceResult:
+        extractions["count"] += 1
+        return original_extract(cls, html)
+
+    monkeypatch.setattr(PluginBoutiqueSeleniumScraper, "_build_driver", lambda self: FakeDriver())
+    monkeypatch.setattr(PluginBoutiqueSeleniumScraper, "_extract_price", classmethod(counting_extract))
+    monkeypatch.setattr(scraper_module, "WebDriverWait", FakeWait)
+
+    scraper = PluginBoutiqueSeleniumScraper(page_cache=DictPageCache())
+    first = scraper.get_price("https://example.com/product")
+    second = scraper.get_price("https://example.com/product")
+
+    assert first == second == PriceResult(amount=42.0, currency="$")
+    assert first.unchanged is False
+    assert second.unchanged is True
+    assert extractions["count"] == 1
+    assert scraper.cache_stats["unchanged"] == 1
+
+    FakeDriver.page_source = FakeDriver.page_source.replace("$42.00", "$39.00")
+    third = scraper.get_price("https://example.com/product")
+
+    assert third == PriceResult(amount=39.0, currency="$")
+    assert third.unchanged is False
+    # Same layout, new price: the learned offset hint finds it without the full chain.
+    assert extractions["count"] == 1
+    assert scraper.cache_stats["hint_hit"] == 1
+    assert scraper.get_price("https://example.com/product").unchanged is True
+
+
+def test_anchor_hint_is_rejected_when_a_closer_price_appears() -> None:
+    html = "<button>Add to Cart</button><span>$42.00</span><footer>$5.00</footer>"
+    price = PluginBoutiqueSeleniumScraper._extract_anchor_heuristic(html)
+    hint = price.extraction_hint
+
+    assert hint == f"anchor:{html.index('Add to Cart')}:{html.index('$42.00')}"
+    assert PluginBoutiqueSeleniumScraper._extract_with_hint(html, hint) == PriceResult(amount=42.0, currency="$")
+
+    moved = "<i>$1</i>" + html
+    assert PluginBoutiqueSeleniumScraper._extract_with_hint(moved, hint) is None
+
+    closer = "<button>Add to Cart</button>$9<span>$42.00</span><footer>$5.00</footer>"
+    assert PluginBoutiqueSeleniumScraper._extract_with_hint(closer, hint) is None
+
+
+def test_anchor_hint_is_rejected_when_it_is_no_longer_the_first_anchor() -> None:
+    html = "<button>Buy now</button><span>$42.00</span>"
+    hint = PluginBoutiqueSeleniumScraper._extract_anchor_heuristic(html).extraction_hint
+
+    # "Add to Cart" outranks "Buy now", so a full scan would now anchor on it.
+    changed = html + "<footer><button>Add to Cart</button> $5.00</footer>"
+
+    assert PluginBoutiqueSeleniumScraper._extract_with_hint(changed, hint) is None
+    assert PluginBoutiqueSeleniumScraper._extract_price(changed) == PriceResult(amount=5.0, currency="$")
+
+
+def test_json_ld_price_is_cached_with_a_structured_hint_and_reused() -> None:
+    pages = iter(["$42.00", "$39.00"])
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        price = next(pages).lstrip("$")
+        return httpx.Response(
+            200,
+            text=(
+                '<script type="application/ld+json">'
+                f'{{"@type": "Product", "offers": {{"price": "{price}", "priceCurrency": "USD"}}}}'
+                "</script><p>Sold out</p>"
+            ),
+            headers={"ETag": f'"{price}"'},
+        )
+
+    cache = DictPageCache()
+    scraper = PluginBoutiqueSeleniumScraper(http_first=True, page_cache=cache)
+    scraper._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    first = scraper.get_price("https://example.com/product")
+    assert cache.entries["https://example.com/product"].price.extraction_hint == "json_ld"
+    second = scraper.get_price("https://example.com/product")
+
+    assert first == PriceResult(amount=42.0, currency="$")
+    assert second == PriceResult(amount=39.0, currency="$")
+    assert second.extractor == "json_ld"
+    assert scraper.cache_stats["hint_hit"] == 1
+
+
+def test_structured_hint_runs_the_remembered_extractor() -> None:
+    html = '<meta property="og:price:amount" content="12.50"><meta property="og:price:currency" content="GBP">'
+
+    price = PluginBoutiqueSeleniumScraper._extract_with_hint(html, "meta")
+
+    assert price == PriceResult(amount=12.5, currency="£")
+    assert price.extractor == "meta"
+    assert PluginBoutiqueSeleniumScraper._extract_with_hint(html, "json_ld") is None
+    assert PluginBoutiqueSeleniumScraper._extract_with_hint(html, "anchor:bogus") is None
+
+
+def test_stale_hint_falls_back_to_full_extraction_on_http_tier() -> None:
+    pages = iter(
+        [
+            "<button>Add to Cart</button><span>$42.00</span>",
+            "<nav>Sale</nav><button>Add to Cart</button><span>$30.00</span>",
+        ]
+    )
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=next(pages))
+
+    cache = DictPageCache()
+    scraper = PluginBoutiqueSeleniumScraper(http_first=True, page_cache=cache)
+    scraper._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    first = scraper.get_price("https://example.com/product")
+    second = scraper.get_price("https://example.com/product")
+
+    assert first == PriceResult(amount=42.0, currency="$")
+    assert second == PriceResult(amount=30.0, currency="$")
+    assert scraper.cache_stats["hint_miss"] == 1
+    stored = cache.entries["https://example.com/product"].price.extraction_hint
+    assert stored == "anchor:23:49"
+
+
+def test_fingerprint_covers_head_json_ld_and_far_heuristic_prices() -> None:
+    body = "<main>" + "x" * 5000 + "<button>Add to Cart</button></main>"
+
+    def json_ld_page(price: str) -> str:
+        return (
+            '<head><script type="application/ld+json">'
+            f'{{"@type": "Product", "offers": {{"price": "{price}", "priceCurrency": "USD"}}}}'
+            f"</script></head>{body}"
+        )
+
+    fingerprint = PluginBoutiqueSeleniumScraper._page_fingerprint
+    assert fingerprint(json_ld_page("42.00")) != fingerprint(json_ld_page("39.00"))
+
+    far_price = "<span>$42.00</span>" + "y" * 5000 + "<button>Add to Cart</button>"
+    price = PluginBoutiqueSeleniumScraper._extract_price(far_price)
+    assert price == PriceResult(amount=42.0, currency="$")
+    assert PluginBoutiqueSeleniumScraper._fingerprint_covering(fingerprint(far_price), price) is None
+
+    near_price = "<button>Add to Cart</button><span>$42.00</span>"
+    near = PluginBoutiqueSeleniumScraper._extract_price(near_price)
+    assert PluginBoutiqueSeleniumScraper._fingerprint_covering(fingerprint(near_price), near) is not None
+
+
+def test_hint_is_rejected_when_a_higher_priority_extractor_now_finds_a_price() -> None:
+    html = "<div><button>Add to Cart</button><span>$39.00</span></div>"
+    anchor_hint = PluginBoutiqueSeleniumScraper._extract_anchor_heuristic(html).extraction_hint
+    json_ld = '<script type="application/ld+json">{"@type": "Product", "offers": {"price": "29.00", "priceCurrency": "USD"}}</script>'
+    meta = '<meta property="og:price:amount" content="19.00"><meta property="og:price:currency" content="USD">'
+    with_json_ld = html + json_ld
+
+    assert PluginBoutiqueSeleniumScraper._extract_price(with_json_ld).amount == 29.0
+    assert PluginBoutiqueSeleniumScraper._extract_with_hint(with_json_ld, anchor_hint) is None
+    assert PluginBoutiqueSeleniumScraper._extract_with_hint(json_ld + meta, "meta") is None
+    assert PluginBoutiqueSeleniumScraper._extract_with_hint(meta + json_ld, "json_ld").amount == 29.0
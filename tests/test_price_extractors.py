@@ -0,0 +1,93 @@
+"""Unit tests for structured-data price extractors."""
+
+from plugin_boutique_price_checker.models import PriceResult
+from plugin_boutique_price_checker.price_extractors import (
+    extract_json_ld_price,
+    extract_meta_price,
+    extract_microdata_price,
+    extract_structured_price,
+)
+from plugin_boutique_price_checker.selenium_scraper import PluginBoutiqueSeleniumScraper
+
+
+def test_extract_json_ld_price_reads_product_offer() -> None:
+    html = """
+    <script type="application/ld+json">{"@type": "BreadcrumbList"}</script>
+    <script type="application/ld+json">
+      {"@context": "https://schema.org", "@graph": [
+        {"@type": "Product", "name": "De-Esser",
+         "offers": {"@type": "Offer", "price": "129.00", "priceCurrency": "GBP"}}
+      ]}
+    </script>
+    """
+
+    assert extract_json_ld_price(html) == PriceResult(amount=129.0, currency="£")
+
+
+def test_extract_json_ld_price_ignores_invalid_json_and_unknown_currency() -> None:
+    html = """
+    <script type="application/ld+json">{not json</script>
+    <script type="application/ld+json">
+      {"@type": "Product", "offers": [{"price": 10, "priceCurrency": "JPY"}]}
+    </script>
+    """
+
+    assert extract_json_ld_price(html) is None
+
+
+def test_extract_microdata_price_uses_content_and_currency() -> None:
+    html = """
+    <meta itemprop="priceCurrency" content="EUR">
+    <span itemprop="price" content="1,049.50">€1,049.50</span>
+    """
+
+    assert extract_microdata_price(html) == PriceResult(amount=1049.5, currency="€")
+
+
+def test_extract_microdata_price_falls_back_to_symbol_in_text() -> None:
+    html = '<span class="x" itemprop="price">$19.99</span>'
+
+    assert extract_microdata_price(html) == PriceResult(amount=19.99, currency="$")
+
+
+def test_extract_meta_price_reads_open_graph_tags() -> None:
+    html = """
+    <meta content="USD" property="og:price:currency">
+    <meta property="og:price:amount" content="49.00">
+    """
+
+    assert extract_meta_price(html) == PriceResult(amount=49.0, currency="$")
+
+
+def test_extract_structured_price_records_winning_extractor() -> None:
+    html = """
+    <meta property="product:price:amount" content="5.00">
+    <meta property="product:price:currency" content="GBP">
+    <span itemprop="price" content="7.00">£7.00</span>
+    """
+
+    result = extract_structured_price(html)
+
+    assert result == PriceResult(amount=7.0, currency="£")
+    assert result.extractor == "microdata"
+
+
+def test_scraper_prefers_structured_data_over_recommendation_prices() -> None:
+    html = """
+    <script type="application/ld+json">
+      {"@type": "Product", "offers": {"price": 89.0, "priceCurrency": "USD"}}
+    </script>
+    <div class="recommendations"><span>$9.99</span><button>Add to Cart</button></div>
+    """
+
+    result = PluginBoutiqueSeleniumScraper._extract_price(html)
+
+    assert result == PriceResult(amount=89.0, currency="$")
+    assert result.extractor == "json_ld"
+
+
+def test_scraper_falls_back_to_anchor_heuristic() -> None:
+    result = PluginBoutiqueSeleniumScraper._extract_price("<span>£15.00</span><button>Buy Now</button>")
+
+    assert result == PriceResult(amount=15.0, currency="£")
+    assert result.extractor == "anchor_heuristic"
@@ -0,0 +1,107 @@
+"""Tests for the per-host adaptive rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from plugin_boutique_price_checker.rate_limiter import HostRateLimiter
+from plugin_boutique_price_checker.resilience import TransientFetchError
+from plugin_boutique_price_checker.selenium_scraper import PluginBoutiqueSeleniumScraper
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_paces_requests() -> None:
+    clock = FakeClock()
+    limiter = HostRateLimiter(rate_per_second=2.0, burst=2, concurrency=4, clock=clock)
+
+    assert limiter.try_acquire("https://shop.example/a") == 0
+    assert limiter.try_acquire("https://shop.example/b") == 0
+    assert limiter.try_acquire("https://shop.example/c") == pytest.approx(0.5)
+    assert limiter.try_acquire("https://other.example/a") == 0
+
+    clock.now = 0.5
+    assert limiter.try_acquire("https://shop.example/c") == 0
+
+
+def test_concurrency_cap_holds_until_release() -> None:
+    clock = FakeClock()
+    limiter = HostRateLimiter(rate_per_second=10.0, burst=5, concurrency=1, clock=clock)
+
+    assert limiter.try_acquire("https://shop.example/a") == 0
+    assert limiter.try_acquire("https://shop.example/b") > 0
+
+    limiter.release("https://shop.example/a", latency_seconds=0.1, status_code=200)
+
+    assert limiter.try_acquire("https://shop.example/b") == 0
+
+
+def test_aimd_grows_on_success_and_halves_on_throttling() -> None:
+    limiter = HostRateLimiter(
+        rate_per_second=1.0,
+        burst=10,
+        concurrency=2,
+        max_concurrency=4,
+        rate_step=0.5,
+        latency_target_seconds=5,
+        clock=FakeClock(),
+    )
+    url = "https://shop.example/p"
+
+    for _ in range(4):
+        limiter.acquire(url)
+        limiter.release(url, latency_seconds=0.2, status_code=200)
+    grown = limiter.metrics()["shop.example"]
+    assert grown["rate_per_second"] == 3.0
+    assert grown["concurrency_limit"] == 3
+
+    limiter.acquire(url)
+    limiter.release(url, latency_seconds=0.2, status_code=429)
+    throttled = limiter.metrics()["shop.example"]
+    assert throttled["rate_per_second"] == 1.5
+    assert throttled["concurrency_limit"] == 1
+    assert throttled["throttled"] == 1
+
+    limiter.acquire(url)
+    limiter.release(url, latency_seconds=9.0, status_code=200)
+    assert limiter.metrics()["shop.example"]["rate_per_second"] == 0.75
+
+
+def test_http_tier_reports_server_errors_to_the_limiter() -> None:
+    limiter = HostRateLimiter(rate_per_second=5.0, burst=5)
+    scraper = PluginBoutiqueSeleniumScraper(http_first=True, rate_limiter=limiter)
+    scraper._http_client = httpx.Client(transport=httpx.MockTransport(lambda _request: httpx.Response(503)))
+
+    with pytest.raises(TransientFetchError):
+        scraper._get_price_via_http("https://shop.example/p", "https://shop.example/p", None)
+
+    metrics = limiter.metrics()["shop.example"]
+    assert metrics["throttled"] == 1
+    assert metrics["in_flight"] == 0
+
+
+def test_async_batch_waits_on_the_shared_limiter(monkeypatch) -> None:
+    html = "<button>Add to Cart</button><span>$10.00</span>"
+    limiter = HostRateLimiter(rate_per_second=50.0, burst=1, concurrency=1)
+    scraper = PluginBoutiqueSeleniumScraper(rate_limiter=limiter)
+    monkeypatch.setattr(
+        scraper,
+        "build_async_http_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(lambda _request: httpx.Response(200, text=html))),
+    )
+
+    results = asyncio.run(scraper.get_prices([f"https://shop.example/p{i}" for i in range(3)]))
+
+    assert [result.amount for result in results] == [10.0, 10.0, 10.0]
+    metrics = limiter.metrics()["shop.example"]
+    assert metrics["in_flight"] == 0
+    assert metrics["queue_depth"] == 0
@@ -0,0 +1,166 @@
+"""Tests for retry classification, backoff and the per-host circuit breaker."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+import plugin_boutique_price_checker.selenium_scraper as scraper_module
+from plugin_boutique_price_checker.models import PriceResult
+from plugin_boutique_price_checker.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    TransientFetchError,
+    is_retryable,
+)
+from plugin_boutique_price_checker.selenium_scraper import PluginBoutiqueSeleniumScraper
+
+
+def test_is_retryable_separates_transient_from_permanent_errors() -> None:
+    assert is_retryable(TransientFetchError("Timed out waiting for page to load"))
+    assert is_retryable(WebDriverException("session deleted"))
+    assert is_retryable(httpx.ConnectError("refused"))
+    assert not is_retryable(RuntimeError("No currency-like prices found in page source"))
+    assert not is_retryable(CircuitOpenError("open"))
+
+
+def test_backoff_is_exponential_capped_and_jittered() -> None:
+    policy = RetryPolicy(base_delay_seconds=2.0, max_delay_seconds=5.0)
+
+    assert [policy.backoff_seconds(n, rng=lambda: 1.0) for n in (1, 2, 3)] == [2.0, 4.0, 5.0]
+    assert policy.backoff_seconds(2, rng=lambda: 0.25) == 1.0
+
+
+def test_circuit_opens_then_allows_a_single_trial_after_cool_down() -> None:
+    now = {"t": 0.0}
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=60, clock=lambda: now["t"])
+    url = "https://shop.example/p"
+
+    breaker.record_failure(url)
+    breaker.before_call(url)
+    breaker.record_failure(url)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call(url)
+    assert breaker.open_hosts() == {"shop.example": 2}
+
+    now["t"] = 61
+    breaker.before_call(url)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call("https://shop.example/other")
+
+    breaker.record_success(url)
+    breaker.before_call(url)
+    assert breaker.open_hosts() == {}
+
+
+def test_get_price_retries_transient_errors_with_backoff(monkeypatch) -> None:
+    outcomes = [TransientFetchError("Timed out waiting for page to load"), PriceResult(amount=9.0, currency="$")]
+    sleeps: list[float] = []
+
+    def fake_fetch(self, url: str) -> PriceResult:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(PluginBoutiqueSeleniumScraper, "_fetch_price", fake_fetch)
+    monkeypatch.setattr(scraper_module.time, "sleep", sleeps.append)
+    breaker = CircuitBreaker(failure_threshold=1)
+    scraper = PluginBoutiqueSeleniumScraper(retry_policy=RetryPolicy(max_attempts=3), circuit_breaker=breaker)
+
+    assert scraper.get_price("https://shop.example/p") == PriceResult(amount=9.0, currency="$")
+    assert len(sleeps) == 1
+    assert scraper.fetch_stats["retry"] == 1
+    assert breaker.open_hosts() == {}
+
+
+def test_get_price_fails_fast_once_the_host_circuit_is_open(monkeypatch) -> None:
+    calls = {"count": 0}
+
+    def failing_fetch(self, url: str) -> PriceResult:
+        calls["count"] += 1
+        raise TransientFetchError("Timed out waiting for page to load")
+
+    monkeypatch.setattr(PluginBoutiqueSeleniumScraper, "_fetch_price", failing_fetch)
+    monkeypatch.setattr(scraper_module.time, "sleep", lambda _seconds: None)
+    scraper = PluginBoutiqueSeleniumScraper(
+        retry_policy=RetryPolicy(max_attempts=2),
+        circuit_breaker=CircuitBreaker(failure_threshold=1),
+    )
+
+    with pytest.raises(TransientFetchError):
+        scraper.get_price("https://shop.example/a")
+    with pytest.raises(CircuitOpenError):
+        scraper.get_price("https://shop.example/b")
+
+    assert calls["count"] == 2
+    assert scraper.fetch_stats["circuit_open"] == 1
+
+
+def test_get_price_does_not_retry_pages_without_a_price(monkeypatch) -> None:
+    calls = {"count": 0}
+
+    def no_price(self, url: str) -> PriceResult:
+        calls["count"] += 1
+        raise RuntimeError("No currency-like prices found in page source")
+
+    monkeypatch.setattr(PluginBoutiqueSeleniumScraper, "_fetch_price", no_price)
+    scraper = PluginBoutiqueSeleniumScraper(retry_policy=RetryPolicy(max_attempts=3))
+
+    with pytest.raises(RuntimeError, match="No currency-like prices"):
+        scraper.get_price("https://shop.example/p")
+    assert calls["count"] == 1
+
+
+def test_pages_without_a_price_leave_the_circuit_state_alone(monkeypatch) -> None:
+    now = {"t": 0.0}
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=60, clock=lambda: now["t"])
+
+    def no_price(self, url: str) -> PriceResult:
+        raise RuntimeError("No currency-like prices found in page source")
+
+    monkeypatch.setattr(PluginBoutiqueSeleniumScraper, "_fetch_price", no_price)
+    scraper = PluginBoutiqueSeleniumScraper(retry_policy=RetryPolicy(max_attempts=1), circuit_breaker=breaker)
+    url = "https://shop.example/p"
+
+    breaker.record_failure(url)
+    with pytest.raises(RuntimeError):
+        scraper.get_price(url)
+    breaker.record_failure(url)
+    assert breaker.open_hosts() == {"shop.example": 2}
+
+    # A half-open trial that finds no price neither closes the circuit nor blocks the next trial.
+    now["t"] = 61
+    with pytest.raises(RuntimeError):
+        scraper.get_price(url)
+    assert breaker.open_hosts() == {"shop.example": 2}
+    breaker.before_call(url)
+
+
+def test_http_tier_server_errors_open_the_circuit_without_browser_loads(monkeypatch) -> None:
+    browser_loads = {"count": 0}
+
+    def browser_fetch(self, url, cache_key, cached) -> PriceResult:
+        browser_loads["count"] += 1
+        raise RuntimeError("No currency-like prices found in page source")
+
+    monkeypatch.setattr(PluginBoutiqueSeleniumScraper, "_fetch_browser_price", browser_fetch)
+    monkeypatch.setattr(scraper_module.time, "sleep", lambda _seconds: None)
+    breaker = CircuitBreaker(failure_threshold=3)
+    scraper = PluginBoutiqueSeleniumScraper(
+        http_first=True,
+        retry_policy=RetryPolicy(max_attempts=2),
+        circuit_breaker=breaker,
+    )
+    scraper._http_client = httpx.Client(transport=httpx.MockTransport(lambda _request: httpx.Response(503)))
+
+    for index in range(3):
+        with pytest.raises(TransientFetchError, match="HTTP 503"):
+            scraper.get_price(f"https://shop.example/p{index}")
+    with pytest.raises(CircuitOpenError):
+        scraper.get_price("https://shop.example/p3")
+
+    assert browser_loads["count"] == 0
+    assert breaker.open_hosts() == {"shop.example": 3}
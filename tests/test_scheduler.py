@@ -0,0 +1,116 @@
+"""Tests for due-time scheduling of watchlist checks."""
+
+from __future__ import annotations
+
+import dataclasses
+from datetime import timedelta
+
+import pytest
+
+
+@pytest.fixture
+def schedule_env(web_env):
+    """Reload web modules against a temp SQLite DB seeded with three active items."""
+    web = web_env(
+        "schedule",
+        [f"https://shop.example/p{index}" for index in range(3)],
+        env={"WORKER_SLEEP_SECONDS": "300"},
+    )
+    db = web.database.SessionLocal()
+    yield web.scheduler, web.leases, db, web.orm, web.settings.load_settings()
+    db.close()
+
+
+def test_next_check_time_prefers_the_item_interval(schedule_env) -> None:
+    scheduler, _, _, orm_models, settings = schedule_env
+    now = orm_models.utc_now()
+
+    assert scheduler.next_check_time(None, settings, now=now) == now + timedelta(seconds=300)
+    assert scheduler.next_check_time(3600, settings, now=now) == now + timedelta(hours=1)
+
+
+def test_claims_follow_due_order_and_skip_items_not_due(schedule_env) -> None:
+    _, leases, db, orm_models, _ = schedule_env
+    now = orm_models.utc_now()
+    items = {item.id: item for item in db.query(orm_models.WatchlistItem).all()}
+    items[1].next_check_at = now - timedelta(minutes=1)
+    items[2].next_check_at = now - timedelta(minutes=10)
+    items[3].next_check_at = now + timedelta(minutes=10)
+    db.commit()
+
+    assert leases.claim_items(db, "worker-a", 1, lease_seconds=60) == [2]
+    assert leases.claim_items(db, "worker-a", 5, lease_seconds=60) == [1]
+
+
+def test_worker_sleeps_until_the_next_due_item(schedule_env) -> None:
+    scheduler, leases, db, orm_models, settings = schedule_env
+    now = orm_models.utc_now()
+
+    assert scheduler.seconds_until_next_due(db, settings) == 1.0
+
+    claimed = leases.claim_items(db, "worker-a", 3, lease_seconds=600)
+    leases.release_leases(db, "worker-a", {claimed[0]: now + timedelta(seconds=120)})
+    leases.release_leases(db, "worker-a", {item_id: now + timedelta(hours=1) for item_id in claimed[1:]})
+    assert 100 < scheduler.seconds_until_next_due(db, settings) <= 120
+
+    db.query(orm_models.WatchlistItem).update({"is_active": False})
+    db.commit()
+    assert scheduler.seconds_until_next_due(db, settings) == 300.0
+
+
+def _flat_history(now, days: float, price: float = 100.0, runs: int = 5):
+    """Return newest-first price points spread evenly over ``days`` at one price."""
+    step = timedelta(days=days) / (runs - 1)
+    return [(now - step * index, price) for index in range(runs)]
+
+
+def test_adaptive_interval_grows_with_flat_history_up_to_the_maximum(schedule_env) -> None:
+    scheduler, _, _, orm_models, settings = schedule_env
+    now = orm_models.utc_now()
+
+    ten_days = scheduler.check_interval(None, settings, threshold=50, history=_flat_history(now, 10), now=now)
+    sixty_days = scheduler.check_interval(None, settings, threshold=50, history=_flat_history(now, 60), now=now)
+    fresh = scheduler.check_interval(None, settings, threshold=50, history=_flat_history(now, 0.01), now=now)
+
+    assert ten_days == timedelta(hours=10)
+    assert sixty_days == timedelta(seconds=settings.scheduler_max_interval_seconds)
+    assert fresh == timedelta(seconds=300)
+
+
+def test_adaptive_interval_shrinks_after_a_recent_change_and_near_the_threshold(schedule_env) -> None:
+    scheduler, _, _, orm_models, settings = schedule_env
+    settings = dataclasses.replace(settings, worker_sleep_seconds=3600)
+    now = orm_models.utc_now()
+    recently_changed = [(now - timedelta(hours=1), 90.0)] + _flat_history(now - timedelta(days=1), 10)
+
+    changed = scheduler.check_interval(None, settings, threshold=50, history=recently_changed, now=now)
+    near = scheduler.check_interval(None, settings, threshold=95.24, history=_flat_history(now, 10), now=now)
+    overridden = scheduler.check_interval(7200, settings, threshold=50, history=recently_changed, now=now)
+
+    assert changed == timedelta(seconds=settings.scheduler_min_interval_seconds)
+    # Five percent above the threshold is halfway from the default interval to the minimum.
+    assert abs(near.total_seconds() - 1950) < 5
+    assert overridden == timedelta(hours=2)
+
+
+def test_next_check_time_for_reads_the_item_run_history(schedule_env) -> None:
+    scheduler, _, db, orm_models, settings = schedule_env
+    now = orm_models.utc_now()
+    item = db.get(orm_models.WatchlistItem, 1)
+    for checked_at, amount in reversed(_flat_history(now, 4)):
+        db.add(
+            orm_models.PriceCheckRun(
+                watchlist_item_id=item.id,
+                status="success",
+                message="ok",
+                price_amount=amount,
+                price_currency="$",
+                created_at=checked_at,
+            )
+        )
+    db.add(orm_models.PriceCheckRun(watchlist_item_id=item.id, status="error", message="timeout"))
+    db.commit()
+
+    assert scheduler.next_check_time_for(db, item, settings, now=now) == now + timedelta(hours=4)
+    item.check_interval_seconds = 600
+    assert scheduler.next_check_time_for(db, item, settings, now=now) == now + timedelta(minutes=10)
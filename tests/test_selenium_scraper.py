@@ -1,7 +1,7 @@
 """Unit tests for Selenium scraper behavior."""
 
 import pytest
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
 from plugin_boutique_price_checker.models import PriceResult
 from plugin_boutique_price_checker.selenium_scraper import PluginBoutiqueSeleniumScraper
@@ -25,6 +25,21 @@ def test_extract_closest_price_without_anchor_uses_first_match() -> None:
     assert result == PriceResult(amount=12.50, currency="€")
 
 
+def test_extract_closest_price_tie_prefers_earlier_price() -> None:
+    html = "$1.00 Add to Cart $2.00"
+    result = PluginBoutiqueSeleniumScraper._extract_closest_price(html)
+    assert result == PriceResult(amount=1.00, currency="$")
+
+
+def test_extract_closest_price_scans_beyond_first_window() -> None:
+    filler = "<p>" + "x" * 50_000 + "</p>"
+    html = f"<span>£7.50</span>{filler}<span>£8.50</span>{filler}BUY NOW{filler}{filler}<span>£1.00</span>"
+
+    result = PluginBoutiqueSeleniumScraper._extract_closest_price(html)
+
+    assert result == PriceResult(amount=8.50, currency="£")
+
+
 def test_extract_closest_price_raises_when_no_currency_found() -> None:
     with pytest.raises(RuntimeError, match="No currency-like prices found"):
         PluginBoutiqueSeleniumScraper._extract_closest_price("<html><body>No price</body></html>")
@@ -58,7 +73,10 @@ def test_build_driver_configures_expected_options(monkeypatch) -> None:
     monkeypatch.setattr(scraper_module, "Options", FakeOptions)
     monkeypatch.setattr(scraper_module, "Service", FakeService)
     monkeypatch.setattr(scraper_module, "ChromeDriverManager", FakeChromeDriverManager)
+    monkeypatch.setattr(scraper_module.shutil, "which", lambda _name: None)
+    monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
     monkeypatch.setattr(scraper_module.webdriver, "Chrome", fake_chrome)
+    scraper_module._resolve_chromedriver_path_cached.cache_clear()
 
     scraper = PluginBoutiqueSeleniumScraper(headless=True)
     driver = scraper._build_driver()
@@ -72,6 +90,93 @@ def test_build_driver_configures_expected_options(monkeypatch) -> None:
     assert "--disable-dev-shm-usage" in captured["options"].arguments
 
 
+def test_build_driver_lean_mode_blocks_heavy_resources(monkeypatch) -> None:
+    import plugin_boutique_price_checker.selenium_scraper as scraper_module
+
+    class FakeOptions:
+        def __init__(self) -> None:
+            self.arguments = []
+            self.experimental = {}
+
+        def add_argument(self, arg: str) -> None:
+            self.arguments.append(arg)
+
+        def add_experimental_option(self, name: str, value) -> None:
+            self.experimental[name] = value
+
+    class FakeDriver:
+        def __init__(self) -> None:
+            self.cdp_calls = []
+
+        def execute_cdp_cmd(self, cmd: str, params: dict) -> dict:
+            self.cdp_calls.append((cmd, params))
+            return {}
+
+    captured = {}
+
+    def fake_chrome(service, options):
+        captured["options"] = options
+        captured["driver"] = FakeDriver()
+        return captured["driver"]
+
+    monkeypatch.setattr(scraper_module, "Options", FakeOptions)
+    monkeypatch.setattr(scraper_module, "Service", lambda path: path)
+    monkeypatch.setattr(scraper_module, "resolve_chromedriver_path", lambda _path: "/usr/bin/chromedriver")
+    monkeypatch.setattr(scraper_module.webdriver, "Chrome", fake_chrome)
+
+    scraper = PluginBoutiqueSeleniumScraper(block_resources=True, blocked_url_patterns=["*.png", "*tracker.example*"])
+    scraper._build_driver()
+
+    prefs = captured["options"].experimental["prefs"]
+    assert prefs == {"profile.managed_default_content_settings.images": 2}
+    assert captured["driver"].cdp_calls == [
+        ("Network.enable", {}),
+        ("Network.setBlockedURLs", {"urls": ["*.png", "*tracker.example*"]}),
+    ]
+
+
+def test_resolve_chromedriver_path_prefers_explicit_then_system(monkeypatch, tmp_path) -> None:
+    import plugin_boutique_price_checker.selenium_scraper as scraper_module
+
+    class ExplodingChromeDriverManager:
+        def install(self) -> str:
+            raise AssertionError("webdriver_manager should not be used")
+
+    explicit = tmp_path / "chromedriver"
+    explicit.write_text("", encoding="utf-8")
+    monkeypatch.setattr(scraper_module, "ChromeDriverManager", ExplodingChromeDriverManager)
+    monkeypatch.setattr(scraper_module.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+    scraper_module._resolve_chromedriver_path_cached.cache_clear()
+
+    assert scraper_module.resolve_chromedriver_path(str(explicit)) == str(explicit)
+    assert scraper_module.resolve_chromedriver_path() == "/usr/bin/chromedriver"
+
+    monkeypatch.setenv("CHROMEDRIVER_PATH", str(tmp_path / "missing"))
+    with pytest.raises(RuntimeError, match="Configured chromedriver does not exist"):
+        scraper_module.resolve_chromedriver_path()
+
+
+def test_resolve_chromedriver_path_memoizes_manager_fallback(monkeypatch) -> None:
+    import plugin_boutique_price_checker.selenium_scraper as scraper_module
+
+    calls = {"count": 0}
+
+    class CountingChromeDriverManager:
+        def install(self) -> str:
+            calls["count"] += 1
+            return "/tmp/chromedriver"
+
+    monkeypatch.setattr(scraper_module, "ChromeDriverManager", CountingChromeDriverManager)
+    monkeypatch.setattr(scraper_module.shutil, "which", lambda _name: None)
+    monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+    scraper_module._resolve_chromedriver_path_cached.cache_clear()
+
+    assert scraper_module.resolve_chromedriver_path() == "/tmp/chromedriver"
+    assert scraper_module.resolve_chromedriver_path() == "/tmp/chromedriver"
+    assert calls["count"] == 1
+
+
 def test_get_price_returns_extracted_result_and_quits_driver(monkeypatch) -> None:
     import plugin_boutique_price_checker.selenium_scraper as scraper_module
 
@@ -138,3 +243,383 @@ def test_get_price_raises_runtime_error_on_timeout_and_quits_driver(monkeypatch)
         scraper.get_price("https://example.com/product")
 
     assert fake_driver.quit_called is True
+
+
+def test_get_price_with_driver_pool_reuses_single_driver(monkeypatch) -> None:
+    import plugin_boutique_price_checker.selenium_scraper as scraper_module
+
+    class FakeDriver:
+        def __init__(self) -> None:
+            self.page_source = "<button>Add to Cart</button><span>$29.00</span>"
+            self.current_url = "about:blank"
+            self.got = []
+            self.quit_called = False
+
+        def get(self, url: str) -> None:
+            self.got.append(url)
+
+        def quit(self) -> None:
+            self.quit_called = True
+
+    class FakeWait:
+        def __init__(self, driver, timeout_seconds: int) -> None:
+            self.driver = driver
+
+        def until(self, _condition) -> bool:
+            return True
+
+    built = []
+
+    def fake_build(self):
+        driver = FakeDriver()
+        built.append(driver)
+        return driver
+
+    monkeypatch.setattr(PluginBoutiqueSeleniumScraper, "_build_driver", fake_build)
+    monkeypatch.setattr(scraper_module, "WebDriverWait", FakeWait)
+
+    with PluginBoutiqueSeleniumScraper(driver_pool_size=1) as scraper:
+        scraper.get_price("https://example.com/a")
+        scraper.get_price("https://example.com/b")
+        assert built[0].quit_called is False
+
+    assert len(built) == 1
+    assert built[0].got == ["https://example.com/a", "https://example.com/b"]
+    assert built[0].quit_called is True
+
+
+def test_get_price_http_first_serves_server_rendered_page_without_browser(monkeypatch) -> None:
+    import httpx
+
+    def fail_build(self):
+        raise AssertionError("browser tier should not be used")
+
+    monkeypatch.setattr(PluginBoutiqueSeleniumScraper, "_build_driver", fail_build)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text="<span>$5.00</span><span>$39.00</span><button>Add to Cart</button>")
+
+    scraper = PluginBoutiqueSeleniumScraper(http_first=True)
+    scraper._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    result = scraper.get_price("https://example.com/product")
+    scraper.close()
+
+    assert result == PriceResult(amount=39.0, currency="$")
+    assert result.fetch_tier == "http"
+
+
+def test_get_price_http_first_falls_back_to_selenium_without_anchor(monkeypatch) -> None:
+    import httpx
+    import plugin_boutique_price_checker.selenium_scraper as scraper_module
+
+    class FakeDriver:
+        page_source = "<button>Buy Now</button><span>$12.00</span>"
+
+        def get(self, _url: str) -> None:
+            return None
+
+        def quit(self) -> None:
+            return None
+
+    class FakeWait:
+        def __init__(self, driver, timeout_seconds: int) -> None:
+            self.driver = driver
+
+        def until(self, _condition) -> bool:
+            return True
+
+    monkeypatch.setattr(PluginBoutiqueSeleniumScraper, "_build_driver", lambda self: FakeDriver())
+    monkeypatch.setattr(scraper_module, "WebDriverWait", FakeWait)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text="<div id='app'>Loading $0</div>")
+
+    scraper = PluginBoutiqueSeleniumScraper(http_first=True)
+    scraper._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    result = scraper.get_price("https://example.com/product")
+
+    assert result == PriceResult(amount=12.0, currency="$")
+    assert result.fetch_tier == "selenium"
+
+
+def test_get_prices_returns_ordered_results_and_errors_per_url(monkeypatch) -> None:
+    import asyncio
+
+    import httpx
+
+    in_flight = {"current": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight["current"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+        await asyncio.sleep(0.01)
+        in_flight["current"] -= 1
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        amount = request.url.path.strip("/")
+        return httpx.Response(200, text=f"<button>Add to Cart</button><span>£{amount}.00</span>")
+
+    scraper = PluginBoutiqueSeleniumScraper()
+    monkeypatch.setattr(
+        scraper,
+        "build_async_http_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    urls = [f"https://example.com/{n}" for n in (10, 20, 30)] + ["https://example.com/missing"]
+    results = asyncio.run(scraper.get_prices(urls, per_host_concurrency=2))
+
+    assert results[:3] == [
+        PriceResult(amount=10.0, currency="£"),
+        PriceResult(amount=20.0, currency="£"),
+        PriceResult(amount=30.0, currency="£"),
+    ]
+    assert isinstance(results[3], RuntimeError)
+    assert "HTTP 404" in str(results[3])
+    assert in_flight["peak"] <= 2
+
+
+def test_get_price_async_uses_http_tier_then_browser_fallback(monkeypatch) -> None:
+    import asyncio
+
+    import httpx
+
+    browser_urls: list[str] = []
+
+    def fake_browser_price(self, url: str, cache_key: str, cached) -> PriceResult:
+        browser_urls.append(url)
+        return PriceResult(amount=12.0, currency="$", fetch_tier="selenium")
+
+    monkeypatch.setattr(PluginBoutiqueSeleniumScraper, "_fetch_browser_price", fake_browser_price)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/rendered":
+            return httpx.Response(200, text="<button>Add to Cart</button><span>$39.00</span>")
+        return httpx.Response(200, text="<div id='app'>Loading $0</div>")
+
+    scraper = PluginBoutiqueSeleniumScraper(http_first=True)
+
+    async def check_both() -> list[PriceResult]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return list(
+                await asyncio.gather(
+                    scraper.get_price_async("https://example.com/rendered", client),
+                    scraper.get_price_async("https://example.com/app", client),
+                )
+            )
+
+    rendered, app = asyncio.run(check_both())
+
+    assert rendered == PriceResult(amount=39.0, currency="$")
+    assert rendered.fetch_tier == "http"
+    assert app.fetch_tier == "selenium"
+    assert browser_urls == ["https://example.com/app"]
+
+
+def test_get_prices_in_tabs_extracts_each_tab_as_it_finishes(monkeypatch) -> None:
+    pages = {
+        "https://example.com/a": "<button>Add to Cart</button><span>$10.00</span>",
+        "https://example.com/b": "<div>no price here</div>",
+        "https://example.com/c": "<button>Add to Cart</button><span>€30.00</span>",
+    }
+
+    class FakeSwitchTo:
+        def __init__(self, driver) -> None:
+            self.driver = driver
+
+        def window(self, handle: str) -> None:
+            self.driver.current_window_handle = handle
+
+    class FakeDriver:
+        def __init__(self) -> None:
+            self.current_window_handle = "home"
+            self.tabs = {"home": "about:blank"}
+            self.polls = {}
+            self.max_open = 0
+            self.switch_to = FakeSwitchTo(self)
+            self.quit_called = False
+            self.current_url = "about:blank"
+
+        @property
+        def window_handles(self) -> list[str]:
+            return list(self.tabs)
+
+        @property
+        def page_source(self) -> str:
+            return pages[self.tabs[self.current_window_handle]]
+
+        def execute_script(self, script: str, *args):
+            if script.startswith("window.open"):
+                handle = f"tab-{len(self.polls)}"
+                self.tabs[handle] = args[0]
+                self.polls[handle] = 0
+                self.max_open = max(self.max_open, len(self.tabs) - 1)
+                return None
+            handle = self.current_window_handle
+            self.polls[handle] += 1
+            return "complete" if self.polls[handle] >= 2 else "loading"
+
+        def close(self) -> None:
+            del self.tabs[self.current_window_handle]
+
+        def quit(self) -> None:
+            self.quit_called = True
+
+    fake_driver = FakeDriver()
+    monkeypatch.setattr(PluginBoutiqueSeleniumScraper, "_build_driver", lambda self: fake_driver)
+
+    scraper = PluginBoutiqueSeleniumScraper()
+    results = scraper.get_prices_in_tabs(list(pages), max_tabs=2, poll_interval_seconds=0)
+
+    assert results[0] == PriceResult(amount=10.0, currency="$")
+    assert results[0].fetch_tier == "selenium_tab"
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] == PriceResult(amount=30.0, currency="€")
+    assert fake_driver.max_open == 2
+    assert fake_driver.window_handles == ["home"]
+    assert fake_driver.quit_called is True
+
+    # Pooled drivers count every tab towards their page budget and recycle mid-batch.
+    built: list[FakeDriver] = []
+
+    def build_driver(self) -> FakeDriver:
+        built.append(FakeDriver())
+        return built[-1]
+
+    monkeypatch.setattr(PluginBoutiqueSeleniumScraper, "_build_driver", build_driver)
+    pooled = PluginBoutiqueSeleniumScraper(driver_pool_size=1, max_pages_per_driver=2)
+    results = pooled.get_prices_in_tabs(list(pages), max_tabs=2, poll_interval_seconds=0)
+
+    assert results[0] == PriceResult(amount=10.0, currency="$")
+    assert results[2] == PriceResult(amount=30.0, currency="€")
+    assert len(built) == 2
+    assert built[0].quit_called is True
+    assert pooled.driver_pool.recycle_stats["pages"] == 1
+
+    # A driver crash fails only the slice it was loading; later slices lease a fresh driver.
+    class CrashingDriver(FakeDriver):
+        def execute_script(self, script: str, *args):
+            raise WebDriverException("chrome not reachable")
+
+    built.clear()
+
+    def build_crashing_first(self) -> FakeDriver:
+        built.append(CrashingDriver() if not built else FakeDriver())
+        return built[-1]
+
+    monkeypatch.setattr(PluginBoutiqueSeleniumScraper, "_build_driver", build_crashing_first)
+    crashing = PluginBoutiqueSeleniumScraper(driver_pool_size=1, max_pages_per_driver=1)
+    results = crashing.get_prices_in_tabs(list(pages), max_tabs=2, poll_interval_seconds=0)
+
+    assert isinstance(results[0], WebDriverException)
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] == PriceResult(amount=30.0, currency="€")
+    assert built[0].quit_called is True
+
+
+def test_get_prices_in_tabs_blocks_urls_in_each_tab_before_it_navigates(monkeypatch) -> None:
+    html = "<button>Add to Cart</button><span>$10.00</span>"
+
+    class FakeSwitchTo:
+        def __init__(self, driver) -> None:
+            self.driver = driver
+
+        def window(self, handle: str) -> None:
+            self.driver.current_window_handle = handle
+
+    class FakeDriver:
+        def __init__(self) -> None:
+            self.current_window_handle = "home"
+            self.tabs = {"home": "about:blank"}
+            self.blocked: dict[str, list[str]] = {}
+            self.blocked_when_loaded: dict[str, bool] = {}
+            self.switch_to = FakeSwitchTo(self)
+
+        @property
+        def window_handles(self) -> list[str]:
+            return list(self.tabs)
+
+        @property
+        def page_source(self) -> str:
+            return html
+
+        def execute_cdp_cmd(self, cmd: str, params: dict) -> dict:
+            if cmd == "Network.setBlockedURLs":
+                self.blocked[self.current_window_handle] = params["urls"]
+            return {}
+
+        def execute_script(self, script: str, *args):
+            if script.startswith("window.open"):
+                self.tabs[f"tab-{len(self.tabs)}"] = args[0]
+                return None
+            if script.startswith("window.location"):
+                self.tabs[self.current_window_handle] = args[0]
+                self.blocked_when_loaded[args[0]] = self.current_window_handle in self.blocked
+                return None
+            return "complete"
+
+        def close(self) -> None:
+            del self.tabs[self.current_window_handle]
+
+        def quit(self) -> None:
+            pass
+
+    fake_driver = FakeDriver()
+    monkeypatch.setattr(PluginBoutiqueSeleniumScraper, "_build_driver", lambda self: fake_driver)
+    scraper = PluginBoutiqueSeleniumScraper(block_resources=True, blocked_url_patterns=["*.png"])
+
+    urls = ["https://example.com/a", "https://example.com/b"]
+    results = scraper.get_prices_in_tabs(urls, max_tabs=2, poll_interval_seconds=0)
+
+    assert results == [PriceResult(amount=10.0, currency="$")] * 2
+    assert fake_driver.blocked_when_loaded == {url: True for url in urls}
+    assert fake_driver.blocked == {"tab-1": ["*.png"], "tab-2": ["*.png"]}
+
+
+def test_get_price_eager_mode_waits_for_purchase_info(monkeypatch) -> None:
+    import plugin_boutique_price_checker.selenium_scraper as scraper_module
+
+    class FakeDriver:
+        page_source = "<button>Add to Cart</button><span>$18.00</span>"
+
+        def __init__(self) -> None:
+            self.scripts = []
+
+        def get(self, _url: str) -> None:
+            return None
+
+        def execute_script(self, script: str) -> bool:
+            self.scripts.append(script)
+            return True
+
+        def quit(self) -> None:
+            return None
+
+    captured = {}
+
+    class FakeWait:
+        def __init__(self, driver, timeout_seconds: int, poll_frequency: float) -> None:
+            self.driver = driver
+            captured["poll_frequency"] = poll_frequency
+
+        def until(self, condition) -> bool:
+            captured["condition"] = condition
+            return condition(self.driver)
+
+    fake_driver = FakeDriver()
+    monkeypatch.setattr(PluginBoutiqueSeleniumScraper, "_build_driver", lambda self: fake_driver)
+    monkeypatch.setattr(scraper_module, "WebDriverWait", FakeWait)
+
+    scraper = PluginBoutiqueSeleniumScraper(eager_page_load=True, poll_interval_seconds=0.1)
+    result = scraper.get_price("https://example.com/product")
+
+    assert result == PriceResult(amount=18.0, currency="$")
+    assert result.fetch_tier == "selenium_eager"
+    assert captured["poll_frequency"] == 0.1
+    assert isinstance(captured["condition"], scraper_module.purchase_info_present)
+    assert "add to cart" in fake_driver.scripts[0]
+    # JSON-LD-only and price-less pages must not run into the timeout.
+    assert 'script[type="application/ld+json"]' in fake_driver.scripts[0]
+    assert "document.readyState === 'complete'" in fake_driver.scripts[0]
@@ -0,0 +1,214 @@
+"""Tests for the background worker cycle."""
+
+from __future__ import annotations
+
+from collections import Counter
+import threading
+import time
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from plugin_boutique_price_checker.models import PriceResult
+
+
+@pytest.fixture
+def worker_env(web_env):
+    """Reload web modules against a temp SQLite DB and return the worker module."""
+    web = web_env(
+        "worker",
+        [
+            "https://shop.example/broken" if index == 0 else f"https://shop.example/p{index}" for index in range(8)
+        ],
+        inactive_url="https://shop.example/off",
+        env={"WORKER_CONCURRENCY": "4", "WORKER_WRITE_BATCH_SIZE": "3"},
+    )
+    return web.worker, web.database, web.orm, web.results
+
+
+class SlowFakeScraper:
+    built: list["SlowFakeScraper"] = []
+
+    def __init__(self) -> None:
+        self.cache_stats: Counter[str] = Counter()
+        self.fetch_stats: Counter[str] = Counter()
+        self.driver_pool = None
+        self.threads: set[str] = set()
+        self.closed = False
+        SlowFakeScraper.built.append(self)
+
+    def get_price(self, url: str) -> PriceResult:
+        self.threads.add(threading.current_thread().name)
+        time.sleep(0.1)
+        if url.endswith("broken"):
+            raise RuntimeError("No currency-like prices found in page source")
+        return PriceResult(amount=25.0, currency="$", fetch_tier="http")
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_run_once_spreads_items_over_thread_pool(worker_env, monkeypatch, capsys) -> None:
+    worker_module, database_module, orm_models_module, _ = worker_env
+    SlowFakeScraper.built = []
+    monkeypatch.setattr(worker_module, "build_cycle_scraper", lambda settings: SlowFakeScraper())
+
+    started = time.perf_counter()
+    processed = worker_module.run_once()
+    elapsed = time.perf_counter() - started
+
+    assert processed == 8
+    # Eight 100 ms checks on four threads take about two rounds, not eight.
+    assert elapsed < 0.6
+    assert 1 < len(SlowFakeScraper.built) <= 4
+    assert all(scraper.closed for scraper in SlowFakeScraper.built)
+    assert all(len(scraper.threads) == 1 for scraper in SlowFakeScraper.built)
+    assert "Cycle: 8 processed, 1 errors" in capsys.readouterr().out
+
+    db = database_module.SessionLocal()
+    try:
+        statuses = Counter(run.status for run in db.query(orm_models_module.PriceCheckRun).all())
+    finally:
+        db.close()
+    assert statuses == {"success": 7, "error": 1}
+
+
+def test_second_worker_skips_items_that_are_not_due_yet(worker_env, monkeypatch) -> None:
+    worker_module, database_module, orm_models_module, _ = worker_env
+    monkeypatch.setattr(worker_module, "build_cycle_scraper", lambda settings: SlowFakeScraper())
+
+    monkeypatch.setenv("WORKER_ID", "worker-a")
+    assert worker_module.run_once() == 8
+    monkeypatch.setenv("WORKER_ID", "worker-b")
+    assert worker_module.run_once() == 0
+
+    db = database_module.SessionLocal()
+    try:
+        items = db.query(orm_models_module.WatchlistItem).filter_by(is_active=True).all()
+        run_count = db.query(orm_models_module.PriceCheckRun).count()
+    finally:
+        db.close()
+    assert run_count == 8
+    assert all(item.lease_owner is None and item.next_check_at is not None for item in items)
+
+
+def test_run_once_writes_results_in_batches(worker_env, monkeypatch) -> None:
+    worker_module, database_module, orm_models_module, results_module = worker_env
+    monkeypatch.setattr(worker_module, "build_cycle_scraper", lambda settings: SlowFakeScraper())
+    batch_sizes: list[int] = []
+    write_outcomes = results_module.write_outcomes
+
+    def recording_write_outcomes(db, batch, *args) -> None:
+        batch_sizes.append(len(batch))
+        write_outcomes(db, batch, *args)
+
+    monkeypatch.setattr(results_module, "write_outcomes", recording_write_outcomes)
+
+    assert worker_module.run_once() == 8
+    assert batch_sizes == [3, 3, 2]
+
+    db = database_module.SessionLocal()
+    try:
+        items = db.query(orm_models_module.WatchlistItem).filter_by(is_active=True).all()
+    finally:
+        db.close()
+    assert sum(item.last_price == 25.0 for item in items) == 7
+    assert all(item.lease_owner is None and item.next_check_at is not None for item in items)
+
+
+def test_result_batcher_flushes_stale_results(worker_env, monkeypatch) -> None:
+    _, _, _, results_module = worker_env
+    monkeypatch.setenv("WORKER_WRITE_FLUSH_SECONDS", "0")
+    import plugin_boutique_price_checker.web.settings as settings_module
+
+    written: list[int] = []
+    monkeypatch.setattr(results_module, "write_outcomes", lambda db, batch, *args: written.append(len(batch)))
+    batcher = results_module.ResultBatcher("worker-a", settings_module.load_settings())
+    check = results_module.QueuedCheck(
+        item_id=1,
+        product_url="https://shop.example/p1",
+        threshold=1.0,
+        user_email="worker@example.com",
+        last_alert_sent=False,
+        check_interval_seconds=None,
+    )
+
+    batcher.add(results_module.error_outcome(check, RuntimeError("boom"), fetch_ms=5))
+    assert written == [1]
+    assert batcher.seconds_until_stale() is None
+    batcher.flush()
+    assert written == [1]
+
+
+def test_result_batcher_drops_deleted_items_and_releases_the_rest(worker_env, monkeypatch) -> None:
+    _, database_module, orm_models_module, results_module = worker_env
+    import plugin_boutique_price_checker.web.leases as leases_module
+    import plugin_boutique_price_checker.web.settings as settings_module
+
+    db = database_module.SessionLocal()
+    try:
+        claimed = leases_module.claim_items(db, "worker-a", 2, lease_seconds=60)
+        checks = results_module.queued_checks(db.execute(results_module.queued_checks_statement(claimed)).all())
+        db.delete(db.get(orm_models_module.WatchlistItem, claimed[1]))
+        db.commit()
+    finally:
+        db.close()
+
+    # The first attempt races a delete; the retry still writes the surviving item.
+    write_outcomes = results_module.write_outcomes
+    attempts: list[int] = []
+
+    def racing_write_outcomes(db, batch, *args) -> None:
+        attempts.append(len(batch))
+        if len(attempts) == 1:
+            raise IntegrityError("INSERT", {}, Exception("foreign key violation"))
+        write_outcomes(db, batch, *args)
+
+    monkeypatch.setattr(results_module, "write_outcomes", racing_write_outcomes)
+    batcher = results_module.ResultBatcher("worker-a", settings_module.load_settings())
+    for check in checks:
+        batcher.add(results_module.success_outcome(check, PriceResult(amount=25.0, currency="$"), 5, False, "ok"))
+    batcher.flush()
+
+    db = database_module.SessionLocal()
+    try:
+        runs = db.query(orm_models_module.PriceCheckRun).all()
+        item = db.get(orm_models_module.WatchlistItem, claimed[0])
+    finally:
+        db.close()
+    assert attempts == [2, 2]
+    assert [run.watchlist_item_id for run in runs] == [claimed[0]]
+    assert item.lease_owner is None
+    assert item.last_price == 25.0
+
+
+def test_queued_check_job_runs_before_the_item_is_due(worker_env, monkeypatch) -> None:
+    worker_module, database_module, orm_models_module, _ = worker_env
+    monkeypatch.setattr(worker_module, "build_cycle_scraper", lambda settings: SlowFakeScraper())
+    assert worker_module.run_once() == 8
+
+    db = database_module.SessionLocal()
+    try:
+        job = orm_models_module.CheckJob(watchlist_item_id=3)
+        db.add(job)
+        db.commit()
+        job_id = job.id
+    finally:
+        db.close()
+
+    assert worker_module.run_once() == 1
+
+    db = database_module.SessionLocal()
+    try:
+        job = db.get(orm_models_module.CheckJob, job_id)
+        latest_run = (
+            db.query(orm_models_module.PriceCheckRun)
+            .filter_by(watchlist_item_id=3)
+            .order_by(orm_models_module.PriceCheckRun.id.desc())
+            .first()
+        )
+    finally:
+        db.close()
+    assert job.status == "finished"
+    assert job.started_at is not None and job.finished_at is not None
+    assert job.price_check_run_id == latest_run.id